@@ -0,0 +1,224 @@
+"""
+asyncio 기반 멀티 테이블 러너
+
+한 프로세스에서 여러 테이블을 코루틴으로 돌린다. 각 테이블은 헤드리스 HoldemGame 을 진행하다가
+AI가 아닌 좌석 차례가 되면 해당 좌석의 ActionSource 를 await 한다.
+입력을 기다리는 테이블은 실행 슬롯을 잡지 않으므로, 대기 중인 테이블은 코루틴 프레임과 게임 상태만 차지한다.
+
+    python -m core.async_table --tables 1000 --hands 20
+"""
+from __future__ import annotations
+
+import abc
+import argparse
+import asyncio
+import random
+import time
+
+from core.game import HoldemGame
+from core.human_action import HumanAction
+
+
+class ActionSource(abc.ABC):
+    """
+    좌석 하나의 행동 공급원 (HumanAction 대체)
+    """
+    @abc.abstractmethod
+    async def get_action(self, player, view):
+        # return: (action, amount), action: "fold" | "check" | "call" | "raise"
+        raise NotImplementedError
+
+
+class AIActionSource(ActionSource):
+    # AI 객체를 비동기 소스로 감싼다 (원격 봇 등과 같은 인터페이스로 쓰고 싶을 때)
+    def __init__(self, ai):
+        self.ai = ai
+
+    async def get_action(self, player, view):
+        return self.ai.decide(player=player, to_call=view.to_call, big_blind=view.big_blind, view=view)
+
+
+class QueueActionSource(ActionSource):
+    # 사람/원격 클라이언트 입력: submit() 으로 넣은 행동을 순서대로 돌려준다
+    def __init__(self):
+        self._queue = asyncio.Queue()
+
+    def submit(self, action, amount=0):
+        self._queue.put_nowait((action, int(amount or 0)))
+
+    async def get_action(self, player, view):
+        return await self._queue.get()
+
+
+class TableMetrics:
+    __slots__ = ("steps", "hands", "decisions", "wait_seconds", "started_at", "finished_at")
+
+    def __init__(self):
+        self.steps = 0
+        self.hands = 0
+        # ActionSource 에서 받아 온 결정 수와 그 대기 시간 합
+        self.decisions = 0
+        self.wait_seconds = 0.0
+        self.started_at = None
+        self.finished_at = None
+
+
+class AsyncTable:
+    """
+    sources: 좌석 이름 -> ActionSource. 여기에 없는 AI 좌석은 엔진 안에서 바로 결정한다.
+    on_update: 스텝 묶음이 끝날 때마다 on_update(table) 호출 (핸드가 끝난 묶음이면 game.hand_over 가 True)
+    """
+    def __init__(self, table_id, game: HoldemGame, sources=None, pacing: bool = False, quantum: int = 64,
+                 on_update=None):
+        self.table_id = table_id
+        self.game = game
+        self.sources = dict(sources or {})
+        # 연출 지연을 asyncio.sleep 으로 적용할지 여부 (끄면 quantum 스텝마다 양보만 한다)
+        self.pacing = pacing
+        self.quantum = quantum
+        self.on_update = on_update
+        self.metrics = TableMetrics()
+        self.waiting = False
+
+        for p in game.players:
+            if p.name in self.sources:
+                # 외부 소스로 결정하는 좌석은 엔진의 HumanAction 경로를 탄다
+                p.ai = None
+            elif p.ai is None:
+                raise ValueError(f"seat {p.name} has no AI and no action source")
+
+    async def run(self, runner=None, hands=None):
+        g = self.game
+        m = self.metrics
+        m.started_at = time.perf_counter()
+        g.start()
+        slot = runner.slot if runner is not None else _NullSlot()
+
+        while not g.game_over and (hands is None or g.hands_played < hands):
+            async with slot:
+                for _ in range(self.quantum):
+                    g.step()
+                    m.steps += 1
+                    if g.waiting_on_human() or g.game_over or g.hand_over:
+                        break
+                if self.on_update is not None:
+                    self.on_update(self)
+                if g.hand_over:
+                    g.hand_over = False
+                    m.hands += 1
+
+            player = g.pending_player()
+            if player is not None:
+                source = self.sources[player.name]
+                view = g.table_view(player)
+                self.waiting = True
+                t0 = time.perf_counter()
+                action, amount = await source.get_action(player, view)
+                m.wait_seconds += time.perf_counter() - t0
+                m.decisions += 1
+                self.waiting = False
+                g.human_action.set(action, amount)
+            elif self.pacing:
+                await asyncio.sleep(g.next_step_delay() / 1000)
+            else:
+                await asyncio.sleep(0)
+
+        m.finished_at = time.perf_counter()
+        return self
+
+
+class _NullSlot:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TableRunner:
+    """
+    max_tables: 호스팅할 수 있는 최대 테이블 수
+    max_active: 동시에 스텝을 진행할 수 있는 테이블 수 (입력 대기 중인 테이블은 세지 않음)
+    """
+    def __init__(self, max_tables: int = 10000, max_active: int = 64):
+        self.max_tables = int(max_tables)
+        self.slot = asyncio.Semaphore(max_active)
+        self.tables: dict = {}
+        self._tasks: dict = {}
+        self.finished = 0
+        # 끝난 테이블의 누적 지표
+        self._done_totals = {"hands": 0, "steps": 0, "decisions": 0}
+
+    def add_table(self, table: AsyncTable, hands=None) -> asyncio.Task:
+        if len(self.tables) >= self.max_tables:
+            raise RuntimeError(f"table limit reached ({self.max_tables})")
+        if table.table_id in self.tables:
+            raise ValueError(f"duplicate table id: {table.table_id}")
+        self.tables[table.table_id] = table
+        task = asyncio.ensure_future(table.run(self, hands=hands))
+        task.add_done_callback(lambda _t, tid=table.table_id: self._on_done(tid))
+        self._tasks[table.table_id] = task
+        return task
+
+    def _on_done(self, table_id):
+        table = self.tables.pop(table_id, None)
+        self._tasks.pop(table_id, None)
+        self.finished += 1
+        if table is not None:
+            self._done_totals["hands"] += table.metrics.hands
+            self._done_totals["steps"] += table.metrics.steps
+            self._done_totals["decisions"] += table.metrics.decisions
+
+    async def join(self):
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()))
+
+    def metrics(self) -> dict:
+        tables = list(self.tables.values())
+        return {
+            "tables": len(tables),
+            "waiting": sum(1 for t in tables if t.waiting),
+            "active": len(tables) - sum(1 for t in tables if t.waiting),
+            "finished": self.finished,
+            "hands": self._done_totals["hands"] + sum(t.metrics.hands for t in tables),
+            "steps": self._done_totals["steps"] + sum(t.metrics.steps for t in tables),
+            "decisions": self._done_totals["decisions"] + sum(t.metrics.decisions for t in tables),
+        }
+
+
+def make_ai_table(table_id, difficulties, start_chips=500, bb=20, seed=None) -> AsyncTable:
+    game = HoldemGame(HumanAction(), verbose=False, rng=random.Random(seed))
+    game.configure(ai_count=len(difficulties), difficulty=list(difficulties),
+                   start_chips=start_chips, bb=bb, human=False)
+    return AsyncTable(table_id, game)
+
+
+async def _demo(args):
+    runner = TableRunner(max_tables=args.tables, max_active=args.active)
+    seats = [s.strip() for s in args.seats.split(",")]
+    t0 = time.perf_counter()
+    done = []
+    for i in range(args.tables):
+        table = make_ai_table(i, seats, seed=args.seed * 1000003 + i)
+        task = runner.add_table(table, hands=args.hands)
+        task.add_done_callback(lambda t: done.append(t.result()))
+    await runner.join()
+    elapsed = time.perf_counter() - t0
+    hands = sum(t.metrics.hands for t in done)
+    steps = sum(t.metrics.steps for t in done)
+    print(f"tables: {len(done)}  hands: {hands}  steps: {steps}  time: {elapsed:.2f}s  "
+          f"hands/sec: {hands / elapsed:,.0f}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run many AI tables in one asyncio loop")
+    ap.add_argument("--tables", type=int, default=1000)
+    ap.add_argument("--hands", type=int, default=10, help="hands per table")
+    ap.add_argument("--active", type=int, default=64, help="max tables stepping at once")
+    ap.add_argument("--seats", default="hard,normal,easy")
+    ap.add_argument("--seed", type=int, default=0)
+    asyncio.run(_demo(ap.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+평가기 / 엔진 벤치마크
+
+고정 시드로 만든 카드 묶음을 각 대상 함수에 돌려서 초당 연산 수와 메모리 할당량을 잰다.
+결과를 JSON 기준선으로 저장해 두고, 변경 후 다시 돌려서 threshold 이상 느려지거나
+할당이 늘어난 항목을 회귀로 표시한다 (회귀가 있으면 종료 코드 1).
+
+    python -m core.bench                          # 측정만
+    python -m core.bench --save bench_baseline.json
+    python -m core.bench --compare bench_baseline.json --threshold 0.10
+
+ops/sec 는 rounds 번 반복 중 가장 빠른 회차 기준 (다른 프로세스 간섭을 덜 받는다).
+할당은 tracemalloc 으로 별도 1회 실행해서 잰다 (추적 중에는 느려지므로 시간 측정과 분리).
+    alloc_bytes: 한 회차 동안 새로 할당된 메모리 최고치 (peak - 시작 시점)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from core.card import FULL_DECK
+from core.hand_evaluator import check_straight, evaluate_5cards, evaluate_7cards, evaluate_many
+from core.pot import Pot
+from core.simulate import Simulator
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "bench_baseline.json")
+
+
+def _hands(rng, n, size):
+    return [rng.sample(FULL_DECK, size) for _ in range(n)]
+
+
+def bench_evaluate_5cards(rng, n):
+    hands = _hands(rng, n, 5)
+
+    def run():
+        for h in hands:
+            evaluate_5cards(h)
+    return run, n
+
+
+def bench_evaluate_7cards(rng, n):
+    hands = _hands(rng, n, 7)
+    evaluate_7cards(hands[0])
+
+    def run():
+        for h in hands:
+            evaluate_7cards(h)
+    return run, n
+
+
+def bench_evaluate_many(rng, n):
+    # 보드 하나에 홀카드 1,081 쌍 전부 (레인지 계산과 같은 형태)
+    boards = []
+    for _ in range(max(1, n // 1081)):
+        board = rng.sample(FULL_DECK, 5)
+        rest = [c for c in FULL_DECK if c not in board]
+        boards.append((board, [(a, b) for i, a in enumerate(rest) for b in rest[i + 1:]]))
+
+    def run():
+        for board, holes in boards:
+            evaluate_many(board, holes)
+    return run, len(boards) * 1081
+
+
+def bench_check_straight(rng, n):
+    ranks = [[c.rank for c in h] for h in _hands(rng, n, 7)]
+
+    def run():
+        for r in ranks:
+            check_straight(r)
+    return run, n
+
+
+def bench_build_pots(rng, n):
+    # 스택이 제각각인 3~6명이 올인/콜 하는 팟 (사이드팟 여러 층)
+    class Seat:
+        __slots__ = ()
+
+    seats = [Seat() for _ in range(6)]
+    tables = []
+    for _ in range(n // 10):
+        k = rng.randint(3, 6)
+        tables.append([(seats[i], rng.randint(1, 50) * 10) for i in range(k)])
+    pot = Pot()
+
+    def run():
+        for bets in tables:
+            pot.reset()
+            for p, amount in bets:
+                pot.add_bet(p, amount)
+            pot.build_pots()
+    return run, len(tables)
+
+
+def bench_headless_hand(rng, n):
+    # 프리플랍부터 쇼다운까지 한 핸드 (AI 3명, 매 회차 같은 시드)
+    seed = rng.getrandbits(32)
+    hands = max(1, n // 100)
+    sim = Simulator(["hard", "normal", "easy"], seed=seed)
+
+    def run():
+        sim.rng.seed(seed)
+        sim.play_hands(hands)
+    return run, hands
+
+
+BENCHMARKS = {
+    "evaluate_5cards": bench_evaluate_5cards,
+    "evaluate_7cards": bench_evaluate_7cards,
+    "evaluate_many": bench_evaluate_many,
+    "check_straight": bench_check_straight,
+    "Pot.build_pots": bench_build_pots,
+    "headless_hand": bench_headless_hand,
+}
+
+
+def measure(name, seed: int = 1234, n: int = 20000, rounds: int = 5, min_time: float = 0.2) -> dict:
+    setup = BENCHMARKS[name]
+    run, ops = setup(random.Random(f"{seed}:{name}"), n)
+    t0 = time.perf_counter()
+    run()  # 워밍업 (테이블 생성, 임포트 등)
+    # 한 회차가 min_time 이상 걸리도록 반복 횟수를 정한다 (짧은 회차는 타이머 잡음이 크다)
+    loops = max(1, math.ceil(min_time / max(time.perf_counter() - t0, 1e-6)))
+
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, (time.perf_counter() - t0) / loops)
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "ops": ops,
+        "ops_per_sec": ops / best if best > 0 else 0.0,
+        "alloc_bytes": max(0, peak - base),
+    }
+
+
+def run_all(names=None, seed: int = 1234, n: int = 20000, rounds: int = 5) -> dict:
+    results = {name: measure(name, seed, n, rounds) for name in (names or BENCHMARKS)}
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(terse=True),
+            "seed": seed,
+            "n": n,
+            "rounds": rounds,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10, alloc_threshold: float = 0.25):
+    """
+    반환: (항목별 비교 행 목록, 회귀 항목 이름 목록)
+    ops/sec 가 threshold 넘게 떨어지거나 alloc_bytes 가 alloc_threshold 넘게 늘면 회귀.
+    """
+    rows = []
+    regressions = []
+    for name, cur in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append((name, None, cur["ops_per_sec"], None, None, "new"))
+            continue
+        speed = cur["ops_per_sec"] / base["ops_per_sec"] - 1 if base["ops_per_sec"] else 0.0
+        alloc = (cur["alloc_bytes"] / base["alloc_bytes"] - 1) if base["alloc_bytes"] else 0.0
+        status = "ok"
+        if speed < -threshold:
+            status = "SLOWER"
+        elif alloc > alloc_threshold:
+            status = "MORE ALLOC"
+        if status != "ok":
+            regressions.append(name)
+        rows.append((name, base["ops_per_sec"], cur["ops_per_sec"], speed, alloc, status))
+    return rows, regressions
+
+
+def format_results(data: dict) -> str:
+    lines = [f"{'benchmark':<18}{'ops':>8}{'ops/sec':>14}{'alloc KiB':>12}"]
+    for name, r in data["results"].items():
+        lines.append(f"{name:<18}{r['ops']:>8}{r['ops_per_sec']:>14,.0f}{r['alloc_bytes'] / 1024:>12.1f}")
+    return "\n".join(lines)
+
+
+def format_compare(rows) -> str:
+    lines = [f"{'benchmark':<18}{'baseline':>14}{'current':>14}{'speed':>9}{'alloc':>9}  status"]
+    for name, base, cur, speed, alloc, status in rows:
+        if base is None:
+            lines.append(f"{name:<18}{'-':>14}{cur:>14,.0f}{'-':>9}{'-':>9}  {status}")
+            continue
+        lines.append(f"{name:<18}{base:>14,.0f}{cur:>14,.0f}{speed * 100:>+8.1f}%{alloc * 100:>+8.1f}%  {status}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the hand evaluator and engine")
+    ap.add_argument("--only", default=None, help="comma separated benchmark names")
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("-n", type=int, default=20000, help="card sets per benchmark")
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, default=None, metavar="PATH",
+                    help="write results as the new baseline")
+    ap.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, default=None, metavar="PATH",
+                    help="compare against a saved baseline, exit 1 on regression")
+    ap.add_argument("--threshold", type=float, default=0.10, help="allowed ops/sec drop (0.10 = 10%%)")
+    ap.add_argument("--alloc-threshold", type=float, default=0.25, help="allowed allocation growth")
+    args = ap.parse_args(argv)
+
+    names = None
+    if args.only:
+        names = [s.strip() for s in args.only.split(",") if s.strip()]
+        for s in names:
+            if s not in BENCHMARKS:
+                ap.error(f"unknown benchmark: {s} (choose from {', '.join(BENCHMARKS)})")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        # 기준선과 같은 조건으로 측정해야 비교가 의미 있다
+        meta = baseline["meta"]
+        args.seed, args.n = meta["seed"], meta["n"]
+
+    data = run_all(names, seed=args.seed, n=args.n, rounds=args.rounds)
+    print(format_results(data))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        print(f"baseline saved to {args.save}")
+
+    if baseline is not None:
+        rows, regressions = compare(baseline, data, args.threshold, args.alloc_threshold)
+        print()
+        print(format_compare(rows))
+        if regressions:
+            print(f"\nregressions: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
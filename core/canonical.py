@@ -0,0 +1,106 @@
+"""
+무늬 동형(suit-isomorphic) 정규화와 결과 캐시
+
+무늬만 바꾼 보드/핸드는 족보, 에퀴티가 모두 같다 (플랍 22,100 개 중 서로 다른 것은 1,755 개).
+무늬별 13비트 랭크 마스크를 정렬한 튜플을 키로 쓰면 무늬 순열에 상관없이 같은 키가 나온다.
+
+    canonical_board(board)        보드만 (무늬 마스크 4개를 정렬)
+    canonical_hand(hole, board)   홀카드와 보드를 함께 ((보드, 홀) 마스크 쌍 4개를 정렬)
+
+LRUCache 는 크기가 정해진 캐시로, 에퀴티 엔진과 AI 가 계산 전에 먼저 찾아본다.
+7장 평가 자체는 룩업 테이블이라 정규 키를 만드는 것보다 빠르므로 캐시하지 않는다.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from core.card import SUITS, Card
+
+
+def suit_masks(cards):
+    # 카드 -> 무늬별 13비트 랭크 마스크 4개 (리스트)
+    masks = [0, 0, 0, 0]
+    for c in cards:
+        masks[c.bit >> 4] |= 1 << (c.rank - 2)
+    return masks
+
+
+def canonical_board(board) -> tuple:
+    return tuple(sorted(suit_masks(board), reverse=True))
+
+
+def suit_permutation(board) -> list[int]:
+    """
+    원래 무늬 인덱스 -> 정규 무늬 인덱스. 이 순열로 무늬를 바꾼 보드의 suit_masks 는
+    canonical_board(board) 와 같은 순서가 된다.
+    """
+    masks = suit_masks(board)
+    perm = [0, 0, 0, 0]
+    for k, s in enumerate(sorted(range(4), key=masks.__getitem__, reverse=True)):
+        perm[s] = k
+    return perm
+
+
+def canonical_hand(hole_cards, board=()) -> tuple:
+    # 같은 무늬 순열을 홀카드와 보드에 동시에 적용해야 하므로 무늬별 (보드, 홀) 쌍으로 정렬한다
+    b = suit_masks(board)
+    h = suit_masks(hole_cards)
+    return tuple(sorted(zip(b, h), reverse=True))
+
+
+def canonicalize(hole_cards, board=()):
+    """
+    같은 정규 키를 갖는 대표 카드 (hole, board): 키 순서대로 무늬를 S, H, D, C 로 다시 붙인다.
+    """
+    hole, out_board = [], []
+    for suit, (bm, hm) in zip(SUITS, canonical_hand(hole_cards, board)):
+        for mask, out in ((bm, out_board), (hm, hole)):
+            for i in range(12, -1, -1):
+                if mask >> i & 1:
+                    out.append(Card(i + 2, suit))
+    return hole, out_board
+
+
+class LRUCache:
+    """
+    최근에 쓴 maxsize 개만 남기는 캐시. get 이 None 을 돌려주면 미스.
+    """
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def hit_rate(self) -> float:
+        n = self.hits + self.misses
+        return self.hits / n if n else 0.0
+
+    def __repr__(self):
+        return f"LRUCache({len(self.data)}/{self.maxsize}, hit rate {self.hit_rate * 100:.1f}%)"
+
+
+# 프로세스 전역 캐시 (병렬 러너에서는 워커마다 따로)
+EQUITY_CACHE = LRUCache(200_000)
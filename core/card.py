@@ -1,10 +1,100 @@
+SUITS = ('S', 'H', 'D', 'C')
+RANKS = tuple(range(2, 15))
+
+# Cactus-Kev 방식 랭크 소수 (2~A)
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+_RANK_CHARS = {11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
+
+
 class Card:
-    def __init__(self, rank, suit):
+    """
+    불변 카드. 52장 각각 하나의 인스턴스만 존재한다 (Card(14, 'S') is Card(14, 'S')).
+
+    id:   0~51 (suit_index * 13 + rank - 2)
+    prime: 랭크 소수
+    bit:  64비트 마스크에서의 비트 위치 (suit_index * 16 + rank - 2)
+          무늬마다 16비트씩 배치해서 (mask >> 16 * s) & 0x1FFF 가 해당 무늬 랭크 마스크가 된다.
+    mask: 1 << bit
+    """
+    __slots__ = ('rank', 'suit', 'id', 'prime', 'bit', 'mask')
+
+    _interned = {}
+
+    def __new__(cls, rank, suit):
         # rank: 2~14, suit: 'S' | 'H' | 'D' | 'C'
-        self.rank = rank
-        self.suit = suit
+        card = cls._interned.get((rank, suit))
+        if card is not None:
+            return card
+        if rank not in RANKS or suit not in SUITS:
+            raise ValueError(f"invalid card: {rank}{suit}")
+
+        card = object.__new__(cls)
+        s = SUITS.index(suit)
+        set_attr = object.__setattr__
+        set_attr(card, 'rank', rank)
+        set_attr(card, 'suit', suit)
+        set_attr(card, 'id', s * 13 + rank - 2)
+        set_attr(card, 'prime', PRIMES[rank - 2])
+        set_attr(card, 'bit', s * 16 + rank - 2)
+        set_attr(card, 'mask', 1 << (s * 16 + rank - 2))
+        cls._interned[(rank, suit)] = card
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        # 피클/멀티프로세스 전달 후에도 같은 싱글턴으로 복원
+        return (Card, (self.rank, self.suit))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
-        rank_map = {11: 'J', 12: 'Q', 13: 'K', 14: 'A'}
-        r = rank_map.get(self.rank, str(self.rank))
+        r = _RANK_CHARS.get(self.rank, str(self.rank))
         return f"{r}{self.suit}"
+
+    @staticmethod
+    def from_id(card_id):
+        return FULL_DECK[card_id]
+
+    @staticmethod
+    def from_bit(bit):
+        return _BY_BIT[bit]
+
+    @staticmethod
+    def parse(text):
+        # "AS", "10h", "Td" -> Card
+        text = text.strip().upper()
+        r, s = text[:-1], text[-1]
+        rank = {'A': 14, 'K': 13, 'Q': 12, 'J': 11, 'T': 10}.get(r)
+        if rank is None:
+            rank = int(r)
+        return Card(rank, s)
+
+
+FULL_DECK = tuple(Card(rank, suit) for suit in SUITS for rank in RANKS)
+_BY_BIT = {c.bit: c for c in FULL_DECK}
+
+
+def cards_to_mask(cards):
+    mask = 0
+    for c in cards:
+        mask |= c.mask
+    return mask
+
+
+def mask_to_cards(mask):
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(_BY_BIT[low.bit_length() - 1])
+        mask ^= low
+    return cards
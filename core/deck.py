@@ -1,20 +1,19 @@
 import random
-from core.card import Card
+from core.card import FULL_DECK
 
 class Deck:
-    def __init__(self):
+    def __init__(self, rng=None):
+        # rng: random.Random 인스턴스 (없으면 전역 random 모듈)
+        self.rng = rng or random
         self.cards = []
         self.reset()
 
     def reset(self):
-        self.cards = [
-            Card(rank, suit)
-            for suit in ['S', 'H', 'D', 'C']
-            for rank in range(2, 15)
-        ]
+        # 카드는 싱글턴이므로 매 핸드 새로 만들지 않고 리스트만 복사
+        self.cards = list(FULL_DECK)
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def draw(self):
         return self.cards.pop()
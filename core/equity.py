@@ -0,0 +1,249 @@
+"""
+핸드 에퀴티 계산
+
+monte_carlo_equity: 남은 덱에서 상대 홀카드와 보드를 샘플링해 승/무/패 확률을 추정한다.
+신뢰구간 폭이 target_width 아래로 내려가거나 time_budget 이 다 되면 멈춘다.
+exact_equity: 가능한 런아웃(과 상대 핸드)을 전부 나열해서 NumPy로 한 번에 평가한다.
+equity: 보드가 깔린 헤즈업이면 exact, 아니면 monte carlo.
+"""
+from __future__ import annotations
+
+import math
+import random
+import time
+
+import numpy as np
+
+from core.canonical import EQUITY_CACHE, canonical_hand
+from core.card import FULL_DECK, cards_to_mask
+from core.hand_evaluator import evaluate_7cards
+from core.vector_eval import card_masks, combo_masks, evaluate_masks
+
+# exact_equity 가 한 번에 평가할 최대 (상대 핸드 x 런아웃) 수
+EXACT_MAX_EVALS = 5_000_000
+
+# 양측 신뢰수준 -> z 값
+_Z = {0.90: 1.6449, 0.95: 1.9600, 0.99: 2.5758}
+
+
+class EquityResult:
+    def __init__(self, win, tie, lose, equity, samples, stderr, elapsed, exact=False):
+        self.win = win
+        self.tie = tie
+        self.lose = lose
+        # 무승부 지분까지 포함한 기대 팟 지분
+        self.equity = equity
+        self.samples = samples
+        self.stderr = stderr
+        self.elapsed = elapsed
+        self.exact = exact
+
+    def ci(self, confidence=0.95):
+        half = _Z.get(confidence, 1.96) * self.stderr
+        return max(0.0, self.equity - half), min(1.0, self.equity + half)
+
+    def __repr__(self):
+        kind = "exact" if self.exact else f"n={self.samples}"
+        return (f"EquityResult(equity={self.equity:.4f}, win={self.win:.4f}, tie={self.tie:.4f}, "
+                f"lose={self.lose:.4f}, {kind})")
+
+
+def _check_cards(hole_cards, board):
+    hole_cards = list(hole_cards)
+    board = list(board)
+    if len(hole_cards) != 2:
+        raise ValueError("hole_cards must have exactly 2 cards")
+    if len(board) not in (0, 3, 4, 5):
+        raise ValueError("board must have 0, 3, 4 or 5 cards")
+    known = hole_cards + board
+    if len(set(known)) != len(known):
+        raise ValueError("duplicate cards")
+    return hole_cards, board
+
+
+def monte_carlo_equity(hole_cards, board=(), opponents=1, target_width=0.01, confidence=0.95,
+                       min_samples=500, max_samples=200000, time_budget=None, rng=None, batch=250):
+    """
+    hole_cards: 내 홀카드 2장
+    board: 공개된 커뮤니티 카드 (0/3/4/5장)
+    opponents: 무작위 핸드를 가진 상대 수
+    target_width: 에퀴티 신뢰구간 전체 폭이 이 값보다 작아지면 중단
+    time_budget: 초 단위 상한 (None이면 무제한)
+    """
+    hole_cards, board = _check_cards(hole_cards, board)
+    opponents = int(opponents)
+    if not 1 <= opponents <= 9:
+        raise ValueError("opponents must be between 1 and 9")
+
+    rng = rng or random
+    z = _Z.get(confidence, 1.96)
+    t0 = time.perf_counter()
+    deadline = None if time_budget is None else t0 + time_budget
+
+    hero_mask = cards_to_mask(hole_cards)
+    board_mask = cards_to_mask(board)
+    dead = hero_mask | board_mask
+    remaining = [c for c in FULL_DECK if not c.mask & dead]
+    need_board = 5 - len(board)
+    need = need_board + 2 * opponents
+    sample = rng.sample
+    evaluate = evaluate_7cards
+
+    wins = ties = 0
+    total = 0.0
+    total_sq = 0.0
+    n = 0
+    stderr = 0.0
+
+    while n < max_samples:
+        count = min(batch, max_samples - n)
+        for _ in range(count):
+            drawn = sample(remaining, need)
+            full_board = board_mask
+            for c in drawn[:need_board]:
+                full_board |= c.mask
+            hero = evaluate(hero_mask | full_board)
+
+            best_opp = None
+            tied = 0
+            for i in range(need_board, need, 2):
+                s = evaluate(full_board | drawn[i].mask | drawn[i + 1].mask)
+                if best_opp is None or s > best_opp:
+                    best_opp = s
+                    tied = 1 if s == hero else 0
+                elif s == hero:
+                    tied += 1
+
+            if hero > best_opp:
+                wins += 1
+                share = 1.0
+            elif hero == best_opp:
+                ties += 1
+                share = 1.0 / (tied + 1)
+            else:
+                share = 0.0
+            total += share
+            total_sq += share * share
+        n += count
+
+        mean = total / n
+        var = max(0.0, total_sq / n - mean * mean)
+        stderr = math.sqrt(var / n)
+        if n >= min_samples and 2 * z * stderr < target_width:
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+    lose = n - wins - ties
+    return EquityResult(
+        win=wins / n,
+        tie=ties / n,
+        lose=lose / n,
+        equity=total / n,
+        samples=n,
+        stderr=stderr,
+        elapsed=time.perf_counter() - t0,
+    )
+
+
+def _shares(hero, opp):
+    """
+    hero: (R,) 점수, opp: (V, R) 상대 점수
+    return: (win, tie, share) 각 (R,) 배열
+    """
+    best = opp.max(axis=0)
+    tied = (opp == hero).sum(axis=0)
+    win = hero > best
+    tie = hero == best
+    share = np.where(win, 1.0, np.where(tie, 1.0 / (tied + 1), 0.0))
+    return win, tie, share
+
+
+def exact_equity(hole_cards, board=(), villains=None):
+    """
+    모든 런아웃을 나열해서 정확한 에퀴티를 계산한다.
+
+    villains: 상대 홀카드 2장 목록들 (알려진 핸드). None이면 무작위 핸드 1명을 상대로
+              가능한 모든 상대 핸드 x 런아웃을 나열한다.
+    무작위 상대 결과는 무늬 정규화 키로 EQUITY_CACHE 에 남겨 두고 같은 상황이면 다시 계산하지 않는다.
+    """
+    hole_cards, board = _check_cards(hole_cards, board)
+    t0 = time.perf_counter()
+    key = None
+    if villains is None:
+        key = ("exact", canonical_hand(hole_cards, board))
+        hit = EQUITY_CACHE.get(key)
+        if hit is not None:
+            return EquityResult(hit.win, hit.tie, hit.lose, hit.equity, hit.samples, 0.0,
+                                time.perf_counter() - t0, exact=True)
+
+    hero_mask = cards_to_mask(hole_cards)
+    board_mask = cards_to_mask(board)
+    dead = hero_mask | board_mask
+    need_board = 5 - len(board)
+
+    if villains is not None:
+        villain_masks = [cards_to_mask(v) for v in villains]
+        for v, vm in zip(villains, villain_masks):
+            if len(v) != 2 or vm.bit_count() != 2 or vm & dead:
+                raise ValueError("villain hands must be 2 unused cards each")
+            dead |= vm
+        if not villain_masks:
+            raise ValueError("need at least one villain")
+        if sum(villain_masks).bit_count() != 2 * len(villain_masks):
+            raise ValueError("villain hands overlap")
+
+        remaining = card_masks([c for c in FULL_DECK if not c.mask & dead])
+        runouts = combo_masks(remaining, need_board) | board_mask
+        if len(runouts) * (len(villain_masks) + 1) > EXACT_MAX_EVALS:
+            raise ValueError("too many runouts for exact enumeration; use monte_carlo_equity")
+
+        hero = evaluate_masks(runouts | hero_mask)
+        opp = evaluate_masks(runouts[None, :] | np.array(villain_masks, dtype=np.int64)[:, None])
+        win, tie, share = _shares(hero, opp)
+        n = len(runouts)
+        wins, ties, total = int(win.sum()), int(tie.sum()), float(share.sum())
+    else:
+        remaining = card_masks([c for c in FULL_DECK if not c.mask & dead])
+        villain_combos = combo_masks(remaining, 2)
+        runouts = combo_masks(remaining, need_board)
+        if len(villain_combos) * len(runouts) > EXACT_MAX_EVALS:
+            raise ValueError("too many runouts for exact enumeration; use monte_carlo_equity")
+
+        hero = evaluate_masks(runouts | board_mask | hero_mask)
+        # 상대 핸드 x 런아웃 행렬, 카드가 겹치는 조합은 제외
+        valid = (villain_combos[:, None] & runouts[None, :]) == 0
+        opp = evaluate_masks(villain_combos[:, None] | runouts[None, :] | board_mask)
+        hero_b = np.broadcast_to(hero, opp.shape)
+        win = (hero_b > opp) & valid
+        tie = (hero_b == opp) & valid
+        n = int(valid.sum())
+        wins, ties = int(win.sum()), int(tie.sum())
+        total = wins + 0.5 * ties
+
+    result = EquityResult(
+        win=wins / n,
+        tie=ties / n,
+        lose=(n - wins - ties) / n,
+        equity=total / n,
+        samples=n,
+        stderr=0.0,
+        elapsed=time.perf_counter() - t0,
+        exact=True,
+    )
+    if key is not None:
+        EQUITY_CACHE.put(key, result)
+    return result
+
+
+def equity(hole_cards, board=(), opponents=1, villains=None, **kwargs):
+    """
+    보드가 3장 이상이고 헤즈업(또는 상대 핸드가 주어진 경우)이면 정확한 계산,
+    그 외에는 monte_carlo_equity (kwargs 전달).
+    """
+    board = list(board)
+    if villains is not None:
+        return exact_equity(hole_cards, board, villains=villains)
+    if opponents == 1 and len(board) >= 3:
+        return exact_equity(hole_cards, board)
+    return monte_carlo_equity(hole_cards, board, opponents=opponents, **kwargs)
@@ -0,0 +1,342 @@
+"""
+핸드 결과 컬럼형 내보내기
+
+HistoryWriter 와 같은 write_hand(events) 인터페이스라서 엔진에 바로 꽂거나 (game.set_history)
+기록된 로그를 다시 읽어서 내보낼 수 있다. chunk_rows 행마다 버퍼를 writer 스레드에 넘기고,
+writer 스레드가 DataFrame 을 만들어 파트 파일 하나를 쓴다 (게임 루프는 디스크를 기다리지 않는다).
+세션 길이와 상관없이 메모리는 청크 몇 개 (모으는 중 1 + 대기 max_pending + 쓰는 중 1) 크기로 제한된다.
+
+행: 핸드 x 카드를 받은 좌석
+    hand seat name label position hole_class hole actions pot net score showdown won vpip pfr
+
+파일 형식: Parquet (requirements.txt 의 pyarrow, 또는 fastparquet). Parquet 엔진이 없는 환경에서만
+NumPy .npz 로 대신 쓴다 (format="auto").
+
+    python -m core.export --log hands.log --out hands_cols/
+    python -m core.export --summary hands_cols/
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.history import Action, Board, Deal, HandEnd, HandStart, Payout, Showdown
+from core.preflop import class_label, hand_class
+
+COLUMNS = ("hand", "seat", "name", "label", "position", "hole_class", "hole", "actions",
+           "pot", "net", "score", "showdown", "won", "vpip", "pfr")
+
+_CATEGORIES = ("name", "label", "position", "hole")
+
+# 딜러 기준 상대 위치 -> 포지션 이름 (인원 수별)
+_POSITIONS = {
+    2: ("BTN", "BB"),
+    3: ("BTN", "SB", "BB"),
+    4: ("BTN", "SB", "BB", "UTG"),
+    5: ("BTN", "SB", "BB", "UTG", "CO"),
+    6: ("BTN", "SB", "BB", "UTG", "MP", "CO"),
+}
+
+_ACTION_CHARS = {"fold": "f", "check": "x", "call": "c", "raise": "r"}
+_STREET_INDEX = {"flop": 1, "turn": 2, "river": 3}
+
+
+def parquet_available() -> bool:
+    for mod in ("pyarrow", "fastparquet"):
+        try:
+            __import__(mod)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def _positions(dealer, seats):
+    # seats: 카드를 받은 좌석 (인덱스 오름차순)
+    n = len(seats)
+    names = _POSITIONS.get(n)
+    start = next((k for k, s in enumerate(seats) if s >= dealer), 0)
+    out = {}
+    for k in range(n):
+        seat = seats[(start + k) % n]
+        out[seat] = names[k] if names else f"P{k}"
+    return out
+
+
+class ColumnarExporter:
+    """
+    out_dir: 파트 파일을 쓸 디렉터리
+    labels: 이름 -> 라벨 (예: AI 난이도), 집계 키로 쓴다
+    format: "auto" | "parquet" | "npz"
+    max_pending: writer 스레드에 넘긴 채 아직 쓰지 못한 청크 수 한도. 디스크가 이만큼 밀려야
+        flush 가 기다린다 (메모리 제한). 쓰기 오류는 다음 write_hand / close 에서 다시 던진다.
+    """
+    def __init__(self, out_dir, labels=None, chunk_rows: int = 200_000, format: str = "auto",
+                 max_pending: int = 2):
+        if format == "auto":
+            format = "parquet" if parquet_available() else "npz"
+        if format == "parquet" and not parquet_available():
+            raise ImportError("Parquet export needs pyarrow or fastparquet (pip install pyarrow); "
+                              "use format='npz' instead")
+        if format not in ("parquet", "npz"):
+            raise ValueError(f"unknown format: {format}")
+        self.out_dir = out_dir
+        self.labels = dict(labels or {})
+        self.chunk_rows = int(chunk_rows)
+        self.format = format
+        os.makedirs(out_dir, exist_ok=True)
+        # 이어 쓰기: 기존 파트 다음 번호부터
+        self.parts = len(glob.glob(os.path.join(out_dir, "part-*")))
+        self.rows_written = 0
+        self.hands = 0
+        self.error = None
+        self._cols = {c: [] for c in COLUMNS}
+        self._queue = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="columnar-writer", daemon=True)
+        self._thread.start()
+
+    def write_hand(self, events):
+        if self._closed:
+            raise ValueError("exporter is closed")
+        if self.error is not None:
+            raise self.error
+        start = events[0]
+        if not isinstance(start, HandStart):
+            return
+        end = None
+        hole = {}
+        acts = {}
+        street = 0
+        vpip = set()
+        pfr = set()
+        pot = 0
+        won = {}
+        scores = {}
+
+        for ev in events:
+            if isinstance(ev, Deal):
+                hole[ev.seat] = ev.cards
+                acts[ev.seat] = [[], [], [], []]
+            elif isinstance(ev, Action):
+                a = acts.get(ev.seat)
+                if a is not None:
+                    a[street].append(_ACTION_CHARS[ev.action] + (str(ev.amount) if ev.action == "raise" else ""))
+                if street == 0 and ev.action in ("call", "raise") and ev.amount > 0:
+                    vpip.add(ev.seat)
+                    if ev.action == "raise":
+                        pfr.add(ev.seat)
+            elif isinstance(ev, Board):
+                street = _STREET_INDEX[ev.street]
+            elif isinstance(ev, Payout):
+                pot += ev.amount
+                won[ev.seat] = won.get(ev.seat, 0) + ev.amount
+            elif isinstance(ev, Showdown):
+                scores[ev.seat] = ev.score
+            elif isinstance(ev, HandEnd):
+                end = ev
+        if end is None:
+            return
+
+        seats = sorted(hole)
+        positions = _positions(start.dealer, seats)
+        cols = self._cols
+        for seat in seats:
+            c1, c2 = hole[seat]
+            name = start.names[seat]
+            cols["hand"].append(start.hand)
+            cols["seat"].append(seat)
+            cols["name"].append(name)
+            cols["label"].append(self.labels.get(name, name))
+            cols["position"].append(positions[seat])
+            cls = hand_class(c1, c2)
+            cols["hole_class"].append(cls)
+            cols["hole"].append(class_label(cls))
+            cols["actions"].append("/".join("".join(s) for s in acts[seat]).rstrip("/"))
+            cols["pot"].append(pot)
+            cols["net"].append(end.chips[seat] - start.chips[seat])
+            cols["score"].append(scores.get(seat, -1))
+            cols["showdown"].append(seat in scores)
+            cols["won"].append(won.get(seat, 0) > 0)
+            cols["vpip"].append(seat in vpip)
+            cols["pfr"].append(seat in pfr)
+
+        self.hands += 1
+        if len(cols["hand"]) >= self.chunk_rows:
+            self.flush()
+
+    @staticmethod
+    def _frame(c):
+        return pd.DataFrame({
+            "hand": np.array(c["hand"], dtype=np.int64),
+            "seat": np.array(c["seat"], dtype=np.int8),
+            "name": pd.Categorical(c["name"]),
+            "label": pd.Categorical(c["label"]),
+            "position": pd.Categorical(c["position"]),
+            "hole_class": np.array(c["hole_class"], dtype=np.int16),
+            "hole": pd.Categorical(c["hole"]),
+            "actions": pd.array(c["actions"], dtype="string"),
+            "pot": np.array(c["pot"], dtype=np.int32),
+            "net": np.array(c["net"], dtype=np.int32),
+            "score": np.array(c["score"], dtype=np.int32),
+            "showdown": np.array(c["showdown"], dtype=bool),
+            "won": np.array(c["won"], dtype=bool),
+            "vpip": np.array(c["vpip"], dtype=bool),
+            "pfr": np.array(c["pfr"], dtype=bool),
+        })
+
+    def flush(self):
+        # 모인 행을 파트 하나로 writer 스레드에 넘긴다 (파트 번호는 넘기는 순서대로)
+        if not self._cols["hand"]:
+            return
+        base = os.path.join(self.out_dir, f"part-{self.parts:05d}")
+        self.parts += 1
+        cols, self._cols = self._cols, {c: [] for c in COLUMNS}
+        self._queue.put((base, cols))
+
+    def _write_part(self, base, cols):
+        df = self._frame(cols)
+        if self.format == "parquet":
+            df.to_parquet(base + ".parquet", index=False)
+        else:
+            arrays = {}
+            for name in COLUMNS:
+                col = df[name]
+                if name in _CATEGORIES:
+                    arrays[name] = col.cat.codes.to_numpy()
+                    arrays[name + "__cats"] = np.array(col.cat.categories, dtype=str)
+                elif name == "actions":
+                    arrays[name] = col.to_numpy(dtype=str)
+                else:
+                    arrays[name] = col.to_numpy()
+            np.savez(base + ".npz", **arrays)
+        self.rows_written += len(df)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                self._write_part(*item)
+            except Exception as e:
+                self.error = e
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _read_part(path, columns):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    with np.load(path) as z:
+        data = {}
+        for name in columns or COLUMNS:
+            if name in _CATEGORIES:
+                data[name] = pd.Categorical.from_codes(z[name], z[name + "__cats"])
+            else:
+                data[name] = z[name]
+        return pd.DataFrame(data)
+
+
+def iter_parts(out_dir, columns=None):
+    # 파트 파일을 하나씩 DataFrame 으로 (메모리에는 파트 하나만)
+    for path in sorted(glob.glob(os.path.join(out_dir, "part-*"))):
+        yield _read_part(path, columns)
+
+
+def load(out_dir, columns=None) -> pd.DataFrame:
+    parts = list(iter_parts(out_dir, columns))
+    if not parts:
+        return pd.DataFrame(columns=list(columns or COLUMNS))
+    # 파트마다 카테고리 집합이 달라도 합칠 수 있게 union
+    for name in _CATEGORIES:
+        if name in parts[0].columns:
+            cats = sorted(set().union(*(p[name].cat.categories for p in parts)))
+            for p in parts:
+                p[name] = p[name].cat.set_categories(cats)
+    return pd.concat(parts, ignore_index=True)
+
+
+def summary(out_dir, by: str = "label") -> pd.DataFrame:
+    """
+    by 별 VPIP / PFR / WTSD / 쇼다운 승률 / 핸드당 순이익. 파트 단위로 합산해서 메모리를 제한한다.
+    """
+    cols = [by, "vpip", "pfr", "showdown", "won", "net"]
+    total = None
+    for df in iter_parts(out_dir, cols):
+        df = df.assign(sd_won=df["showdown"] & df["won"], hands=1)
+        g = df.groupby(by, observed=True)[["hands", "vpip", "pfr", "showdown", "sd_won", "net"]].sum()
+        total = g if total is None else total.add(g, fill_value=0)
+    if total is None:
+        return pd.DataFrame()
+    out = pd.DataFrame({
+        "hands": total["hands"].astype(np.int64),
+        "vpip": total["vpip"] / total["hands"],
+        "pfr": total["pfr"] / total["hands"],
+        "wtsd": total["showdown"] / total["hands"],
+        "w$sd": total["sd_won"] / total["showdown"].where(total["showdown"] > 0),
+        "net/hand": total["net"] / total["hands"],
+    })
+    return out.sort_index()
+
+
+def export_log(log_path, out_dir, labels=None, chunk_rows: int = 200_000, format: str = "auto") -> ColumnarExporter:
+    from core.replay import HandLog
+
+    with HandLog(log_path) as log, ColumnarExporter(out_dir, labels, chunk_rows, format) as exporter:
+        for events in log.hands():
+            exporter.write_hand(events)
+    return exporter
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Export hand histories to chunked columnar files")
+    ap.add_argument("--log", help="hand history log to export")
+    ap.add_argument("--out", help="output directory for part files")
+    ap.add_argument("--format", choices=("auto", "parquet", "npz"), default="auto")
+    ap.add_argument("--chunk", type=int, default=200_000, help="rows per part file")
+    ap.add_argument("--summary", metavar="DIR", help="print per-label stats for an export directory")
+    ap.add_argument("--by", default="label")
+    args = ap.parse_args(argv)
+
+    if args.summary:
+        t0 = time.perf_counter()
+        table = summary(args.summary, by=args.by)
+        print(table.to_string(float_format=lambda v: f"{v:.3f}"))
+        print(f"({time.perf_counter() - t0:.2f}s)")
+        return
+    if not args.log or not args.out:
+        ap.error("--log and --out are required (or use --summary DIR)")
+
+    t0 = time.perf_counter()
+    exporter = export_log(args.log, args.out, chunk_rows=args.chunk, format=args.format)
+    print(f"{exporter.hands} hands -> {exporter.rows_written} rows in {exporter.parts} {exporter.format} parts "
+          f"({time.perf_counter() - t0:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
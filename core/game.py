@@ -8,16 +8,43 @@ from core.betting_round import BettingRound
 from players.ai_easy import EasyAI
 from players.ai_normal import NormalAI
 from players.ai_hard import HardAI
-from core.hand_evaluator import evaluate_7cards, hand_name
-from PySide6.QtCore import QTimer
+from players.ai_expert import ExpertAI
+from players.ai_adaptive import AdaptiveAI
+from core.table_view import TableView
+from core.hand_evaluator import evaluate_many, hand_name
+from core import history
+from core.stats import StatsTracker
+
+
+# 단계별 연출 지연 (ms). 드라이버가 step() 사이에 기다리는 시간
+DEFAULT_PACING = {
+    "deal": 250,
+    "action": 250,
+    "showdown": 250,
+    "next_hand": 3000,
+}
+
+_DEAL_STATES = {
+    GameState.NEW_HAND, GameState.POST_BLINDS, GameState.DEAL_HOLE_CARDS,
+    GameState.DEAL_FLOP, GameState.DEAL_TURN, GameState.DEAL_RIVER,
+}
+_SHOWDOWN_STATES = {GameState.SHOWDOWN, GameState.END_HAND}
+
 
 class HoldemGame:
-    def __init__(self, human_action):
+    """
+    Qt에 의존하지 않는 홀덤 엔진.
+    step() 한 번이 상태 하나를 진행한다. GUI에서는 ui.qt_game.QtHoldemGame 이 타이머로 step()을 호출하고,
+    배치/테스트에서는 run_hand()로 한 핸드를 끝까지 바로 진행한다.
+    """
+    def __init__(self, human_action, verbose=True, rng=None):
         self.gui = None
+        # 덱 셔플과 AI 난수가 함께 쓰는 RNG (시드 재현용, 없으면 전역 random)
+        self.rng = rng
         self.human_action = human_action
         self.waiting_for_human = False
 
-        self.deck = Deck()
+        self.deck = Deck(rng=rng)
         self.pot = Pot()
         self.community_cards = []
 
@@ -25,8 +52,13 @@ class HoldemGame:
         self.big_blind = 20
         self.dealer_index = 0
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.game_loop)
+        # False면 로그를 print 하지 않음 (배치 시뮬레이션용)
+        self.verbose = verbose
+        self.running = False
+
+        # 연출 지연 설정, pacing_enabled=False 면 모든 지연이 0
+        self.pacing = dict(DEFAULT_PACING)
+        self.pacing_enabled = True
 
         self.players: list[Player] = []
         self.state = GameState.NEW_HAND
@@ -37,21 +69,66 @@ class HoldemGame:
         self.reveal_ai = False
         # 다음 핸드 시작까지 대기 중인지 여부
         self._waiting_next_hand = False
+        # 마지막 step()에서 핸드가 끝났는지 여부
+        self.hand_over = False
+        self.hands_played = 0
+        self.game_over = False
+        self.winner = None
+        # 0번 좌석이 전용 사람 좌석인지 (configure(human=True)), 사람이 파산하면 게임 종료
+        self.has_human = True
+        # 직전 쇼다운 결과 (폴드로 끝난 핸드면 비어 있음)
+        self.showdown_scores = {}
+        self.showdown_winners = set()
+
+        # 핸드 히스토리 (history.HistoryWriter), None 이면 기록하지 않음
+        self.history = None
+        self._hand_events = []
+        # 테이블의 모든 액션을 관찰하는 AI (observe 메서드가 있는 AI, 핸드 시작마다 갱신)
+        self._observers = []
+        # 플레이어 통계 (HUD / AI 상대 모델링)
+        self.stats = StatsTracker()
 
         # 기본 설정
         self.configure(ai_count=1, difficulty="Normal", start_chips=1000, bb=20)
 
     def stop(self):
-        if hasattr(self, "timer") and self.timer.isActive():
-            self.timer.stop()
+        self.running = False
+
+    def set_history(self, writer):
+        # writer: write_hand(events) 를 가진 객체 (history.HistoryWriter), None 이면 기록 중지
+        self.history = writer
+        self._hand_events = []
+
+    def _record(self, event):
+        if self.history is not None:
+            self._hand_events.append(event)
+
+    def _on_action(self, player, action, chips_before, bet_before):
+        # AI 분기와 apply_action 공통 후처리: 통계 갱신과 히스토리 기록
+        put = chips_before - player.chips
+        if action == "raise" and player.current_bet <= bet_before:
+            # 레이즈 금액이 모자라 콜로 처리된 경우
+            action = "call"
+        if action == "call" and put == 0:
+            action = "check"
+        preflop = self.state == GameState.BETTING_PREFLOP
+        self.stats.on_action(player, action, put, bet_before, preflop, self.big_blind)
+        for ai in self._observers:
+            ai.observe(player.name, action, put, bet_before, preflop, self.big_blind)
+        if self.history is not None:
+            self._hand_events.append(history.Action(self.players.index(player), action, put))
 
     def _make_ai(self, difficulty: str):
         d = (difficulty or "Normal").lower()
         if d == "normal" and NormalAI is not None:
-            return NormalAI()
+            return NormalAI(rng=self.rng)
         if d == "hard" and HardAI is not None:
-            return HardAI()
-        return EasyAI()
+            return HardAI(rng=self.rng)
+        if d == "expert":
+            return ExpertAI(rng=self.rng)
+        if d == "adaptive":
+            return AdaptiveAI(rng=self.rng)
+        return EasyAI(rng=self.rng)
 
     def _active_indexes(self):
         return [i for i, p in enumerate(self.players) if not p.busted and p.chips > 0]
@@ -69,7 +146,8 @@ class HoldemGame:
         return start_index
 
     def _emit(self, msg: str):
-        print(msg)
+        if self.verbose:
+            print(msg)
         if self.gui:
             self.gui.show_action(msg)
 
@@ -89,8 +167,15 @@ class HoldemGame:
         self.gui.update_cards(self.players, self.community_cards, reveal_ai=self.reveal_ai)
         self._sync_ui(to_call=to_call)
 
-    def configure(self, ai_count: int, difficulty: str, start_chips: int, bb: int):
-        ai_count = max(1, min(4, int(ai_count)))
+    def configure(self, ai_count: int, difficulty, start_chips: int, bb: int, human: bool = True):
+        # human=False 면 모든 좌석이 AI (헤드리스 셀프 플레이)
+        # difficulty 에 리스트를 주면 좌석별 난이도 (ai_count 는 리스트 길이)
+        if isinstance(difficulty, (list, tuple)):
+            difficulties = list(difficulty)
+            ai_count = len(difficulties)
+        else:
+            difficulties = None
+        ai_count = max(1 if human else 2, min(4 if human else 5, int(ai_count)))
         start_chips = max(1, int(start_chips))
         bb = max(2, int(bb))
         if bb % 2 != 0:
@@ -102,9 +187,12 @@ class HoldemGame:
 
         self.stop()
 
-        self.players = [Player("Human", chips=start_chips)]
+        self.stats.reset()
+        self.has_human = bool(human)
+        self.players = [Player("Human", chips=start_chips)] if human else []
         for i in range(ai_count):
-            self.players.append(Player(f"AI{i+1}", chips=start_chips, ai=self._make_ai(difficulty)))
+            d = difficulties[i] if difficulties else difficulty
+            self.players.append(Player(f"AI{i+1}", chips=start_chips, ai=self._make_ai(d)))
 
         self.dealer_index = 0
         self.state = GameState.NEW_HAND
@@ -114,6 +202,47 @@ class HoldemGame:
         self.runout_mode = False
         self.reveal_ai = False
         self._waiting_next_hand = False
+        self.hand_over = False
+        self.hands_played = 0
+        self.game_over = False
+        self.winner = None
+
+    def set_pacing(self, enabled: bool = True, **delays):
+        # 예: set_pacing(False) / set_pacing(deal=400, next_hand=1500)
+        self.pacing_enabled = bool(enabled)
+        for k, v in delays.items():
+            if k not in self.pacing:
+                raise ValueError(f"unknown pacing key: {k}")
+            self.pacing[k] = max(0, int(v))
+
+    def delay_ms(self, kind: str) -> int:
+        if not self.pacing_enabled:
+            return 0
+        return self.pacing[kind]
+
+    def waiting_on_human(self) -> bool:
+        # 사람 입력 전에는 진행할 것이 없음 (드라이버는 HumanAction 콜백을 기다린다)
+        return self.waiting_for_human and not self.human_action.ready()
+
+    def next_step_delay(self) -> int:
+        # 다음 step() 까지 둘 연출 지연
+        if self.state in _DEAL_STATES:
+            return self.delay_ms("deal")
+        if self.state in _SHOWDOWN_STATES:
+            return self.delay_ms("showdown")
+        return self.delay_ms("action")
+
+    def reset_stacks(self, chips: int):
+        # 캐시 게임 시뮬레이션용: 모든 좌석 스택을 되돌리고 새 핸드로
+        if self.game_over and self.players:
+            self.dealer_index = (self.dealer_index + 1) % len(self.players)
+        for p in self.players:
+            p.chips = int(chips)
+            p.busted = False
+        self.game_over = False
+        self.winner = None
+        self._waiting_next_hand = False
+        self.state = GameState.NEW_HAND
 
     def start(self):
         self.state = GameState.NEW_HAND
@@ -123,14 +252,32 @@ class HoldemGame:
         self.runout_mode = False
         self.reveal_ai = False
         self._waiting_next_hand = False
-
-        if self.timer.isActive():
-            self.timer.stop()
-        self.timer.start(250)
-
-    # 게임 루프
-    def game_loop(self):
-        if self._waiting_next_hand:
+        self.hand_over = False
+        self.game_over = False
+        self.winner = None
+        self.running = True
+
+    def run_hand(self, max_steps: int = 10000) -> bool:
+        """
+        현재 핸드를 끝까지 진행한다.
+        return: 핸드가 끝나면 True, 사람 입력을 기다리거나 게임이 끝난 상태면 False
+        """
+        if self.game_over:
+            return False
+        self.hand_over = False
+        for _ in range(max_steps):
+            self.step()
+            if self.hand_over:
+                return True
+            if self.game_over:
+                return False
+            if self.waiting_on_human():
+                return False
+        raise RuntimeError(f"hand did not finish within {max_steps} steps")
+
+    # 게임 루프: 한 번 호출에 상태 하나 진행
+    def step(self):
+        if self._waiting_next_hand or self.game_over:
             return
 
         if self.state == GameState.NEW_HAND:
@@ -203,8 +350,13 @@ class HoldemGame:
 
     # 핸드 진행
     def new_hand(self):
+        self.hand_over = False
         self.runout_mode = False
         self.reveal_ai = False
+        self.showdown_scores = {}
+        self.showdown_winners = set()
+        self._hand_events = []
+        self._observers = [p.ai for p in self.players if hasattr(p.ai, "observe")]
 
         self.deck.reset()
         self.deck.shuffle()
@@ -242,6 +394,10 @@ class HoldemGame:
         sbp = self.players[sb_index]
         bbp = self.players[bb_index]
 
+        if self.history is not None:
+            self._record(history.HandStart(self.hands_played, self.dealer_index, self.big_blind,
+                                           [p.name for p in self.players], [p.chips for p in self.players]))
+
         sb_amt = min(self.small_blind, sbp.chips)
         bb_amt = min(self.big_blind, bbp.chips)
 
@@ -250,16 +406,22 @@ class HoldemGame:
 
         sbp.current_bet = sb_amt
         bbp.current_bet = bb_amt
+        # 블라인드로 칩을 모두 낸 경우 올인 처리
+        sbp.all_in = sbp.chips == 0
+        bbp.all_in = bbp.chips == 0
 
         self.pot.add_bet(sbp, sb_amt)
         self.pot.add_bet(bbp, bb_amt)
 
         self._emit(f"{sbp.name} POSTS SB {sb_amt}")
         self._emit(f"{bbp.name} POSTS BB {bb_amt}")
+        if self.history is not None:
+            self._record(history.Blind(sb_index, False, sb_amt))
+            self._record(history.Blind(bb_index, True, bb_amt))
 
         self.betting = BettingRound(players=self.players, start_index=first_to_act, big_blind=self.big_blind)
-        # 프리플랍 현재 베팅은 BB
-        self.betting.current_bet = bb_amt
+        # 프리플랍 현재 베팅은 BB (BB가 숏스택이면 SB가 더 많이 냈을 수 있다)
+        self.betting.current_bet = max(sb_amt, bb_amt)
 
         human = self.players[0]
         self._refresh_ui(to_call=max(0, self.betting.current_bet - human.current_bet))
@@ -271,9 +433,15 @@ class HoldemGame:
     def deal_hole_cards(self):
         for _ in range(2):
             for p in self.players:
-                if p.busted or p.chips <= 0:
+                # 블라인드로 올인한 플레이어도 카드를 받아야 한다
+                if p.busted:
                     continue
                 p.hole_cards.append(self.deck.draw())
+        self.stats.start_hand(self.players)
+        if self.history is not None:
+            for i, p in enumerate(self.players):
+                if p.hole_cards:
+                    self._record(history.Deal(i, p.hole_cards))
         self._refresh_ui(to_call=0)
         self.state = GameState.BETTING_PREFLOP
 
@@ -281,16 +449,23 @@ class HoldemGame:
         self.deck.burn()
         for _ in range(3):
             self.community_cards.append(self.deck.draw())
+        self.stats.on_flop(self.players)
+        if self.history is not None:
+            self._record(history.Board("flop", self.community_cards))
         self._refresh_ui(to_call=0)
 
     def deal_turn(self):
         self.deck.burn()
         self.community_cards.append(self.deck.draw())
+        if self.history is not None:
+            self._record(history.Board("turn", self.community_cards[3:]))
         self._refresh_ui(to_call=0)
 
     def deal_river(self):
         self.deck.burn()
         self.community_cards.append(self.deck.draw())
+        if self.history is not None:
+            self._record(history.Board("river", self.community_cards[4:]))
         self._refresh_ui(to_call=0)
 
     def _start_betting_round_postflop(self):
@@ -339,6 +514,8 @@ class HoldemGame:
             win_amount = self.pot.total
             winner.chips += win_amount
             self.pot.reset()
+            if self.history is not None:
+                self._record(history.Payout(self.players.index(winner), win_amount))
 
             self.reveal_ai = True
             self._emit(f"{winner.name} wins (everyone folded) +{win_amount}")
@@ -375,7 +552,9 @@ class HoldemGame:
                 self.gui.poker_screen.set_actions_enabled(False)
                 self.gui.poker_screen.set_status_text("AI thinking…")
 
-            action, amount = player.ai.decide(player=player, to_call=to_call, big_blind=self.big_blind)
+            view = self._table_view(player, to_call)
+            action, amount = player.ai.decide(player=player, to_call=to_call, big_blind=self.big_blind, view=view)
+            chips_before, bet_before = player.chips, br.current_bet
 
             if action == "fold":
                 player.folded = True
@@ -395,6 +574,7 @@ class HoldemGame:
                 self.place_bet(player, int(amount))
                 self._emit(f"{player.name} RAISES TO {br.current_bet}")
 
+            self._on_action(player, action, chips_before, bet_before)
             br.next_player()
 
             next_to_call = max(0, br.current_bet - human.current_bet)
@@ -416,7 +596,9 @@ class HoldemGame:
         self.human_action.reset()
         self.waiting_for_human = False
 
+        chips_before, bet_before = player.chips, br.current_bet
         self.apply_action(player, action, amount)
+        self._on_action(player, action, chips_before, bet_before)
 
         if self.gui:
             self.gui.poker_screen.set_actions_enabled(False)
@@ -426,6 +608,44 @@ class HoldemGame:
         self._refresh_ui(to_call=next_to_call)
         return False
 
+    _STREETS = {
+        GameState.BETTING_PREFLOP: "preflop",
+        GameState.BETTING_FLOP: "flop",
+        GameState.BETTING_TURN: "turn",
+        GameState.BETTING_RIVER: "river",
+    }
+
+    def pending_player(self):
+        # 외부 입력(HumanAction)을 기다리는 플레이어, 없으면 None
+        if not self.waiting_on_human():
+            return None
+        return self.players[self.betting.turn_index]
+
+    def table_view(self, player):
+        to_call = max(0, self.betting.current_bet - player.current_bet)
+        return self._table_view(player, to_call)
+
+    def _table_view(self, player, to_call):
+        br = self.betting
+        live = tuple(p.name for p in self.players if p is not player and not p.folded)
+        raiser = br.last_raiser
+        return TableView(
+            street=self._STREETS.get(self.state, "preflop"),
+            board=tuple(self.community_cards),
+            pot=self.pot.total,
+            to_call=to_call,
+            current_bet=br.current_bet,
+            min_raise=br.min_raise,
+            big_blind=self.big_blind,
+            opponents=len(live),
+            stacks={p.name: p.chips for p in self.players},
+            seat=self.players.index(player),
+            dealer_index=self.dealer_index,
+            live=live,
+            aggressor=raiser.name if raiser is not None and raiser is not player else None,
+            stats=self.stats,
+        )
+
     def apply_action(self, player, action, amount):
         br = self.betting
         to_call = br.current_bet - player.current_bet
@@ -463,7 +683,7 @@ class HoldemGame:
 
         before_round_bet = br.current_bet
 
-        real = min(int(amount), player.chips)
+        real = max(0, min(int(amount), player.chips))
         player.chips -= real
         player.current_bet += real
         self.pot.add_bet(player, real)
@@ -485,10 +705,14 @@ class HoldemGame:
     # 쇼다운 / 종료
     def showdown(self):
         active = [p for p in self.players if not p.folded]
-        scores = {p: evaluate_7cards(p.hole_cards + self.community_cards) for p in active}
+        # 보드 계산은 한 번만 하고 핸드별로 홀카드만 더한다
+        scores = dict(zip(active, evaluate_many(self.community_cards, [p.hole_cards for p in active])))
 
         for p in active:
             self._emit(f"{p.name} hand: {hand_name(scores[p])}")
+        if self.history is not None:
+            for p in active:
+                self._record(history.Showdown(self.players.index(p), scores[p], p.hole_cards))
 
         pots = self.pot.build_pots()
         for pot_amount, eligible in pots:
@@ -499,6 +723,8 @@ class HoldemGame:
             for w in winners:
                 w.chips += share
                 self._emit(f"{w.name} wins {share}")
+                if self.history is not None:
+                    self._record(history.Payout(self.players.index(w), share))
 
         # 마지막 말풍선에 WIN/LOSE 표시
         winners_all = {p for pot_amount, eligible in pots
@@ -507,6 +733,10 @@ class HoldemGame:
         for p in active:
             self._emit(f"{p.name} {'WIN' if p in winners_all else 'LOSE'}")
 
+        self.showdown_scores = scores
+        self.showdown_winners = winners_all
+        self.stats.on_showdown(active, winners_all)
+
         self.pot.reset()
         self.reveal_ai = True
         if self.gui:
@@ -517,42 +747,48 @@ class HoldemGame:
         if self.gui:
             self.gui.poker_screen.set_actions_enabled(False)
             self.gui.poker_screen.set_status_text("Next hand in 3s…")
+            self.gui.poker_screen.update_stats(self.stats, self.players)
 
-        human = self.players[0]
-        if human.chips <= 0:
-            human.busted = True
-            human.folded = True
-            human.all_in = True
-        for p in self.players[1:]:
+        for p in self.players:
             if p.chips <= 0:
                 p.busted = True
                 p.folded = True
                 p.all_in = True
-        if human.chips <= 0:
-            self.stop()
-            if self.gui:
-                self.gui.poker_screen.show_game_over("AI")
-            return
 
-        if all(p.busted or p.chips <= 0 for p in self.players[1:]):
+        if self.history is not None and self._hand_events:
+            self._hand_events.append(history.HandEnd(self.hands_played, [p.chips for p in self.players]))
+            self.history.write_hand(self._hand_events)
+            self._hand_events = []
+
+        self.hands_played += 1
+        self.hand_over = True
+
+        alive = [p for p in self.players if not p.busted]
+        winner = None
+        if self.has_human and self.players[0].busted:
+            winner = "AI"
+        elif len(alive) <= 1:
+            # 헤드리스 / 네트워크 테이블: 마지막까지 남은 좌석 이름
+            winner = alive[0].name if alive else max(self.players, key=lambda p: p.chips).name
+
+        if winner is not None:
+            self.game_over = True
+            self.winner = winner
             self.stop()
             if self.gui:
-                self.gui.poker_screen.show_game_over("Human")
+                self.gui.poker_screen.show_game_over(winner)
             return
 
         self.dealer_index = self._next_active_index(self.dealer_index, step=1)
 
-        self._schedule_next_hand(delay_ms=3000)
+        self._schedule_next_hand(delay_ms=self.delay_ms("next_hand"))
 
     def _schedule_next_hand(self, delay_ms=3000):
-        self._waiting_next_hand = True
-        self.stop()
-
-        QTimer.singleShot(int(delay_ms), self._start_next_hand)
+        # 헤드리스 엔진은 바로 다음 핸드로 넘어간다 (Qt 드라이버가 지연을 재정의)
+        self._start_next_hand()
 
     def _start_next_hand(self):
         self._waiting_next_hand = False
         self.runout_mode = False
         self.reveal_ai = False
         self.state = GameState.NEW_HAND
-        self.timer.start(250)
@@ -1,6 +1,9 @@
+from array import array
 from itertools import combinations
 from collections import Counter
 
+from core.card import mask_to_cards
+
 HAND_RANKS = {
     "HIGH_CARD": 1,
     "ONE_PAIR": 2,
@@ -29,14 +32,221 @@ HAND_RANK_NAMES_EN = {
 def hand_name(score):
     if not score:
         return "Unknown"
-    return HAND_RANK_NAMES_EN.get(score[0], "Unknown")
+    return HAND_RANK_NAMES_EN.get(hand_category(score), "Unknown")
 
 
-def evaluate_7cards(cards):
+def hand_category(score):
+    # 튜플 점수와 정수 점수 모두 지원
+    if isinstance(score, int):
+        return score >> 20
+    return score[0]
+
+
+def pack_score(score):
     """
-    cards: Card 7장 리스트
-    return: 최고 족보 점수 튜플
+    튜플 점수 -> 정수 점수 (카테고리 4비트 + 랭크 4비트 x 5)
+    같은 카테고리 안에서는 튜플 길이가 같으므로 대소 관계가 그대로 유지된다.
     """
+    value = score[0]
+    ranks = list(score[1:]) + [0] * (5 - (len(score) - 1))
+    for r in ranks:
+        value = (value << 4) | r
+    return value
+
+
+def unpack_score(value):
+    # 정수 점수 -> 튜플 점수 (pack_score의 역변환)
+    cat = value >> 20
+    ranks = [(value >> shift) & 0xF for shift in (16, 12, 8, 4, 0)]
+    return (cat, *ranks[:_SCORE_LENGTHS[cat]])
+
+
+_SCORE_LENGTHS = {
+    HAND_RANKS["HIGH_CARD"]: 5,
+    HAND_RANKS["ONE_PAIR"]: 4,
+    HAND_RANKS["TWO_PAIR"]: 3,
+    HAND_RANKS["THREE_KIND"]: 3,
+    HAND_RANKS["STRAIGHT"]: 1,
+    HAND_RANKS["FLUSH"]: 5,
+    HAND_RANKS["FULL_HOUSE"]: 2,
+    HAND_RANKS["FOUR_KIND"]: 2,
+    HAND_RANKS["STRAIGHT_FLUSH"]: 1,
+}
+
+
+# 룩업 테이블 평가기
+#
+# 카드 묶음을 무늬별 13비트 랭크 마스크 4개로 표현한다.
+# - 플러시: 한 무늬에 5장 이상이면 그 무늬 마스크만으로 점수가 결정된다 (_FLUSH_TABLE).
+#   7장 중 5장이 같은 무늬면 포카드/풀하우스는 나올 수 없으므로 플러시가 최선이다.
+# - 그 외: 점수는 랭크 멀티셋에만 의존한다. 랭크별 장수를 3비트 필드로 더한 키로
+#   _RANK_TABLE에서 찾는다. 키는 무늬 마스크를 _SPREAD로 펼쳐 더하면 얻어진다.
+# 테이블은 첫 호출 시 한 번만 만든다.
+
+SUIT_INDEX = {"S": 0, "H": 1, "D": 2, "C": 3}
+
+_FLUSH_TABLE = []
+_SPREAD = []
+_RANK_TABLE = {}
+
+
+def _spread(mask):
+    key = 0
+    for i in range(13):
+        if mask >> i & 1:
+            key += 1 << (3 * i)
+    return key
+
+
+def _top_ranks(mask, n):
+    # 마스크에서 높은 랭크부터 n개
+    out = []
+    for i in range(12, -1, -1):
+        if mask >> i & 1:
+            out.append(i + 2)
+            if len(out) == n:
+                break
+    return out
+
+
+def _straight_high(mask):
+    for high in range(14, 5, -1):
+        window = 0x1F << (high - 6)
+        if mask & window == window:
+            return high
+    # A-5 스트레이트(휠)
+    if mask & 0x100F == 0x100F:
+        return 5
+    return None
+
+
+def _score_flush_mask(mask):
+    high = _straight_high(mask)
+    if high is not None:
+        return pack_score((HAND_RANKS["STRAIGHT_FLUSH"], high))
+    return pack_score((HAND_RANKS["FLUSH"], *_top_ranks(mask, 5)))
+
+
+def _score_rank_counts(counts):
+    # counts: 인덱스 0~12 (랭크 2~14) 별 장수, 플러시가 아닌 경우의 최고 점수
+    present = 0
+    quads, trips, pairs = [], [], []
+    for i in range(12, -1, -1):
+        c = counts[i]
+        if c:
+            present |= 1 << i
+        if c == 4:
+            quads.append(i + 2)
+        elif c == 3:
+            trips.append(i + 2)
+        elif c == 2:
+            pairs.append(i + 2)
+
+    if quads:
+        four = quads[0]
+        kicker = _top_ranks(present & ~(1 << (four - 2)), 1)
+        return pack_score((HAND_RANKS["FOUR_KIND"], four, *kicker))
+
+    if trips and (len(trips) >= 2 or pairs):
+        three = trips[0]
+        pair = max(trips[1:] + pairs)
+        return pack_score((HAND_RANKS["FULL_HOUSE"], three, pair))
+
+    high = _straight_high(present)
+    if high is not None:
+        return pack_score((HAND_RANKS["STRAIGHT"], high))
+
+    if trips:
+        three = trips[0]
+        kickers = _top_ranks(present & ~(1 << (three - 2)), 2)
+        return pack_score((HAND_RANKS["THREE_KIND"], three, *kickers))
+
+    if len(pairs) >= 2:
+        high_pair, low_pair = pairs[0], pairs[1]
+        rest = present & ~(1 << (high_pair - 2)) & ~(1 << (low_pair - 2))
+        kicker = _top_ranks(rest, 1)
+        return pack_score((HAND_RANKS["TWO_PAIR"], high_pair, low_pair, *kicker))
+
+    if pairs:
+        pair = pairs[0]
+        kickers = _top_ranks(present & ~(1 << (pair - 2)), 3)
+        return pack_score((HAND_RANKS["ONE_PAIR"], pair, *kickers))
+
+    return pack_score((HAND_RANKS["HIGH_CARD"], *_top_ranks(present, 5)))
+
+
+def _rank_multisets(size, start=0, counts=None):
+    # 랭크당 최대 4장인 size장짜리 랭크 멀티셋 전부
+    if counts is None:
+        counts = [0] * 13
+    if size == 0:
+        yield counts
+        return
+    for i in range(start, 13):
+        if counts[i] < 4:
+            counts[i] += 1
+            yield from _rank_multisets(size - 1, i, counts)
+            counts[i] -= 1
+
+
+def _build_tables():
+    if _RANK_TABLE:
+        return
+
+    for mask in range(1 << 13):
+        _SPREAD.append(_spread(mask))
+        _FLUSH_TABLE.append(_score_flush_mask(mask) if mask.bit_count() >= 5 else 0)
+
+    for size in (5, 6, 7):
+        for counts in _rank_multisets(size):
+            key = 0
+            for i, c in enumerate(counts):
+                key += c << (3 * i)
+            _RANK_TABLE[key] = _score_rank_counts(counts)
+
+
+def evaluate_suit_masks(m0, m1, m2, m3):
+    """
+    무늬별 13비트 랭크 마스크 4개 -> 정수 점수 (5~7장)
+    """
+    if not _RANK_TABLE:
+        _build_tables()
+    flush = _FLUSH_TABLE
+    spread = _SPREAD
+    best = _RANK_TABLE[spread[m0] + spread[m1] + spread[m2] + spread[m3]]
+    f = flush[m0] or flush[m1] or flush[m2] or flush[m3]
+    return f if f > best else best
+
+
+def evaluate_mask(mask):
+    """
+    mask: 카드 5~7장의 64비트 마스크 (Card.mask 의 OR)
+    return: 정수 점수
+    """
+    return evaluate_suit_masks(mask & 0x1FFF, (mask >> 16) & 0x1FFF,
+                               (mask >> 32) & 0x1FFF, (mask >> 48) & 0x1FFF)
+
+
+def evaluate_7cards_table(cards):
+    """
+    cards: Card 5~7장 리스트 또는 카드 마스크(int)
+    return: 정수 점수 (pack_score와 같은 공간, 튜플 점수와 같은 순서)
+    """
+    if isinstance(cards, int):
+        return evaluate_mask(cards)
+    mask = 0
+    for c in cards:
+        mask |= c.mask
+    return evaluate_mask(mask)
+
+
+def evaluate_7cards_combo(cards):
+    """
+    cards: Card 7장 리스트 또는 카드 마스크(int)
+    return: 최고 족보 점수 튜플 (21가지 조합 전수 비교, 기준 구현)
+    """
+    if isinstance(cards, int):
+        cards = mask_to_cards(cards)
     best = None
     for combo in combinations(cards, 5):
         score = evaluate_5cards(combo)
@@ -45,6 +255,78 @@ def evaluate_7cards(cards):
     return best
 
 
+ENGINES = {
+    "table": evaluate_7cards_table,
+    "combo": evaluate_7cards_combo,
+}
+
+_engine = evaluate_7cards_table
+
+
+def set_engine(name):
+    # 기본 7장 평가 엔진 선택: "table" | "combo"
+    global _engine
+    if name not in ENGINES:
+        raise ValueError(f"unknown evaluator engine: {name}")
+    _engine = ENGINES[name]
+
+
+def get_engine():
+    for name, fn in ENGINES.items():
+        if fn is _engine:
+            return name
+    return None
+
+
+def evaluate_7cards(cards):
+    """
+    cards: Card 7장 리스트 또는 카드 마스크(int)
+    return: 최고 족보 점수 (엔진에 따라 정수 또는 튜플, 비교 순서는 동일)
+    """
+    return _engine(cards)
+
+
+def evaluate_many(board, hole_card_list):
+    """
+    board: 커뮤니티 카드 3~5장, hole_card_list: 홀카드 2장 묶음들
+    return: array('i') 정수 점수 (hole_card_list 순서, evaluate_7cards_table 과 같은 값)
+
+    보드의 랭크 키와 무늬별 마스크를 한 번만 만들고, 핸드마다 홀카드 두 장만 더해서 찾는다.
+    보드에 같은 무늬가 3장 이상일 때만 플러시를 확인한다 (7장 중 5장이 필요하므로 그런 무늬는 최대 하나).
+    """
+    if _engine is not evaluate_7cards_table:
+        return array("i", (pack_score(_engine(list(h) + list(board))) for h in hole_card_list))
+    if not _RANK_TABLE:
+        _build_tables()
+
+    suit_masks = [0, 0, 0, 0]
+    for c in board:
+        suit_masks[c.bit >> 4] |= 1 << (c.rank - 2)
+    spread = _SPREAD
+    board_key = spread[suit_masks[0]] + spread[suit_masks[1]] + spread[suit_masks[2]] + spread[suit_masks[3]]
+    flush_suit = next((s for s in range(4) if suit_masks[s].bit_count() >= 3), None)
+
+    rank_table = _RANK_TABLE
+    out = array("i", bytes(4 * len(hole_card_list)))
+    if flush_suit is None:
+        for i, (c1, c2) in enumerate(hole_card_list):
+            out[i] = rank_table[board_key + (1 << 3 * (c1.rank - 2)) + (1 << 3 * (c2.rank - 2))]
+        return out
+
+    flush_table = _FLUSH_TABLE
+    flush_mask = suit_masks[flush_suit]
+    for i, (c1, c2) in enumerate(hole_card_list):
+        best = rank_table[board_key + (1 << 3 * (c1.rank - 2)) + (1 << 3 * (c2.rank - 2))]
+        m = flush_mask
+        if c1.bit >> 4 == flush_suit:
+            m |= 1 << (c1.rank - 2)
+        if c2.bit >> 4 == flush_suit:
+            m |= 1 << (c2.rank - 2)
+        f = flush_table[m]
+        out[i] = f if f > best else best
+    return out
+
+
 def evaluate_5cards(cards):
     ranks = sorted([c.rank for c in cards], reverse=True)
     suits = [c.suit for c in cards]
@@ -0,0 +1,441 @@
+"""
+핸드 히스토리 이벤트와 바이너리 로그
+
+엔진이 핸드 진행 중에 타입이 있는 이벤트(HandStart, Blind, Deal, Action, Board, Showdown, Payout, HandEnd)를
+모아 두었다가 핸드가 끝나면 HistoryWriter 에 넘긴다. 인코딩과 파일 쓰기는 writer 스레드가 하므로
+게임 루프는 큐에 넣는 비용만 낸다.
+
+파일 형식 (리틀 엔디언)
+    헤더: MAGIC (8바이트)
+    레코드: <I 길이> <B 종류> <본문>   (길이 = 종류 1바이트 + 본문 길이)
+카드는 Card.id (0~51), 좌석은 players 인덱스, 점수는 pack_score 정수.
+
+사이드카 인덱스 (<로그>.idx): INDEX_MAGIC 뒤에 핸드마다 HandStart 레코드의 파일 오프셋 (<Q).
+writer 가 로그와 함께 추가하고, 없거나 뒤처진 인덱스는 build_index 가 마지막 핸드 이후만 스캔해서 맞춘다.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from array import array
+
+from core.card import Card
+from core.hand_evaluator import pack_score
+
+MAGIC = b"HHLOG\x00\x01\n"
+INDEX_MAGIC = b"HHIDX\x00\x01\n"
+
+_HEADER = struct.Struct("<IB")
+
+ACTION_CODES = {"fold": 0, "check": 1, "call": 2, "raise": 3}
+ACTION_NAMES = {v: k for k, v in ACTION_CODES.items()}
+
+STREETS = ("preflop", "flop", "turn", "river")
+
+
+class HandStart:
+    KIND = 1
+    __slots__ = ("hand", "dealer", "big_blind", "names", "chips")
+    _S = struct.Struct("<IBIB")
+
+    def __init__(self, hand, dealer, big_blind, names, chips):
+        self.hand = hand
+        self.dealer = dealer
+        self.big_blind = big_blind
+        self.names = list(names)
+        # 블라인드 전 스택
+        self.chips = list(chips)
+
+    def pack(self):
+        parts = [self._S.pack(self.hand, self.dealer, self.big_blind, len(self.names))]
+        for name, chips in zip(self.names, self.chips):
+            raw = name.encode()[:255]
+            parts.append(struct.pack(f"<IB{len(raw)}s", chips, len(raw), raw))
+        return b"".join(parts)
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        hand, dealer, bb, n = cls._S.unpack_from(buf, off)
+        off += cls._S.size
+        names, chips = [], []
+        for _ in range(n):
+            c, ln = struct.unpack_from("<IB", buf, off)
+            off += 5
+            names.append(bytes(buf[off:off + ln]).decode())
+            off += ln
+            chips.append(c)
+        return cls(hand, dealer, bb, names, chips)
+
+
+class Blind:
+    KIND = 2
+    __slots__ = ("seat", "big", "amount")
+    _S = struct.Struct("<BBI")
+
+    def __init__(self, seat, big, amount):
+        self.seat = seat
+        self.big = bool(big)
+        self.amount = amount
+
+    def pack(self):
+        return self._S.pack(self.seat, self.big, self.amount)
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        return cls(*cls._S.unpack_from(buf, off))
+
+
+class Deal:
+    KIND = 3
+    __slots__ = ("seat", "cards")
+    _S = struct.Struct("<BBB")
+
+    def __init__(self, seat, cards):
+        self.seat = seat
+        self.cards = tuple(cards)
+
+    def pack(self):
+        return self._S.pack(self.seat, self.cards[0].id, self.cards[1].id)
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        seat, a, b = cls._S.unpack_from(buf, off)
+        return cls(seat, (Card.from_id(a), Card.from_id(b)))
+
+
+class Action:
+    KIND = 4
+    __slots__ = ("seat", "action", "amount")
+    _S = struct.Struct("<BBI")
+
+    def __init__(self, seat, action, amount):
+        self.seat = seat
+        # fold | check | call | raise, amount: 이번 액션에서 실제로 넣은 칩
+        self.action = action
+        self.amount = amount
+
+    def pack(self):
+        return self._S.pack(self.seat, ACTION_CODES[self.action], self.amount)
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        seat, code, amount = cls._S.unpack_from(buf, off)
+        return cls(seat, ACTION_NAMES[code], amount)
+
+
+class Board:
+    KIND = 5
+    __slots__ = ("street", "cards")
+
+    def __init__(self, street, cards):
+        # street: flop | turn | river, cards: 이번에 깔린 카드
+        self.street = street
+        self.cards = tuple(cards)
+
+    def pack(self):
+        return bytes([STREETS.index(self.street), len(self.cards)] + [c.id for c in self.cards])
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        street, n = buf[off], buf[off + 1]
+        return cls(STREETS[street], tuple(Card.from_id(i) for i in buf[off + 2:off + 2 + n]))
+
+
+class Showdown:
+    KIND = 6
+    __slots__ = ("seat", "score", "cards")
+    _S = struct.Struct("<BIBB")
+
+    def __init__(self, seat, score, cards):
+        self.seat = seat
+        self.score = score if isinstance(score, int) else pack_score(score)
+        self.cards = tuple(cards)
+
+    def pack(self):
+        return self._S.pack(self.seat, self.score, self.cards[0].id, self.cards[1].id)
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        seat, score, a, b = cls._S.unpack_from(buf, off)
+        return cls(seat, score, (Card.from_id(a), Card.from_id(b)))
+
+
+class Payout:
+    KIND = 7
+    __slots__ = ("seat", "amount")
+    _S = struct.Struct("<BI")
+
+    def __init__(self, seat, amount):
+        self.seat = seat
+        self.amount = amount
+
+    def pack(self):
+        return self._S.pack(self.seat, self.amount)
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        return cls(*cls._S.unpack_from(buf, off))
+
+
+class HandEnd:
+    KIND = 8
+    __slots__ = ("hand", "chips")
+    _S = struct.Struct("<IB")
+
+    def __init__(self, hand, chips):
+        self.hand = hand
+        self.chips = list(chips)
+
+    def pack(self):
+        return self._S.pack(self.hand, len(self.chips)) + struct.pack(f"<{len(self.chips)}I", *self.chips)
+
+    @classmethod
+    def unpack(cls, buf, off=0):
+        hand, n = cls._S.unpack_from(buf, off)
+        return cls(hand, struct.unpack_from(f"<{n}I", buf, off + cls._S.size))
+
+
+EVENT_TYPES = {cls.KIND: cls for cls in (HandStart, Blind, Deal, Action, Board, Showdown, Payout, HandEnd)}
+
+
+def encode_events(events) -> bytes:
+    parts = []
+    for ev in events:
+        body = ev.pack()
+        parts.append(_HEADER.pack(len(body) + 1, ev.KIND))
+        parts.append(body)
+    return b"".join(parts)
+
+
+def decode_event(buf, off):
+    """
+    buf[off:] 의 레코드 하나 -> (이벤트, 다음 오프셋)
+    """
+    length, kind = _HEADER.unpack_from(buf, off)
+    cls = EVENT_TYPES.get(kind)
+    if cls is None:
+        raise ValueError(f"unknown event kind {kind} at offset {off}")
+    return cls.unpack(buf, off + _HEADER.size), off + 4 + length
+
+
+def read_events(path):
+    # 로그 전체를 처음부터 순서대로 읽는다 (비정상 종료로 쓰다 만 마지막 레코드는 건너뛴다)
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a hand history log")
+    size = len(data)
+    off = len(MAGIC)
+    while off + _HEADER.size <= size:
+        length = _HEADER.unpack_from(data, off)[0]
+        if length == 0 or off + 4 + length > size:
+            break
+        ev, off = decode_event(data, off)
+        yield ev
+
+
+def index_path(path) -> str:
+    return path + ".idx"
+
+
+def _offsets_bytes(offsets) -> bytes:
+    arr = array("Q", offsets)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def read_index(path) -> array:
+    # 인덱스 파일 전체 -> 오프셋 배열 (없거나 형식이 다르면 빈 배열)
+    arr = array("Q")
+    try:
+        with open(index_path(path), "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return arr
+    if not data.startswith(INDEX_MAGIC):
+        return arr
+    body = data[len(INDEX_MAGIC):]
+    arr.frombytes(body[:len(body) - len(body) % 8])
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+def build_index(path):
+    """
+    사이드카 인덱스를 로그 끝까지 맞춘다. 이미 인덱스된 마지막 핸드부터만 스캔한다.
+    return: (인덱스된 핸드 수, 마지막 완전한 레코드의 끝 오프셋)
+    """
+    size = os.path.getsize(path)
+    old = read_index(path)
+    keep = 0
+    while keep < len(old) and old[keep] < size:
+        keep += 1
+
+    offsets = list(old[:keep])
+    start = offsets[-1] if offsets else len(MAGIC)
+    end = start
+    if size > start:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a hand history log")
+            off = start
+            while off + _HEADER.size <= size:
+                length, kind = _HEADER.unpack_from(mm, off)
+                if length == 0 or off + 4 + length > size:
+                    # 쓰다 만 레코드
+                    break
+                if kind == HandStart.KIND and (not offsets or off > offsets[-1]):
+                    offsets.append(off)
+                off += 4 + length
+            end = off
+
+    idx = index_path(path)
+    intact = False
+    if keep == len(old) and os.path.exists(idx):
+        with open(idx, "rb") as f:
+            intact = f.read(len(INDEX_MAGIC)) == INDEX_MAGIC
+        intact = intact and (os.path.getsize(idx) - len(INDEX_MAGIC)) % 8 == 0
+    if intact:
+        with open(idx, "ab") as f:
+            f.write(_offsets_bytes(offsets[keep:]))
+    else:
+        # 인덱스가 없거나 로그보다 앞서 있으면 새로 쓴다
+        tmp = idx + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(INDEX_MAGIC + _offsets_bytes(offsets))
+        os.replace(tmp, idx)
+    return len(offsets), end
+
+
+class HistoryTee:
+    # 핸드 이벤트를 여러 곳으로 (예: 바이너리 로그 + 컬럼형 내보내기)
+    def __init__(self, *sinks):
+        self.sinks = [s for s in sinks if s is not None]
+
+    def write_hand(self, events):
+        for sink in self.sinks:
+            sink.write_hand(events)
+
+
+class HistoryWriter:
+    """
+    append-only 로그 작성기. write_hand() 는 큐에 넣고 바로 돌아오며,
+    writer 스레드가 인코딩/쓰기를 하고 fsync_interval 초 또는 fsync_bytes 바이트마다 fsync 한다.
+    핸드마다 시작 오프셋을 사이드카 인덱스에 함께 추가한다.
+    디스크가 못 따라가서 max_pending 핸드가 밀려 있으면 게임 루프를 멈추지 않고 그 핸드를 버리고
+    hands_dropped 를 센다.
+    """
+    def __init__(self, path, fsync_interval: float = 1.0, fsync_bytes: int = 4 << 20, max_pending: int = 10000):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.fsync_bytes = fsync_bytes
+        self.hands_written = 0
+        self.bytes_written = 0
+        self.fsyncs = 0
+        # 큐가 가득 차서 기록하지 못한 핸드 수
+        self.hands_dropped = 0
+        self.error = None
+
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if new:
+            with open(path, "wb") as f:
+                f.write(MAGIC)
+        # 이어 쓰기 전에 인덱스를 맞추고, 비정상 종료로 잘린 꼬리 레코드는 잘라 낸다
+        _, end = build_index(path)
+        if end < os.path.getsize(path):
+            os.truncate(path, end)
+        self._file = open(path, "ab")
+        self._file.seek(0, os.SEEK_END)
+        self._offset = self._file.tell()
+        self._index = open(index_path(path), "ab")
+        # 밀린 핸드 수를 제한해서 메모리를 묶어 둔다 (넘치면 write_hand 가 버린다)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+
+    def write_hand(self, events):
+        if self._closed:
+            raise ValueError("history writer is closed")
+        if self.error is not None:
+            raise self.error
+        try:
+            self._queue.put_nowait(events)
+        except queue.Full:
+            self.hands_dropped += 1
+
+    def _run(self):
+        f = self._file
+        unsynced = 0
+        last_sync = time.monotonic()
+        done = False
+        while not done:
+            try:
+                batch = [self._queue.get(timeout=self.fsync_interval)]
+            except queue.Empty:
+                batch = []
+            # 쌓인 핸드를 한 번에 쓴다
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                batch = [events for events in batch if events is not None]
+                done = True
+
+            try:
+                if batch:
+                    chunks = []
+                    offsets = []
+                    for events in batch:
+                        chunk = encode_events(events)
+                        offsets.append(self._offset)
+                        self._offset += len(chunk)
+                        chunks.append(chunk)
+                    data = b"".join(chunks)
+                    f.write(data)
+                    # 인덱스는 로그 뒤에 쓴다 (인덱스가 가리키는 데이터는 항상 로그에 있다)
+                    f.flush()
+                    self._index.write(_offsets_bytes(offsets))
+                    self.hands_written += len(batch)
+                    self.bytes_written += len(data)
+                    unsynced += len(data)
+
+                now = time.monotonic()
+                if unsynced and (done or unsynced >= self.fsync_bytes or now - last_sync >= self.fsync_interval):
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self._index.flush()
+                    os.fsync(self._index.fileno())
+                    self.fsyncs += 1
+                    unsynced = 0
+                    last_sync = now
+            except OSError as e:
+                self.error = e
+                done = True
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        self._index.close()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
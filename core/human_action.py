@@ -3,10 +3,22 @@ class HumanAction:
         # action: "fold" | "call" | "raise"
         self.action = None
         self.amount = 0
+        # 입력이 들어오면 호출할 콜백 (엔진 드라이버가 등록)
+        self._listeners = []
+
+    def subscribe(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
 
     def set(self, action, amount=0):
         self.action = action
         self.amount = amount
+        for cb in list(self._listeners):
+            cb()
 
     def consume(self):
         action = self.action
@@ -0,0 +1,117 @@
+"""
+멀티프로세스 셀프 플레이 러너
+
+    python -m core.parallel --seats hard,normal,easy --hands 10000000 --seed 42
+
+작업을 고정 크기 청크로 나누고 청크마다 마스터 시드에서 파생한 시드로 독립 RNG를 만든다.
+청크 결과는 청크 순서대로 합치므로 워커 수와 관계없이 같은 마스터 시드면 같은 결과가 나온다.
+청크마다 AI 를 새로 만들므로 ExpertAI 의 몬테카를로 샘플 풀(AI 인스턴스별 캐시)도 청크 안에서만 쓰인다.
+단 ExpertAI 는 샘플 수를 시간 예산으로 자르므로 expert 좌석이 있으면 결과가 기계 속도에 따라 달라질 수 있다.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.hand_evaluator import evaluate_7cards
+from core.card import FULL_DECK
+from core.simulate import Simulator, parse_seats
+
+
+def chunk_seed(master_seed: int, index: int) -> int:
+    # 문자열 시드는 sha512 로 해시되므로 프로세스/실행에 관계없이 고정
+    return random.Random(f"{master_seed}:{index}").getrandbits(64)
+
+
+def plan_chunks(total: int, chunk_size: int) -> list[int]:
+    chunk_size = max(1, int(chunk_size))
+    sizes = [chunk_size] * (total // chunk_size)
+    if total % chunk_size:
+        sizes.append(total % chunk_size)
+    return sizes
+
+
+def _init_worker():
+    # 평가 테이블을 워커 시작 시 한 번 만들어 둔다
+    evaluate_7cards(FULL_DECK[:7])
+
+
+def _run_chunk(task):
+    seats, start_chips, bb, seed, mode, count, max_hands = task
+    sim = Simulator(seats, start_chips=start_chips, bb=bb, seed=seed)
+    if mode == "tournaments":
+        return sim.play_tournaments(count, max_hands=max_hands)
+    return sim.play_hands(count)
+
+
+def run_parallel(seats, hands: int = 0, tournaments: int = 0, workers: int | None = None,
+                 master_seed: int = 0, chunk_size: int | None = None,
+                 start_chips: int = 500, bb: int = 20, max_hands: int = 10000):
+    """
+    hands 또는 tournaments 만큼을 청크로 나눠 프로세스 풀에서 실행하고 하나의 SimResult로 합친다.
+    """
+    workers = workers or os.cpu_count() or 1
+    if tournaments:
+        mode, total = "tournaments", int(tournaments)
+        chunk_size = chunk_size or 10
+    else:
+        mode, total = "hands", int(hands)
+        chunk_size = chunk_size or 20000
+
+    tasks = [
+        (list(seats), start_chips, bb, chunk_seed(master_seed, i), mode, count, max_hands)
+        for i, count in enumerate(plan_chunks(total, chunk_size))
+    ]
+
+    t0 = time.perf_counter()
+    result = None
+    if workers == 1:
+        _init_worker()
+        for part in map(_run_chunk, tasks):
+            result = part if result is None else result.merge(part)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            # map 은 제출 순서대로 결과를 돌려주므로 병합 순서가 고정된다
+            for part in pool.map(_run_chunk, tasks):
+                result = part if result is None else result.merge(part)
+
+    if result is None:
+        result = Simulator(seats, start_chips=start_chips, bb=bb).new_result()
+    result.seconds = time.perf_counter() - t0
+    return result
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Parallel Holdem AI self-play")
+    ap.add_argument("--seats", type=parse_seats, default=["hard", "normal", "easy"])
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--hands", type=int, default=None)
+    mode.add_argument("--tournaments", type=int, default=None)
+    ap.add_argument("--max-hands", type=int, default=10000, help="hand cap per tournament")
+    ap.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    ap.add_argument("--chunk", type=int, default=None, help="hands (or tournaments) per work unit")
+    ap.add_argument("--seed", type=int, default=0, help="master seed")
+    ap.add_argument("--chips", type=int, default=500)
+    ap.add_argument("--bb", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    result = run_parallel(
+        args.seats,
+        hands=args.hands if args.hands is not None else (0 if args.tournaments else 100000),
+        tournaments=args.tournaments or 0,
+        workers=args.workers,
+        master_seed=args.seed,
+        chunk_size=args.chunk,
+        start_chips=args.chips,
+        bb=args.bb,
+        max_hands=args.max_hands,
+    )
+    print(result.report())
+    return result
+
+
+if __name__ == "__main__":
+    main()
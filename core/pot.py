@@ -1,42 +1,97 @@
+class PotLayer:
+    """
+    사이드팟 한 층: 누적 베팅이 cap 이상인 플레이어가 eligible
+    """
+    __slots__ = ("cap", "amount", "eligible")
+
+    def __init__(self, cap, amount, eligible):
+        self.cap = cap
+        self.amount = amount
+        self.eligible = eligible
+
+    def __repr__(self):
+        return f"PotLayer(cap={self.cap}, amount={self.amount}, eligible={self.eligible})"
+
+
 class Pot:
     def __init__(self):
         # player -> 누적 베팅
         self.bets = {}
+        # player -> 처음 베팅한 순서 (eligible 정렬용)
+        self._order = {}
+        self._total = 0
+        # cap 오름차순 사이드팟 층, add_bet 마다 갱신
+        self._layers = []
 
     def add_bet(self, player, amount):
         if amount <= 0:
             return
         if player not in self.bets:
             self.bets[player] = 0
-        self.bets[player] += amount
+            self._order[player] = len(self._order)
+        old = self.bets[player]
+        new = old + amount
+        self.bets[player] = new
+        self._total += amount
+
+        self._split_at(new)
+
+        # old < cap <= new 인 층에 새로 참여
+        prev = 0
+        for layer in self._layers:
+            if old < layer.cap <= new:
+                layer.amount += layer.cap - prev
+                layer.eligible.append(player)
+                if len(layer.eligible) > 1:
+                    layer.eligible.sort(key=self._order.__getitem__)
+            prev = layer.cap
+
+        # old 에 딱 맞춰 멈춘 플레이어가 없으면 그 경계는 더 이상 필요 없다
+        if old > 0 and old not in self.bets.values():
+            self._merge_at(old)
+
+    def _split_at(self, level):
+        prev = 0
+        for i, layer in enumerate(self._layers):
+            if layer.cap == level:
+                return
+            if layer.cap > level:
+                count = len(layer.eligible)
+                lower = PotLayer(level, (level - prev) * count, list(layer.eligible))
+                layer.amount -= lower.amount
+                self._layers.insert(i, lower)
+                return
+            prev = layer.cap
+        self._layers.append(PotLayer(level, 0, []))
+
+    def _merge_at(self, level):
+        for i, layer in enumerate(self._layers):
+            if layer.cap == level:
+                if i + 1 < len(self._layers):
+                    self._layers[i + 1].amount += layer.amount
+                    del self._layers[i]
+                return
 
     def reset(self):
         self.bets.clear()
+        self._order.clear()
+        self._total = 0
+        self._layers.clear()
 
     @property
     def total(self):
-        return sum(self.bets.values())
+        return self._total
 
     def total_chips(self):
         return self.total
 
+    @property
+    def layers(self):
+        # HUD 표시용 (읽기 전용으로 사용)
+        return self._layers
+
     def build_pots(self):
         """
         반환: (금액, 자격 있는 플레이어 목록) 튜플 리스트
         """
-        pots = []
-        remaining = self.bets.copy()
-
-        while remaining:
-            min_bet = min(remaining.values())
-            eligible = list(remaining.keys())
-
-            pot_amount = min_bet * len(eligible)
-            pots.append((pot_amount, eligible))
-
-            for p in eligible:
-                remaining[p] -= min_bet
-                if remaining[p] == 0:
-                    del remaining[p]
-
-        return pots
+        return [(layer.amount, list(layer.eligible)) for layer in self._layers]
@@ -0,0 +1,142 @@
+"""
+169가지 프리플랍 핸드 클래스의 올인 에퀴티 테이블
+
+테이블은 assets/preflop_equity.npy 에 (169, 8) float32 로 저장되어 있고,
+[클래스, 상대 수 - 1] 에 무작위 상대 1~8명 대비 에퀴티(무승부 지분 포함)가 들어 있다.
+처음 조회할 때 메모리 맵으로 한 번만 연다.
+
+테이블 재생성:
+    python -m core.preflop --samples 200000 --seed 0
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from core.card import FULL_DECK, Card
+from core.vector_eval import card_masks, evaluate_masks
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "assets", "preflop_equity.npy")
+MAX_OPPONENTS = 8
+
+_RANK_CHARS = "23456789TJQKA"
+
+_table = None
+
+
+def hand_class(c1, c2) -> int:
+    """
+    홀카드 2장 -> 클래스 인덱스 (0~168)
+    13x13 격자: 페어는 대각선, 수딧은 (높은, 낮은), 오프수트는 (낮은, 높은)
+    """
+    hi, lo = (c1.rank, c2.rank) if c1.rank >= c2.rank else (c2.rank, c1.rank)
+    hi -= 2
+    lo -= 2
+    if c1.suit == c2.suit:
+        return hi * 13 + lo
+    return lo * 13 + hi
+
+
+def class_label(index: int) -> str:
+    row, col = divmod(index, 13)
+    if row == col:
+        return _RANK_CHARS[row] * 2
+    if row > col:
+        return f"{_RANK_CHARS[row]}{_RANK_CHARS[col]}s"
+    return f"{_RANK_CHARS[col]}{_RANK_CHARS[row]}o"
+
+
+def class_hand(index: int):
+    # 클래스를 대표하는 실제 홀카드 2장
+    row, col = divmod(index, 13)
+    if row >= col:
+        second_suit = 'H' if row == col else 'S'
+        return Card(row + 2, 'S'), Card(col + 2, second_suit)
+    return Card(col + 2, 'S'), Card(row + 2, 'H')
+
+
+def class_combos(index: int) -> int:
+    row, col = divmod(index, 13)
+    if row == col:
+        return 6
+    return 4 if row > col else 12
+
+
+def load_table():
+    global _table
+    if _table is None:
+        if not os.path.exists(TABLE_PATH):
+            raise FileNotFoundError(
+                f"{TABLE_PATH} not found; generate it with: python -m core.preflop"
+            )
+        _table = np.load(TABLE_PATH, mmap_mode="r")
+    return _table
+
+
+def preflop_equity(hole_cards, opponents: int = 1) -> float:
+    """
+    홀카드 2장의 올인 에퀴티 (무작위 상대 opponents명 대비, 1~8)
+    """
+    c1, c2 = hole_cards
+    opponents = max(1, min(MAX_OPPONENTS, int(opponents)))
+    return float(load_table()[hand_class(c1, c2), opponents - 1])
+
+
+def _class_equities(index, samples, rng, batch=25000):
+    # 한 클래스에 대해 상대 1~8명 에퀴티를 같은 샘플로 동시에 추정
+    hero_cards = class_hand(index)
+    hero_mask = hero_cards[0].mask | hero_cards[1].mask
+    deck = card_masks([c for c in FULL_DECK if not c.mask & hero_mask])
+    need = 5 + 2 * MAX_OPPONENTS
+
+    totals = np.zeros(MAX_OPPONENTS)
+    done = 0
+    while done < samples:
+        n = min(batch, samples - done)
+        picks = deck[np.argsort(rng.random((n, len(deck))), axis=1)[:, :need]]
+        board = picks[:, 0] | picks[:, 1] | picks[:, 2] | picks[:, 3] | picks[:, 4]
+        hero = evaluate_masks(board | hero_mask)
+        opp = evaluate_masks(board[None, :] | picks[:, 5::2].T | picks[:, 6::2].T)
+
+        best = np.zeros(n, dtype=opp.dtype)
+        tied = np.zeros(n, dtype=np.int32)
+        for k in range(MAX_OPPONENTS):
+            s = opp[k]
+            tied = np.where(s > best, (s == hero).astype(np.int32), tied + (s == hero))
+            best = np.maximum(best, s)
+            share = np.where(hero > best, 1.0, np.where(hero == best, 1.0 / (tied + 1), 0.0))
+            totals[k] += share.sum()
+        done += n
+    return totals / samples
+
+
+def build_table(samples: int = 200000, seed: int = 0, verbose: bool = True):
+    rng = np.random.default_rng(seed)
+    table = np.zeros((169, MAX_OPPONENTS), dtype=np.float32)
+    t0 = time.perf_counter()
+    for index in range(169):
+        table[index] = _class_equities(index, samples, rng)
+        if verbose:
+            eq = " ".join(f"{v:.3f}" for v in table[index])
+            print(f"{class_label(index):<4} {eq}  ({time.perf_counter() - t0:.0f}s)")
+    return table
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build the 169-class preflop equity table")
+    ap.add_argument("--samples", type=int, default=200000, help="Monte Carlo deals per hand class")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", default=TABLE_PATH)
+    args = ap.parse_args(argv)
+
+    table = build_table(samples=args.samples, seed=args.seed)
+    np.save(args.out, table)
+    print(f"saved {args.out} {table.shape} {table.dtype}")
+
+
+if __name__ == "__main__":
+    main()
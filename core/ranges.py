@@ -0,0 +1,388 @@
+"""
+핸드 레인지 파서와 레인지 대 레인지 에퀴티
+
+레인지 표기 (쉼표 또는 공백으로 구분, 뒤에 ":가중치" 를 붙일 수 있다):
+    AA  TT+  99-66         페어 / 이상 / 구간
+    AKs  AKo  AK           수딧 / 오프수트 / 둘 다
+    ATs+  KTo+             키커만 올린다 (AT, AJ, AQ, AK)
+    A5s-A2s                같은 높은 카드, 키커 구간
+    AhKh                   특정 조합
+    any                    1326 조합 전부
+    "AKs, TT+:0.5, A5s-A2s"
+
+range_equity: 보드(0/3/4/5장)가 주어지면 남은 런아웃을 전부 (프리플랍은 샘플링) 나열하고,
+런아웃마다 점수를 순위로 바꾸고 순위별 상대 가중치 누적합으로 각 핸드의 승/무 가중치를 구한다.
+카드 제거(겹치는 조합)는 카드별 누적 가중치를 빼서 처리하므로 조합 쌍을 직접 나열하지 않는다.
+
+    python -m core.ranges "TT+, AKs, AQs" "any" --board AsKd7c
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+import numpy as np
+
+from core.canonical import EQUITY_CACHE, canonical_board, suit_permutation
+from core.card import FULL_DECK, SUITS, Card
+from core.preflop import class_label, hand_class
+from core.vector_eval import combo_masks, evaluate_masks
+
+_RANKS = "23456789TJQKA"
+_RANK_VALUE = {ch: i + 2 for i, ch in enumerate(_RANKS)}
+
+# 1326 조합: 카드 id i < j 순서. 조합 인덱스 <-> 카드 id 두 장 / 마스크
+_COMBO_C1 = np.array([i for i in range(52) for j in range(i + 1, 52)], dtype=np.int64)
+_COMBO_C2 = np.array([j for i in range(52) for j in range(i + 1, 52)], dtype=np.int64)
+_CARD_MASKS = np.array([c.mask for c in FULL_DECK], dtype=np.int64)
+_COMBO_MASK = _CARD_MASKS[_COMBO_C1] | _CARD_MASKS[_COMBO_C2]
+_COMBO_INDEX = np.full((52, 52), -1, dtype=np.int64)
+_COMBO_INDEX[_COMBO_C1, _COMBO_C2] = np.arange(len(_COMBO_C1))
+_COMBO_INDEX[_COMBO_C2, _COMBO_C1] = np.arange(len(_COMBO_C1))
+NUM_COMBOS = len(_COMBO_C1)
+_COMBO_CLASS = np.array([hand_class(FULL_DECK[i], FULL_DECK[j]) for i, j in zip(_COMBO_C1, _COMBO_C2)])
+
+
+def combo_index(c1, c2) -> int:
+    return int(_COMBO_INDEX[c1.id, c2.id])
+
+
+def combo_cards(index: int):
+    return FULL_DECK[_COMBO_C1[index]], FULL_DECK[_COMBO_C2[index]]
+
+
+def parse_cards(text):
+    # "AsKd7c" / "As Kd 7c" -> Card 목록
+    text = re.sub(r"[\s,]", "", text)
+    if len(text) % 2:
+        raise ValueError(f"cannot parse cards: {text!r}")
+    return [Card.parse(text[i:i + 2]) for i in range(0, len(text), 2)]
+
+
+def _class_combos(hi, lo, suited):
+    # hi, lo: 랭크 (2~14), suited: True | False | None(둘 다)
+    out = []
+    for c1 in FULL_DECK:
+        if c1.rank != hi:
+            continue
+        for c2 in FULL_DECK:
+            if c2.rank != lo or c2 is c1:
+                continue
+            if hi == lo and c2.id < c1.id:
+                continue
+            if suited is not None and (c1.suit == c2.suit) != suited:
+                continue
+            out.append(combo_index(c1, c2))
+    return out
+
+
+_TOKEN = re.compile(r"^([2-9TJQKA])([2-9TJQKA])([SO]?)(\+?)(?:-([2-9TJQKA])([2-9TJQKA])([SO]?))?$")
+
+
+def _token_combos(token):
+    up = token.upper()
+    if up in ("ANY", "RANDOM"):
+        return list(range(NUM_COMBOS))
+    if len(token) == 4 and token[1].lower() in "shdc" and token[3].lower() in "shdc":
+        c1, c2 = Card.parse(token[:2]), Card.parse(token[2:])
+        if c1 is c2:
+            raise ValueError(f"duplicate card in {token!r}")
+        return [combo_index(c1, c2)]
+
+    m = _TOKEN.match(up)
+    if not m:
+        raise ValueError(f"cannot parse range token: {token!r}")
+    a, b, kind, plus, a2, b2, kind2 = m.groups()
+    hi, lo = _RANK_VALUE[a], _RANK_VALUE[b]
+    if lo > hi:
+        hi, lo = lo, hi
+    suited = {"S": True, "O": False, "": None}[kind]
+    if hi == lo and kind:
+        raise ValueError(f"pairs cannot be suited or offsuit: {token!r}")
+
+    if a2 is not None:
+        if plus or kind2 != kind:
+            raise ValueError(f"bad range: {token!r}")
+        hi2, lo2 = _RANK_VALUE[a2], _RANK_VALUE[b2]
+        if hi == lo:
+            if hi2 != lo2:
+                raise ValueError(f"pair range must be pairs on both ends: {token!r}")
+            pairs = range(min(hi, hi2), max(hi, hi2) + 1)
+            return [i for r in pairs for i in _class_combos(r, r, None)]
+        if hi2 != hi:
+            raise ValueError(f"range ends must share the high card: {token!r}")
+        kickers = range(min(lo, lo2), max(lo, lo2) + 1)
+        return [i for k in kickers if k != hi for i in _class_combos(hi, k, suited)]
+
+    if plus:
+        if hi == lo:
+            return [i for r in range(hi, 15) for i in _class_combos(r, r, None)]
+        return [i for k in range(lo, hi) for i in _class_combos(hi, k, suited)]
+    return _class_combos(hi, lo, suited)
+
+
+class Range:
+    """
+    조합 인덱스 -> 가중치 (0~1). 같은 조합을 여러 번 지정하면 마지막 값이 남는다.
+    """
+    def __init__(self, weights=None):
+        self.weights = np.zeros(NUM_COMBOS, dtype=np.float64)
+        if weights:
+            for index, w in weights.items():
+                self.weights[index] = w
+
+    @classmethod
+    def parse(cls, text: str) -> Range:
+        r = cls()
+        for token in re.split(r"[,\s]+", text.strip()):
+            if not token:
+                continue
+            weight = 1.0
+            if ":" in token:
+                token, _, w = token.partition(":")
+                weight = float(w)
+                if not 0.0 <= weight <= 1.0:
+                    raise ValueError(f"weight must be between 0 and 1: {w}")
+            r.weights[_token_combos(token)] = weight
+        return r
+
+    def __len__(self):
+        return int(np.count_nonzero(self.weights))
+
+    def combos(self):
+        # ((카드1, 카드2), 가중치) 목록
+        return [(combo_cards(i), float(self.weights[i])) for i in np.flatnonzero(self.weights).tolist()]
+
+    def live(self, dead_mask: int = 0):
+        # dead 카드와 겹치지 않는 조합 인덱스와 가중치
+        idx = np.flatnonzero((self.weights > 0) & ((_COMBO_MASK & dead_mask) == 0))
+        return idx, self.weights[idx]
+
+    def class_key(self):
+        # 클래스 안 조합 가중치가 모두 같으면 (무늬 대칭 레인지) 클래스별 가중치 bytes, 아니면 None
+        lo = np.full(169, np.inf)
+        hi = np.full(169, -np.inf)
+        np.minimum.at(lo, _COMBO_CLASS, self.weights)
+        np.maximum.at(hi, _COMBO_CLASS, self.weights)
+        if not np.array_equal(lo, hi):
+            return None
+        return hi.tobytes()
+
+    def __repr__(self):
+        return f"Range({len(self)} combos, weight {self.weights.sum():.1f})"
+
+
+def as_range(r) -> Range:
+    return r if isinstance(r, Range) else Range.parse(r)
+
+
+class RangeEquityResult:
+    def __init__(self, equity, win, tie, runouts, exact, elapsed, combos, combo_win, combo_tie, combo_total):
+        # 영웅 레인지의 에퀴티 (무승부 지분 포함), 상대 레인지는 1 - equity
+        self.equity = equity
+        self.win = win
+        self.tie = tie
+        self.runouts = runouts
+        self.exact = exact
+        self.elapsed = elapsed
+        # 영웅 조합별 (가중) 승 / 무 / 전체 상대 가중치 합
+        self.combos = combos
+        self.combo_win = combo_win
+        self.combo_tie = combo_tie
+        self.combo_total = combo_total
+
+    def combo_equity(self):
+        # 조합 인덱스 -> 에퀴티
+        total = np.where(self.combo_total > 0, self.combo_total, 1.0)
+        eq = (self.combo_win + 0.5 * self.combo_tie) / total
+        return {int(i): float(e) for i, e, t in zip(self.combos, eq, self.combo_total) if t > 0}
+
+    def by_class(self):
+        # 핸드 클래스 라벨 ("AKs") -> 에퀴티, 레인지 튜닝용
+        acc = {}
+        for i, w, t, n in zip(self.combos.tolist(), self.combo_win, self.combo_tie, self.combo_total):
+            if n <= 0:
+                continue
+            label = class_label(hand_class(*combo_cards(i)))
+            a = acc.setdefault(label, [0.0, 0.0])
+            a[0] += w + 0.5 * t
+            a[1] += n
+        return {k: v[0] / v[1] for k, v in acc.items()}
+
+    def relabel(self, perm, elapsed):
+        # perm: 결과의 무늬 인덱스 -> 돌려줄 무늬 인덱스. 조합 인덱스만 바꾼 새 결과
+        # (캐시된 결과와 배열을 공유하지 않도록 복사한다)
+        card_map = np.array([perm[c // 13] * 13 + c % 13 for c in range(52)])
+        combos = _COMBO_INDEX[card_map[_COMBO_C1[self.combos]], card_map[_COMBO_C2[self.combos]]]
+        return RangeEquityResult(self.equity, self.win, self.tie, self.runouts, self.exact, elapsed,
+                                 combos, self.combo_win.copy(), self.combo_tie.copy(), self.combo_total.copy())
+
+    def __repr__(self):
+        kind = "exact" if self.exact else "sampled"
+        return (f"RangeEquityResult(equity={self.equity:.4f}, win={self.win:.4f}, tie={self.tie:.4f}, "
+                f"runouts={self.runouts} {kind}, {self.elapsed * 1000:.0f}ms)")
+
+
+def _runouts(board, board_mask, samples, rng):
+    need = 5 - len(board)
+    remaining = [c for c in FULL_DECK if not c.mask & board_mask]
+    if need == 0:
+        return np.zeros(1, dtype=np.int64), True
+    if len(board) >= 3:
+        return combo_masks(_CARD_MASKS[[c.id for c in remaining]], need), True
+    # 프리플랍: 런아웃이 너무 많으므로 무작위 보드를 샘플링
+    rng = rng or random
+    out = np.empty(samples, dtype=np.int64)
+    for k in range(samples):
+        m = 0
+        for c in rng.sample(remaining, need):
+            m |= c.mask
+        out[k] = m
+    return out, False
+
+
+def range_equity(hero, villain, board=(), samples: int = 20000, rng=None, batch: int = 32) -> RangeEquityResult:
+    """
+    hero, villain: Range 또는 레인지 문자열 (가중치 포함)
+    board: 0/3/4/5장 (Card 목록 또는 "AsKd7c")
+    samples: 프리플랍일 때 샘플링할 보드 수
+
+    두 레인지가 무늬 대칭이면 (클래스 단위 표기) 결과를 정규화한 보드 키로 EQUITY_CACHE 에 두고,
+    무늬만 다른 보드는 다시 계산하지 않고 조합 인덱스만 바꿔서 돌려준다.
+    """
+    t0 = time.perf_counter()
+    hero, villain = as_range(hero), as_range(villain)
+    board = parse_cards(board) if isinstance(board, str) else list(board)
+    if len(board) not in (0, 3, 4, 5) or len(set(board)) != len(board):
+        raise ValueError("board must be 0, 3, 4 or 5 distinct cards")
+    if not board:
+        return _range_equity(hero, villain, board, samples, rng, batch, t0)
+
+    hero_key, villain_key = hero.class_key(), villain.class_key()
+    if hero_key is None or villain_key is None:
+        return _range_equity(hero, villain, board, samples, rng, batch, t0)
+
+    perm = suit_permutation(board)
+    key = ("range", hero_key, villain_key, canonical_board(board))
+    result = EQUITY_CACHE.get(key)
+    if result is None:
+        canon = [Card(c.rank, SUITS[perm[c.bit >> 4]]) for c in board]
+        result = _range_equity(hero, villain, canon, samples, rng, batch, t0)
+        EQUITY_CACHE.put(key, result)
+    inverse = [0, 0, 0, 0]
+    for s, k in enumerate(perm):
+        inverse[k] = s
+    return result.relabel(inverse, time.perf_counter() - t0)
+
+
+def _range_equity(hero, villain, board, samples, rng, batch, t0):
+    board_mask = 0
+    for c in board:
+        board_mask |= c.mask
+
+    h_idx, h_w = hero.live(board_mask)
+    v_idx, v_w = villain.live(board_mask)
+    if not len(h_idx) or not len(v_idx):
+        raise ValueError("a range has no combos left after removing board cards")
+    runouts, exact = _runouts(board, board_mask, samples, rng)
+
+    # 두 레인지 조합의 합집합만 평가하고 각 레인지는 그 열을 골라 쓴다
+    union = np.union1d(h_idx, v_idx)
+    h_col = np.searchsorted(union, h_idx)
+    v_col = np.searchsorted(union, v_idx)
+    union_masks = _COMBO_MASK[union] | board_mask
+    h_masks, v_masks = _COMBO_MASK[h_idx], _COMBO_MASK[v_idx]
+    hc1, hc2 = _COMBO_C1[h_idx], _COMBO_C2[h_idx]
+    vc1, vc2 = _COMBO_C1[v_idx], _COMBO_C2[v_idx]
+    # 영웅 조합과 똑같은 상대 조합의 위치 (없으면 -1)
+    v_pos = np.full(NUM_COMBOS, -1, dtype=np.int64)
+    v_pos[v_idx] = np.arange(len(v_idx))
+    same = v_pos[h_idx]
+    has_same = same >= 0
+    same = np.where(has_same, same, 0)
+
+    win = np.zeros(len(h_idx))
+    tie = np.zeros(len(h_idx))
+    total = np.zeros(len(h_idx))
+
+    for start in range(0, len(runouts), batch):
+        rb = runouts[start:start + batch]
+        b = len(rb)
+        rows = np.arange(b)[:, None]
+        scores = evaluate_masks(rb[:, None] | union_masks[None, :])
+        wh = np.where((rb[:, None] & h_masks[None, :]) == 0, h_w, 0.0)
+        wv = np.where((rb[:, None] & v_masks[None, :]) == 0, v_w, 0.0)
+
+        # 런아웃별로 점수를 0부터 촘촘한 순위로 바꾼다 (같은 점수 = 같은 순위)
+        order = np.argsort(scores, axis=1)
+        ranked = np.take_along_axis(scores, order, axis=1)
+        dense = np.zeros(scores.shape, dtype=np.int64)
+        np.cumsum(ranked[:, 1:] != ranked[:, :-1], axis=1, out=dense[:, 1:])
+        rank = np.empty_like(dense)
+        np.put_along_axis(rank, order, dense, axis=1)
+        k = int(dense[:, -1].max()) + 2
+        rh = rank[:, h_col]
+        rv = rank[:, v_col]
+
+        # 순위별 상대 가중치의 누적합: 전체 / 카드별 (cum[.., r] = 순위 r 미만 합)
+        flat = rows * k + rv
+        cum = np.zeros((b, k))
+        cum[:, 1:] = np.bincount(flat.ravel(), wv.ravel(), minlength=b * k).reshape(b, k)[:, :-1]
+        np.cumsum(cum, axis=1, out=cum)
+        card_flat = np.concatenate([(rows * 52 + vc1) * k + rv, (rows * 52 + vc2) * k + rv], axis=1)
+        per_card = np.zeros((b, 52, k))
+        per_card[:, :, 1:] = np.bincount(card_flat.ravel(), np.concatenate([wv, wv], axis=1).ravel(),
+                                         minlength=b * 52 * k).reshape(b, 52, k)[:, :, :-1]
+        np.cumsum(per_card, axis=2, out=per_card)
+
+        # 겹치는 조합 제외: 영웅 카드 두 장 중 하나라도 가진 상대 조합을 빼고, 두 번 빠진 같은 조합은 되돌린다
+        same_w = np.where(has_same, wv[:, same], 0.0)
+        below = cum[rows, rh] - per_card[rows, hc1, rh] - per_card[rows, hc2, rh]
+        upto = cum[rows, rh + 1] - per_card[rows, hc1, rh + 1] - per_card[rows, hc2, rh + 1] + same_w
+        alive = cum[:, -1:] - per_card[rows, hc1, -1] - per_card[rows, hc2, -1] + same_w
+
+        win += (wh * below).sum(axis=0)
+        tie += (wh * (upto - below)).sum(axis=0)
+        total += (wh * alive).sum(axis=0)
+
+    weight = total.sum()
+    if weight <= 0:
+        raise ValueError("ranges never meet (every combo pair shares a card)")
+    w, t = win.sum() / weight, tie.sum() / weight
+    return RangeEquityResult(
+        equity=w + 0.5 * t,
+        win=w,
+        tie=t,
+        runouts=len(runouts),
+        exact=exact,
+        elapsed=time.perf_counter() - t0,
+        combos=h_idx,
+        combo_win=win,
+        combo_tie=tie,
+        combo_total=total,
+    )
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Range vs range equity")
+    ap.add_argument("hero", help='e.g. "TT+, AKs, A5s-A2s:0.5"')
+    ap.add_argument("villain")
+    ap.add_argument("--board", default="", help="e.g. AsKd7c")
+    ap.add_argument("--samples", type=int, default=20000, help="random boards when preflop")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--classes", action="store_true", help="print hero equity per hand class")
+    args = ap.parse_args(argv)
+
+    result = range_equity(args.hero, args.villain, args.board, samples=args.samples,
+                          rng=random.Random(args.seed))
+    print(result)
+    print(f"hero {result.equity * 100:.2f}%  villain {(1 - result.equity) * 100:.2f}%")
+    if args.classes:
+        for label, eq in sorted(result.by_class().items(), key=lambda kv: -kv[1]):
+            print(f"  {label:<5}{eq * 100:7.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+핸드 히스토리 재생
+
+HandLog: 로그와 사이드카 인덱스를 메모리 맵으로 열어서 N번째 핸드로 바로 이동한다 (선형 스캔 없음).
+ReplayGame: 기록된 카드와 행동을 엔진에 다시 넣어 핸드를 재현한다. 카드는 스크립트 덱으로,
+행동은 좌석별 스크립트 AI로 공급하므로 베팅/사이드팟/쇼다운 계산은 실제 엔진이 다시 한다.
+GUI 재생은 ui.qt_game.QtReplayGame 을 사용한다.
+
+    python -m core.replay hands.log --hand 1234
+    python -m core.replay hands.log --hand 0 --count 100000 --verify
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import sys
+import time
+
+from core.card import FULL_DECK
+from core.deck import Deck
+from core.game import DEFAULT_PACING, HoldemGame
+from core.hand_evaluator import hand_name
+from core.history import (
+    INDEX_MAGIC, MAGIC, Action, Blind, Board, Deal, HandEnd, HandStart, Payout, Showdown,
+    build_index, decode_event, index_path,
+)
+from core.human_action import HumanAction
+from players.player import Player
+
+
+class HandLog:
+    """
+    읽기 전용 핸드 로그. log[n] 은 n번째 핸드의 이벤트 목록.
+    인덱스가 없거나 로그보다 뒤처져 있으면 열 때 뒷부분만 스캔해서 맞춘다.
+    """
+    def __init__(self, path):
+        self.path = path
+        build_index(path)
+
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a hand history log")
+
+        self._index_file = open(index_path(path), "rb")
+        if os.path.getsize(index_path(path)) > len(INDEX_MAGIC):
+            self._index_mm = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            body = memoryview(self._index_mm)[len(INDEX_MAGIC):]
+            self._offsets = body[:len(body) - len(body) % 8].cast("Q")
+        else:
+            self._index_mm = None
+            self._offsets = ()
+        if sys.byteorder != "little":
+            raise RuntimeError("hand history index is little-endian")
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def offset(self, n: int) -> int:
+        return self._offsets[n]
+
+    def __getitem__(self, n: int):
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError(f"hand {n} out of range (log has {len(self)} hands)")
+        mm = self._mm
+        off = self._offsets[n]
+        stop = self._offsets[n + 1] if n + 1 < len(self) else len(mm)
+        events = []
+        while off < stop:
+            ev, off = decode_event(mm, off)
+            events.append(ev)
+            if isinstance(ev, HandEnd):
+                break
+        return events
+
+    def hands(self, start: int = 0, stop: int | None = None):
+        stop = len(self) if stop is None else min(stop, len(self))
+        for n in range(start, stop):
+            yield self[n]
+
+    def close(self):
+        # memoryview 를 먼저 놓아야 mmap 을 닫을 수 있다
+        offsets = getattr(self, "_offsets", None)
+        if isinstance(offsets, memoryview):
+            offsets.release()
+        self._offsets = ()
+        if getattr(self, "_index_mm", None) is not None:
+            self._index_mm.close()
+            self._index_mm = None
+        if getattr(self, "_index_file", None) is not None:
+            self._index_file.close()
+            self._index_file = None
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def describe(events) -> list[str]:
+    # 이벤트 목록 -> 사람이 읽는 한 줄씩
+    names = []
+    lines = []
+    for ev in events:
+        if isinstance(ev, HandStart):
+            names = ev.names
+            stacks = ", ".join(f"{n} {c}" for n, c in zip(ev.names, ev.chips))
+            lines.append(f"Hand #{ev.hand}  dealer {names[ev.dealer]}  BB {ev.big_blind}  ({stacks})")
+        elif isinstance(ev, Blind):
+            lines.append(f"{names[ev.seat]} POSTS {'BB' if ev.big else 'SB'} {ev.amount}")
+        elif isinstance(ev, Deal):
+            lines.append(f"{names[ev.seat]} dealt {ev.cards[0]!r} {ev.cards[1]!r}")
+        elif isinstance(ev, Action):
+            amount = f" {ev.amount}" if ev.amount else ""
+            lines.append(f"{names[ev.seat]} {ev.action.upper()}{amount}")
+        elif isinstance(ev, Board):
+            lines.append(f"*** {ev.street.upper()} *** " + " ".join(repr(c) for c in ev.cards))
+        elif isinstance(ev, Showdown):
+            lines.append(f"{names[ev.seat]} shows {ev.cards[0]!r} {ev.cards[1]!r} ({hand_name(ev.score)})")
+        elif isinstance(ev, Payout):
+            lines.append(f"{names[ev.seat]} wins {ev.amount}")
+        elif isinstance(ev, HandEnd):
+            lines.append("stacks: " + ", ".join(f"{n} {c}" for n, c in zip(names, ev.chips)))
+    return lines
+
+
+class ScriptDeck(Deck):
+    """
+    정해진 순서대로 나오는 덱. set_order(cards) 의 첫 카드가 첫 draw().
+    """
+    def __init__(self):
+        self._order = list(FULL_DECK)
+        super().__init__()
+
+    def set_order(self, cards):
+        used = set(cards)
+        # 스크립트 뒤에는 쓰지 않은 카드를 채워 둔다 (번 카드 등)
+        self._order = list(cards) + [c for c in FULL_DECK if c not in used]
+
+    def reset(self):
+        self.cards = self._order[::-1]
+
+    def shuffle(self):
+        pass
+
+
+class ScriptedAI:
+    # 기록된 좌석 행동을 순서대로 돌려준다
+    def __init__(self, actions):
+        self.actions = list(actions)
+        self.pos = 0
+
+    def decide(self, player, to_call, big_blind, view=None):
+        if self.pos >= len(self.actions):
+            # 기록보다 엔진이 더 묻는다 = 재현이 어긋남
+            self.pos += 1
+            return ("check", 0) if to_call == 0 else ("fold", 0)
+        action, amount = self.actions[self.pos]
+        self.pos += 1
+        if action == "call" and amount != min(to_call, player.chips):
+            # 콜 금액이 엔진 계산과 다르게 기록된 경우 넣은 칩을 그대로 재현한다
+            return ("raise", amount)
+        return (action, amount)
+
+
+def _deal_order(start: HandStart, deals, boards):
+    # deal_hole_cards / deal_flop / turn / river 가 draw 하는 순서대로 카드를 나열한다
+    hole = {d.seat: d.cards for d in deals}
+    order = []
+    for k in range(2):
+        for seat in range(len(start.names)):
+            if seat in hole:
+                order.append(hole[seat][k])
+    board = [c for b in boards for c in b.cards]
+    if not board:
+        return order
+
+    used = set(order) | set(board)
+    burns = iter(c for c in FULL_DECK if c not in used)
+    for i, card in enumerate(board):
+        if i in (0, 3, 4):
+            order.append(next(burns))
+        order.append(card)
+    return order
+
+
+class ReplayMixin:
+    """
+    HoldemGame (또는 QtHoldemGame) 에 섞어서 기록된 핸드를 순서대로 재현한다.
+    load() 로 핸드 이벤트 목록들을 넣고 start() 하면 new_hand() 마다 다음 기록을 꺼낸다.
+    """
+    def setup_replay(self):
+        self.deck = ScriptDeck()
+        self._feed = iter(())
+        self._expected = None
+        self._scripts = {}
+        self.replayed = 0
+        # (종류, 핸드 번호, 좌석, 기록 값, 재현 값)
+        #   "chips": 핸드 끝 칩, "actions": 좌석이 쓴 기록 액션 수 (다 쓰지 않았으면 불일치)
+        self.mismatches = []
+        self.history = None
+
+    def load(self, hands):
+        # hands: 이벤트 목록들의 iterable (HandLog.hands(...) 등)
+        self._feed = iter(hands)
+
+    def set_speed(self, speed: float):
+        # speed: 1.0 = GUI 기본 속도, 0 이하 = 지연 없음
+        if speed <= 0:
+            self.set_pacing(False)
+            return
+        self.set_pacing(True, **{k: int(v / speed) for k, v in DEFAULT_PACING.items()})
+
+    def _next_hand_events(self):
+        for events in self._feed:
+            if events and isinstance(events[0], HandStart) and isinstance(events[-1], HandEnd):
+                return events
+        return None
+
+    def _prepare(self, events):
+        start = events[0]
+        deals = [e for e in events if isinstance(e, Deal)]
+        boards = [e for e in events if isinstance(e, Board)]
+        actions = {}
+        for e in events:
+            if isinstance(e, Action):
+                actions.setdefault(e.seat, []).append((e.action, e.amount))
+
+        if len(self.players) != len(start.names):
+            self.players = [Player(name, chips=0) for name in start.names]
+        self._scripts = {}
+        for seat, (p, name, chips) in enumerate(zip(self.players, start.names, start.chips)):
+            p.name = name
+            p.chips = chips
+            p.busted = chips <= 0
+            p.ai = self._scripts[seat] = ScriptedAI(actions.get(seat, ()))
+
+        self.big_blind = start.big_blind
+        self.small_blind = max(1, start.big_blind // 2)
+        self.dealer_index = start.dealer
+        self.deck.set_order(_deal_order(start, deals, boards))
+        self._expected = events[-1]
+
+    def new_hand(self):
+        events = self._next_hand_events()
+        if events is None:
+            self.game_over = True
+            self.stop()
+            if self.gui:
+                self.gui.poker_screen.set_actions_enabled(False)
+                self.gui.poker_screen.set_status_text("Replay finished")
+            return
+        self._prepare(events)
+        super().new_hand()
+        # 재생에서는 모든 카드를 공개한다
+        self.reveal_ai = True
+        self._refresh_ui(to_call=0)
+
+    def end_hand(self):
+        for p in self.players:
+            if p.chips <= 0:
+                p.busted = True
+                p.folded = True
+                p.all_in = True
+
+        expected = self._expected
+        for seat, (p, chips) in enumerate(zip(self.players, expected.chips)):
+            if p.chips != chips:
+                self.mismatches.append(("chips", expected.hand, seat, chips, p.chips))
+        for seat, script in self._scripts.items():
+            if script.pos != len(script.actions):
+                self.mismatches.append(("actions", expected.hand, seat, len(script.actions), script.pos))
+
+        self.replayed += 1
+        self.hands_played += 1
+        self.hand_over = True
+        if self.gui:
+            self.gui.poker_screen.set_status_text(f"Replay: hand #{expected.hand}")
+            self.gui.poker_screen.update_stats(self.stats, self.players)
+        self._schedule_next_hand(delay_ms=self.delay_ms("next_hand"))
+
+
+class ReplayGame(ReplayMixin, HoldemGame):
+    """
+    헤드리스 재생 엔진
+
+        game = ReplayGame()
+        game.load(log.hands(100, 200))
+        game.run()
+    """
+    def __init__(self, verbose=False):
+        super().__init__(HumanAction(), verbose=verbose)
+        self.setup_replay()
+        self.set_pacing(False)
+
+    def run(self, max_steps: int = 10000):
+        self.start()
+        while not self.game_over:
+            self.run_hand(max_steps=max_steps)
+        return self.replayed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Inspect or re-run recorded hand histories")
+    ap.add_argument("log")
+    ap.add_argument("--hand", type=int, default=0, help="index of the first hand in the log")
+    ap.add_argument("--count", type=int, default=1)
+    ap.add_argument("--verify", action="store_true", help="re-run the hands through the engine and compare stacks")
+    args = ap.parse_args(argv)
+
+    with HandLog(args.log) as log:
+        print(f"{args.log}: {len(log)} hands")
+        if not args.verify:
+            for events in log.hands(args.hand, args.hand + args.count):
+                print("\n".join(describe(events)))
+                print()
+            return
+
+        game = ReplayGame()
+        game.load(log.hands(args.hand, args.hand + args.count))
+        t0 = time.perf_counter()
+        replayed = game.run()
+        elapsed = time.perf_counter() - t0
+        print(f"replayed {replayed} hands in {elapsed:.2f}s ({replayed / max(elapsed, 1e-9):,.0f} hands/sec), "
+              f"mismatches: {len(game.mismatches)}")
+        for m in game.mismatches[:20]:
+            print("  %s: hand #%d seat %d: recorded %d, replayed %d" % m)
+
+
+if __name__ == "__main__":
+    main()
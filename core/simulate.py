@@ -0,0 +1,234 @@
+"""
+AI 셀프 플레이 배치 시뮬레이터
+
+    python -m core.simulate --seats hard,normal,easy --hands 100000
+    python -m core.simulate --seats hard,hard,easy --tournaments 200
+
+헤드리스 HoldemGame 엔진을 그대로 돌리므로 베팅/사이드팟/쇼다운 로직은 GUI와 동일하다.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from collections import Counter
+
+from core.game import HoldemGame
+from core.history import HistoryTee, HistoryWriter
+from core.hand_evaluator import hand_name
+from core.human_action import HumanAction
+
+DIFFICULTIES = ("easy", "normal", "hard", "expert", "adaptive")
+
+
+class SimResult:
+    def __init__(self, seats, big_blind):
+        # seats: 좌석 라벨 목록 ("AI1:hard")
+        self.seats = list(seats)
+        self.big_blind = big_blind
+        n = len(self.seats)
+
+        self.hands = 0
+        self.seconds = 0.0
+
+        # 좌석별 핸드당 순이익 합 / 제곱합 (EV, 표준오차)
+        self.net = [0] * n
+        self.net_sq = [0] * n
+
+        self.showdowns = 0
+        self.fold_wins = 0
+        # 쇼다운 승리 족보 분포
+        self.categories = Counter()
+
+        self.tournaments = 0
+        self.unfinished = 0
+        self.tournament_wins = [0] * n
+
+    def add_hand(self, nets, winning_category=None):
+        self.hands += 1
+        for i, v in enumerate(nets):
+            self.net[i] += v
+            self.net_sq[i] += v * v
+        if winning_category is None:
+            self.fold_wins += 1
+        else:
+            self.showdowns += 1
+            self.categories[winning_category] += 1
+
+    def merge(self, other: SimResult):
+        if other.seats != self.seats:
+            raise ValueError("cannot merge results from different seat layouts")
+        self.hands += other.hands
+        self.seconds = max(self.seconds, other.seconds)
+        for i in range(len(self.seats)):
+            self.net[i] += other.net[i]
+            self.net_sq[i] += other.net_sq[i]
+            self.tournament_wins[i] += other.tournament_wins[i]
+        self.showdowns += other.showdowns
+        self.fold_wins += other.fold_wins
+        self.categories.update(other.categories)
+        self.tournaments += other.tournaments
+        self.unfinished += other.unfinished
+        return self
+
+    def ev(self, seat: int) -> float:
+        return self.net[seat] / self.hands if self.hands else 0.0
+
+    def ev_stderr(self, seat: int) -> float:
+        if self.hands < 2:
+            return 0.0
+        mean = self.ev(seat)
+        var = (self.net_sq[seat] - self.hands * mean * mean) / (self.hands - 1)
+        return math.sqrt(max(0.0, var) / self.hands)
+
+    def report(self) -> str:
+        lines = []
+        rate = self.hands / self.seconds if self.seconds > 0 else 0.0
+        lines.append(f"hands: {self.hands}  time: {self.seconds:.2f}s  hands/sec: {rate:,.0f}")
+
+        lines.append("")
+        lines.append(f"{'seat':<12}{'EV/hand':>10}{'±':>8}{'bb/100':>10}{'wins':>8}")
+        for i, label in enumerate(self.seats):
+            ev = self.ev(i)
+            bb100 = ev / self.big_blind * 100 if self.big_blind else 0.0
+            wins = self.tournament_wins[i] if self.tournaments else "-"
+            lines.append(f"{label:<12}{ev:>10.2f}{self.ev_stderr(i):>8.2f}{bb100:>10.1f}{wins:>8}")
+
+        if self.tournaments:
+            lines.append("")
+            lines.append(f"tournaments: {self.tournaments}  unfinished: {self.unfinished}")
+
+        lines.append("")
+        total = self.showdowns + self.fold_wins
+        sd_pct = self.showdowns / total * 100 if total else 0.0
+        lines.append(f"showdowns: {self.showdowns} ({sd_pct:.1f}%)  won without showdown: {self.fold_wins}")
+        for name, cnt in self.categories.most_common():
+            lines.append(f"  {name:<16}{cnt:>10}{cnt / self.showdowns * 100:>8.2f}%")
+        return "\n".join(lines)
+
+
+class Simulator:
+    def __init__(self, difficulties, start_chips: int = 500, bb: int = 20, seed=None):
+        self.difficulties = [d.lower() for d in difficulties]
+        for d in self.difficulties:
+            if d not in DIFFICULTIES:
+                raise ValueError(f"unknown difficulty: {d}")
+        # 시드별 독립 RNG: 같은 시드면 같은 결과
+        self.rng = random.Random(seed)
+
+        self.game = HoldemGame(HumanAction(), verbose=False, rng=self.rng)
+        self.game.configure(ai_count=len(self.difficulties), difficulty=self.difficulties,
+                            start_chips=start_chips, bb=bb, human=False)
+        self.start_chips = self.game.players[0].chips
+
+    def new_result(self) -> SimResult:
+        seats = [f"{p.name}:{d}" for p, d in zip(self.game.players, self.difficulties)]
+        return SimResult(seats, self.game.big_blind)
+
+    def _winning_category(self):
+        g = self.game
+        if not g.showdown_scores:
+            return None
+        best = max(g.showdown_scores.values())
+        return hand_name(best)
+
+    def play_hands(self, n: int, result: SimResult | None = None) -> SimResult:
+        # 매 핸드 스택을 start_chips 로 되돌리는 캐시 게임 방식
+        g = self.game
+        result = result or self.new_result()
+        t0 = time.perf_counter()
+        for _ in range(n):
+            g.reset_stacks(self.start_chips)
+            g.run_hand()
+            nets = [p.chips - self.start_chips for p in g.players]
+            result.add_hand(nets, self._winning_category())
+        result.seconds += time.perf_counter() - t0
+        return result
+
+    def play_tournaments(self, n: int, max_hands: int = 10000, result: SimResult | None = None) -> SimResult:
+        # 한 명만 남을 때까지 (또는 max_hands) 진행, 핸드별 칩 변동도 EV에 반영
+        g = self.game
+        result = result or self.new_result()
+        t0 = time.perf_counter()
+        for _ in range(n):
+            g.reset_stacks(self.start_chips)
+            g.start()
+            for _ in range(max_hands):
+                before = [p.chips for p in g.players]
+                if not g.run_hand():
+                    break
+                nets = [p.chips - b for p, b in zip(g.players, before)]
+                result.add_hand(nets, self._winning_category())
+                if g.game_over:
+                    break
+
+            result.tournaments += 1
+            if g.game_over:
+                for i, p in enumerate(g.players):
+                    if p.name == g.winner:
+                        result.tournament_wins[i] += 1
+            else:
+                result.unfinished += 1
+        result.seconds += time.perf_counter() - t0
+        return result
+
+
+def parse_seats(text: str) -> list[str]:
+    seats = [s.strip().lower() for s in text.split(",") if s.strip()]
+    if not 2 <= len(seats) <= 5:
+        raise argparse.ArgumentTypeError("need 2-5 seats")
+    for s in seats:
+        if s not in DIFFICULTIES:
+            raise argparse.ArgumentTypeError(f"unknown difficulty: {s}")
+    return seats
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(description="Holdem AI self-play simulator")
+    ap.add_argument("--seats", type=parse_seats, default=["hard", "normal", "easy"],
+                    help="comma separated difficulties, e.g. hard,normal,easy")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--hands", type=int, default=None, help="play N independent hands (stacks reset every hand)")
+    mode.add_argument("--tournaments", type=int, default=None, help="play N freezeouts to a single winner")
+    ap.add_argument("--max-hands", type=int, default=10000, help="hand cap per tournament")
+    ap.add_argument("--chips", type=int, default=500)
+    ap.add_argument("--bb", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--history", default=None, help="append hand histories to this binary log")
+    ap.add_argument("--export", default=None, metavar="DIR", help="stream hand rows to columnar part files")
+    return ap
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    sim = Simulator(args.seats, start_chips=args.chips, bb=args.bb, seed=args.seed)
+    writer = HistoryWriter(args.history) if args.history else None
+    exporter = None
+    if args.export:
+        from core.export import ColumnarExporter
+        labels = {p.name: d for p, d in zip(sim.game.players, sim.difficulties)}
+        exporter = ColumnarExporter(args.export, labels=labels)
+    if writer is not None or exporter is not None:
+        sim.game.set_history(HistoryTee(writer, exporter))
+    try:
+        if args.tournaments:
+            result = sim.play_tournaments(args.tournaments, max_hands=args.max_hands)
+        else:
+            result = sim.play_hands(args.hands or 10000)
+    finally:
+        if writer is not None:
+            writer.close()
+        if exporter is not None:
+            exporter.close()
+    print(result.report())
+    if writer is not None:
+        print(f"history: {writer.hands_written} hands, {writer.bytes_written:,} bytes, {writer.fsyncs} fsyncs"
+              + (f", {writer.hands_dropped} dropped" if writer.hands_dropped else ""))
+    if exporter is not None:
+        print(f"export: {exporter.rows_written} rows in {exporter.parts} {exporter.format} parts")
+    return result
+
+
+if __name__ == "__main__":
+    main()
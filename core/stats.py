@@ -0,0 +1,135 @@
+"""
+플레이어 통계 (VPIP / PFR / AF / WTSD 등)
+
+엔진이 카드 딜, 액션, 플랍, 쇼다운 시점에 StatsTracker 를 부르면 카운터 몇 개만 증가시킨다.
+핸드 히스토리를 다시 훑지 않으므로 세션 길이와 상관없이 액션당 O(1)이다.
+통계는 플레이어 이름 기준이며 HUD(PokerWindow) 와 AI(TableView.stats) 가 같이 읽는다.
+"""
+from __future__ import annotations
+
+
+class PlayerStats:
+    __slots__ = (
+        "hands", "vpip_hands", "pfr_hands", "saw_flop", "showdowns", "showdown_wins",
+        "bets", "calls", "checks", "folds", "faced_raise", "folded_to_raise",
+        "_vpip", "_pfr",
+    )
+
+    def __init__(self):
+        self.hands = 0
+        self.vpip_hands = 0
+        self.pfr_hands = 0
+        self.saw_flop = 0
+        self.showdowns = 0
+        self.showdown_wins = 0
+        # 플랍 이후 공격적 액션(벳/레이즈) / 콜 (AF 계산용)
+        self.bets = 0
+        self.calls = 0
+        self.checks = 0
+        self.folds = 0
+        # 레이즈(프리플랍은 BB 초과 베팅, 이후는 벳)에 직면한 횟수와 그때 폴드한 횟수
+        self.faced_raise = 0
+        self.folded_to_raise = 0
+        # 이번 핸드에 이미 센 플래그
+        self._vpip = False
+        self._pfr = False
+
+    @staticmethod
+    def _ratio(a, b):
+        return a / b if b else 0.0
+
+    @property
+    def vpip(self) -> float:
+        return self._ratio(self.vpip_hands, self.hands)
+
+    @property
+    def pfr(self) -> float:
+        return self._ratio(self.pfr_hands, self.hands)
+
+    @property
+    def af(self) -> float:
+        # 콜이 없으면 벳 횟수 그대로 (0으로 나누지 않음)
+        return self.bets / self.calls if self.calls else float(self.bets)
+
+    @property
+    def wtsd(self) -> float:
+        return self._ratio(self.showdowns, self.saw_flop)
+
+    @property
+    def wsd(self) -> float:
+        return self._ratio(self.showdown_wins, self.showdowns)
+
+    @property
+    def fold_to_raise(self) -> float:
+        return self._ratio(self.folded_to_raise, self.faced_raise)
+
+    def hud_text(self) -> str:
+        if not self.hands:
+            return "no hands yet"
+        return (f"{self.hands} hands  VPIP {self.vpip * 100:.0f}  PFR {self.pfr * 100:.0f}  "
+                f"AF {self.af:.1f}  WTSD {self.wtsd * 100:.0f}  F2R {self.fold_to_raise * 100:.0f}")
+
+    def __repr__(self):
+        return (f"PlayerStats(hands={self.hands}, vpip={self.vpip:.3f}, pfr={self.pfr:.3f}, "
+                f"af={self.af:.2f}, wtsd={self.wtsd:.3f})")
+
+
+class StatsTracker:
+    def __init__(self):
+        self.players: dict[str, PlayerStats] = {}
+
+    def get(self, name) -> PlayerStats:
+        s = self.players.get(name)
+        if s is None:
+            s = self.players[name] = PlayerStats()
+        return s
+
+    def reset(self):
+        self.players.clear()
+
+    def start_hand(self, players):
+        # 카드를 받은 플레이어만 센다
+        for p in players:
+            if p.hole_cards:
+                s = self.get(p.name)
+                s.hands += 1
+                s._vpip = s._pfr = False
+
+    def on_action(self, player, action, put, bet_before, preflop, big_blind):
+        """
+        action: 실제로 처리된 액션 (fold | check | call | raise), put: 넣은 칩
+        bet_before: 액션 직전 테이블 최고 베팅
+        """
+        s = self.get(player.name)
+        if bet_before > (big_blind if preflop else 0):
+            s.faced_raise += 1
+            if action == "fold":
+                s.folded_to_raise += 1
+
+        if action == "fold":
+            s.folds += 1
+        elif action == "check":
+            s.checks += 1
+        elif preflop:
+            if put > 0 and not s._vpip:
+                s._vpip = True
+                s.vpip_hands += 1
+            if action == "raise" and not s._pfr:
+                s._pfr = True
+                s.pfr_hands += 1
+        elif action == "raise":
+            s.bets += 1
+        elif action == "call":
+            s.calls += 1
+
+    def on_flop(self, players):
+        for p in players:
+            if not p.folded and p.hole_cards:
+                self.get(p.name).saw_flop += 1
+
+    def on_showdown(self, active, winners):
+        for p in active:
+            s = self.get(p.name)
+            s.showdowns += 1
+            if p in winners:
+                s.showdown_wins += 1
@@ -0,0 +1,38 @@
+class TableView:
+    """
+    AI에게 넘기는 공개 테이블 정보 (다른 플레이어 홀카드는 포함하지 않음)
+    """
+    __slots__ = (
+        "street", "board", "pot", "to_call", "current_bet", "min_raise",
+        "big_blind", "opponents", "stacks", "seat", "dealer_index",
+        "live", "aggressor", "stats",
+    )
+
+    def __init__(self, street, board, pot, to_call, current_bet, min_raise,
+                 big_blind, opponents, stacks, seat, dealer_index,
+                 live=(), aggressor=None, stats=None):
+        # street: "preflop" | "flop" | "turn" | "river"
+        self.street = street
+        self.board = board
+        self.pot = pot
+        self.to_call = to_call
+        self.current_bet = current_bet
+        self.min_raise = min_raise
+        self.big_blind = big_blind
+        # 폴드하지 않은 상대 수
+        self.opponents = opponents
+        # 플레이어 이름 -> 남은 칩
+        self.stacks = stacks
+        self.seat = seat
+        self.dealer_index = dealer_index
+        # 폴드하지 않은 상대 이름들, 이번 스트리트 마지막 레이저 이름 (없으면 None)
+        self.live = live
+        self.aggressor = aggressor
+        # core.stats.StatsTracker (상대 모델링용, 읽기 전용)
+        self.stats = stats
+
+    def pot_odds(self) -> float:
+        # 콜에 필요한 최소 에퀴티
+        if self.to_call <= 0:
+            return 0.0
+        return self.to_call / (self.pot + self.to_call)
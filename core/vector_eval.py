@@ -0,0 +1,78 @@
+"""
+NumPy 벡터화 핸드 평가기
+
+hand_evaluator 의 룩업 테이블을 배열로 옮겨서 카드 마스크 배열 전체를 한 번에 평가한다.
+결과 점수는 evaluate_7cards_table / evaluate_mask 와 같은 정수 공간이다.
+"""
+from __future__ import annotations
+
+from itertools import combinations
+
+import numpy as np
+
+from core import hand_evaluator
+
+_TABLES = None
+
+
+def _tables():
+    global _TABLES
+    if _TABLES is None:
+        hand_evaluator._build_tables()
+        rank_table = hand_evaluator._RANK_TABLE
+        keys = np.array(sorted(rank_table), dtype=np.int64)
+        _TABLES = (
+            np.array(hand_evaluator._FLUSH_TABLE, dtype=np.int32),
+            np.array(hand_evaluator._SPREAD, dtype=np.int64),
+            keys,
+            np.array([rank_table[k] for k in keys.tolist()], dtype=np.int32),
+        )
+    return _TABLES
+
+
+def warm_up():
+    # 룩업 테이블을 미리 만들어 첫 평가에서 지연이 생기지 않게 한다
+    _tables()
+
+
+def evaluate_masks(masks):
+    """
+    masks: 카드 5~7장 마스크 배열 (int64, 임의 shape)
+    return: 같은 shape 의 int32 점수 배열
+    """
+    flush, spread, keys, scores = _tables()
+    m = np.asarray(masks, dtype=np.int64)
+    s0 = m & 0x1FFF
+    s1 = (m >> 16) & 0x1FFF
+    s2 = (m >> 32) & 0x1FFF
+    s3 = (m >> 48) & 0x1FFF
+
+    key = spread[s0] + spread[s1] + spread[s2] + spread[s3]
+    best = scores[np.searchsorted(keys, key)]
+    f = np.maximum(np.maximum(flush[s0], flush[s1]), np.maximum(flush[s2], flush[s3]))
+    return np.maximum(best, f)
+
+
+def card_masks(cards):
+    return np.array([c.mask for c in cards], dtype=np.int64)
+
+
+def combo_masks(masks, k):
+    """
+    masks: 카드 마스크 배열 -> k장 조합 마스크 배열 (k = 0~5)
+    """
+    masks = np.asarray(masks, dtype=np.int64)
+    n = len(masks)
+    if k == 0:
+        return np.zeros(1, dtype=np.int64)
+    if k == 1:
+        return masks.copy()
+    if k == 2:
+        i, j = np.triu_indices(n, 1)
+        return masks[i] | masks[j]
+    idx = np.fromiter((x for combo in combinations(range(n), k) for x in combo), dtype=np.intp)
+    idx = idx.reshape(-1, k)
+    out = masks[idx[:, 0]]
+    for col in range(1, k):
+        out = out | masks[idx[:, col]]
+    return out
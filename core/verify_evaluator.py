@@ -0,0 +1,301 @@
+"""
+7장 평가기 전수 검증 (C(52,7) = 133,784,560 핸드)
+
+후보 평가기가 모든 7장 조합에서 기준 구현(evaluate_7cards_combo 의 튜플 점수)과
+같은 족보 카테고리를 내고, 같은 대소 순서를 지키는지 확인한다.
+점수 값 자체가 달라도 되지만 기준 점수 -> 후보 점수 대응이 한 값으로 정해지고 순증가해야 한다.
+카테고리별 핸드 수도 알려진 값(KNOWN_TOTALS)과 비교한다.
+
+    python -m core.verify_evaluator                         # 벡터 평가기 (기본)
+    python -m core.verify_evaluator --candidate table --workers 8
+    python -m core.verify_evaluator --candidate mypkg.fast:evaluate --chunks 50
+
+작업은 앞 두 장 (a, b) 별 청크로 나눠 프로세스 풀에서 돌린다.
+기준 점수는 (랭크 멀티셋, 플러시 무늬 랭크) 가 같은 핸드끼리 같으므로 이 키마다 한 번만 조합 평가하고,
+후보 평가기는 모든 핸드에 대해 실제로 호출한다.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+
+import numpy as np
+
+from core.card import FULL_DECK, mask_to_cards
+from core.hand_evaluator import (
+    HAND_RANK_NAMES_EN, HAND_RANKS, evaluate_7cards_combo, evaluate_7cards_table, hand_category, pack_score,
+)
+from core.vector_eval import evaluate_masks
+
+TOTAL_HANDS = math.comb(52, 7)
+
+# 7장 핸드 카테고리별 개수 (로열 플러시는 스트레이트 플러시에 포함)
+KNOWN_TOTALS = {
+    HAND_RANKS["HIGH_CARD"]: 23_294_460,
+    HAND_RANKS["ONE_PAIR"]: 58_627_800,
+    HAND_RANKS["TWO_PAIR"]: 31_433_400,
+    HAND_RANKS["THREE_KIND"]: 6_461_620,
+    HAND_RANKS["STRAIGHT"]: 6_180_020,
+    HAND_RANKS["FLUSH"]: 4_047_644,
+    HAND_RANKS["FULL_HOUSE"]: 3_473_184,
+    HAND_RANKS["FOUR_KIND"]: 224_848,
+    HAND_RANKS["STRAIGHT_FLUSH"]: 41_584,
+}
+
+# 카드 id 순서 마스크 (FULL_DECK[i].id == i)
+_MASKS = np.array([c.mask for c in sorted(FULL_DECK, key=lambda c: c.id)], dtype=np.int64)
+_POPCOUNT = np.array([bin(m).count("1") for m in range(1 << 13)], dtype=np.int8)
+_SPREAD = np.array([sum(1 << (3 * i) for i in range(13) if m >> i & 1) for m in range(1 << 13)], dtype=np.int64)
+
+# 워커별 캐시: 5장 조합 인덱스 (colex 순서), 기준 점수
+_COLEX = None
+_REFERENCE = {}
+
+
+def plan_chunks() -> list[tuple[int, int]]:
+    # 앞 두 장 a < b, 뒤 5장은 b 보다 큰 id 에서 고른다
+    return [(a, b) for b in range(1, 47) for a in range(b)]
+
+
+def chunk_size(chunk) -> int:
+    return math.comb(51 - chunk[1], 5)
+
+
+def _colex(n):
+    """
+    range(50) 의 5장 조합을 colex 순서로 (가장 큰 원소 기준) 정렬한 인덱스 배열.
+    앞쪽 C(n, 5) 행이 정확히 range(n) 의 조합이므로 한 번 만들어 모든 청크가 잘라 쓴다.
+    """
+    global _COLEX
+    if _COLEX is None:
+        idx = np.fromiter((x for combo in combinations(range(50), 5) for x in combo), dtype=np.int8)
+        idx = idx.reshape(-1, 5)
+        order = np.lexsort(tuple(idx[:, k] for k in range(5)))
+        _COLEX = idx[order]
+    return _COLEX[:math.comb(n, 5)]
+
+
+def chunk_masks(chunk) -> np.ndarray:
+    a, b = chunk
+    # 위치 p -> 카드 id 51 - p (b 보다 큰 카드만)
+    n = 51 - b
+    idx = _colex(n)
+    top = _MASKS[::-1][:n]
+    masks = np.full(len(idx), _MASKS[a] | _MASKS[b], dtype=np.int64)
+    for k in range(5):
+        masks |= top[idx[:, k]]
+    return masks
+
+
+def class_keys(masks):
+    # (랭크 멀티셋, 5장 이상 같은 무늬의 랭크 마스크) -> int64 키. 7장 점수는 이 키로 결정된다.
+    key = np.zeros(len(masks), dtype=np.int64)
+    flush = np.zeros(len(masks), dtype=np.int64)
+    for shift in (0, 16, 32, 48):
+        s = (masks >> shift) & 0x1FFF
+        key += _SPREAD[s]
+        flush = np.where(_POPCOUNT[s] >= 5, s, flush)
+    return key | (flush << 39)
+
+
+def reference_scores(masks):
+    keys = class_keys(masks)
+    uniq, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    ref = np.empty(len(uniq), dtype=np.int64)
+    for i, (k, j) in enumerate(zip(uniq.tolist(), first.tolist())):
+        score = _REFERENCE.get(k)
+        if score is None:
+            score = _REFERENCE[k] = pack_score(evaluate_7cards_combo(int(masks[j])))
+        ref[i] = score
+    return ref[inverse]
+
+
+def load_candidate(name):
+    """
+    "vector": core.vector_eval.evaluate_masks (배열 단위)
+    "table" | "combo": core.hand_evaluator 엔진 (핸드 단위)
+    "module:function": 카드 마스크(int) 하나를 받아 정수 또는 튜플 점수를 돌려주는 함수
+        (정수 점수는 pack_score 처럼 20비트 위가 카테고리여야 한다)
+    반환: (함수, 배열 단위 여부)
+    """
+    if name == "vector":
+        return evaluate_masks, True
+    if name == "table":
+        return evaluate_7cards_table, False
+    if name == "combo":
+        return evaluate_7cards_combo, False
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"candidate must be vector, table, combo or module:function (got {name!r})")
+    return getattr(importlib.import_module(module), attr), False
+
+
+def _candidate_scores(fn, vectorized, masks):
+    if vectorized:
+        return np.asarray(fn(masks), dtype=np.int64)
+    out = np.empty(len(masks), dtype=np.int64)
+    for i, m in enumerate(masks.tolist()):
+        s = fn(m)
+        out[i] = s if isinstance(s, int) else pack_score(s)
+    return out
+
+
+class ChunkResult:
+    def __init__(self, chunk, hands, histogram, pairs, bad_category, examples):
+        self.chunk = chunk
+        self.hands = hands
+        # 기준 카테고리별 핸드 수 (인덱스 = 카테고리)
+        self.histogram = histogram
+        # 서로 다른 (기준 점수, 후보 점수) 쌍, shape (k, 2)
+        self.pairs = pairs
+        self.bad_category = bad_category
+        # 카테고리가 다른 핸드 예시 (마스크, 기준, 후보)
+        self.examples = examples
+
+
+def verify_chunk(task):
+    chunk, candidate = task
+    fn, vectorized = load_candidate(candidate)
+    masks = chunk_masks(chunk)
+    ref = reference_scores(masks)
+    cand = _candidate_scores(fn, vectorized, masks)
+
+    ref_cat = ref >> 20
+    bad = np.flatnonzero(ref_cat != (cand >> 20))
+    examples = [(int(masks[i]), int(ref[i]), int(cand[i])) for i in bad[:5].tolist()]
+    histogram = np.bincount(ref_cat, minlength=10)
+    pairs = np.unique(np.stack([ref, cand], axis=1), axis=0)
+    return ChunkResult(chunk, len(masks), histogram, pairs, len(bad), examples)
+
+
+class Report:
+    def __init__(self):
+        self.chunks = 0
+        self.hands = 0
+        self.histogram = np.zeros(10, dtype=np.int64)
+        self.mapping = {}
+        # 같은 기준 점수에 후보 점수가 둘 이상 (순서 정보 손실 또는 불일치)
+        self.conflicts = []
+        self.bad_category = 0
+        self.examples = []
+        self.order_errors = []
+        self.seconds = 0.0
+
+    def add(self, part: ChunkResult):
+        self.chunks += 1
+        self.hands += part.hands
+        self.histogram += part.histogram
+        self.bad_category += part.bad_category
+        self.examples.extend(part.examples[:5 - len(self.examples)])
+        for ref, cand in part.pairs.tolist():
+            prev = self.mapping.setdefault(ref, cand)
+            if prev != cand and len(self.conflicts) < 20:
+                self.conflicts.append((ref, prev, cand))
+
+    def check_order(self):
+        # 기준 점수 순으로 정렬했을 때 후보 점수도 순증가해야 한다
+        items = sorted(self.mapping.items())
+        self.order_errors = [(r0, c0, r1, c1) for (r0, c0), (r1, c1) in zip(items, items[1:]) if c1 <= c0][:20]
+
+    def complete(self) -> bool:
+        return self.hands == TOTAL_HANDS
+
+    def histogram_errors(self):
+        if not self.complete():
+            return []
+        return [(cat, int(self.histogram[cat]), total)
+                for cat, total in KNOWN_TOTALS.items() if self.histogram[cat] != total]
+
+    def ok(self) -> bool:
+        return not (self.bad_category or self.conflicts or self.order_errors or self.histogram_errors())
+
+    def format(self) -> str:
+        lines = [f"hands: {self.hands:,} / {TOTAL_HANDS:,} in {self.chunks} chunks ({self.seconds:.1f}s, "
+                 f"{self.hands / max(self.seconds, 1e-9):,.0f} hands/sec)",
+                 f"distinct reference scores: {len(self.mapping)}", ""]
+        lines.append(f"{'category':<18}{'hands':>14}{'expected':>14}")
+        for cat in sorted(KNOWN_TOTALS, reverse=True):
+            expected = f"{KNOWN_TOTALS[cat]:,}" if self.complete() else "-"
+            lines.append(f"{HAND_RANK_NAMES_EN[cat]:<18}{int(self.histogram[cat]):>14,}{expected:>14}")
+        lines.append("")
+        lines.append(f"category mismatches: {self.bad_category:,}")
+        for mask, ref, cand in self.examples:
+            cards = " ".join(repr(c) for c in mask_to_cards(mask))
+            lines.append(f"  {cards}: reference {hand_category(ref)} candidate {hand_category(cand)}")
+        lines.append(f"score conflicts: {len(self.conflicts)}")
+        for ref, a, b in self.conflicts[:5]:
+            lines.append(f"  reference {ref:#x} -> candidate {a:#x} and {b:#x}")
+        lines.append(f"ordering errors: {len(self.order_errors)}")
+        for r0, c0, r1, c1 in self.order_errors[:5]:
+            lines.append(f"  reference {r0:#x} < {r1:#x} but candidate {c0:#x} >= {c1:#x}")
+        for cat, got, expected in self.histogram_errors():
+            lines.append(f"histogram: {HAND_RANK_NAMES_EN[cat]} {got:,} != {expected:,}")
+        lines.append("")
+        lines.append("PASS" if self.ok() else "FAIL")
+        if not self.complete():
+            lines.append("(partial run: histogram totals not checked)")
+        return "\n".join(lines)
+
+
+def run(candidate: str = "vector", workers: int | None = None, chunks: int | None = None,
+        progress: bool = True) -> Report:
+    load_candidate(candidate)
+    plan = plan_chunks()
+    if chunks is not None:
+        plan = plan[:chunks]
+    # 큰 청크부터 넣어서 마지막에 한 워커만 오래 도는 일을 줄인다
+    plan.sort(key=chunk_size, reverse=True)
+    total = sum(map(chunk_size, plan))
+    workers = workers or os.cpu_count() or 1
+
+    report = Report()
+    t0 = time.perf_counter()
+    next_note = 0.0
+
+    def on_part(part):
+        nonlocal next_note
+        report.add(part)
+        done = report.hands / total
+        if progress and done >= next_note:
+            elapsed = time.perf_counter() - t0
+            eta = elapsed / done - elapsed if done else 0.0
+            print(f"  {done * 100:5.1f}%  {report.hands:,} hands  {elapsed:.0f}s  eta {eta:.0f}s", flush=True)
+            next_note = done + 0.05
+
+    tasks = [(chunk, candidate) for chunk in plan]
+    if workers == 1:
+        for task in tasks:
+            on_part(verify_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for fut in as_completed([pool.submit(verify_chunk, t) for t in tasks]):
+                on_part(fut.result())
+
+    report.seconds = time.perf_counter() - t0
+    report.check_order()
+    return report
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Verify a 7-card evaluator against the reference on every hand")
+    ap.add_argument("--candidate", default="vector", help="vector | table | combo | module:function")
+    ap.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    ap.add_argument("--chunks", type=int, default=None,
+                    help="only the first N of the 1,081 chunks (quick partial check)")
+    ap.add_argument("--quiet", action="store_true")
+    args = ap.parse_args(argv)
+
+    report = run(args.candidate, workers=args.workers, chunks=args.chunks, progress=not args.quiet)
+    print(report.format())
+    if not report.ok():
+        raise SystemExit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,15 @@
 import sys
 from PySide6.QtWidgets import QApplication
 
-from core.game import HoldemGame
 from core.human_action import HumanAction
 from ui.main_window import MainWindow
+from ui.qt_game import QtHoldemGame
 
 
 app = QApplication(sys.argv)
 
 human_action = HumanAction()
-game = HoldemGame(human_action)
+game = QtHoldemGame(human_action)
 
 window = MainWindow(game, human_action)
 game.gui = window
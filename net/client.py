@@ -0,0 +1,140 @@
+"""
+헤드리스 테이블 클라이언트
+
+서버에서 받은 델타를 로컬 상태에 적용하고, 차례가 오면 policy 로 행동을 골라 보낸다.
+Qt 화면으로 직접 두려면 ui.net_client 를 쓴다.
+
+    python -m net.client --name alice --port 8765
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from net.protocol import apply_delta, decode, encode
+
+
+def random_policy(rng=None):
+    # 체크/콜 위주, 가끔 레이즈와 폴드
+    rng = rng or random
+
+    def policy(state, turn):
+        to_call = turn["tc"]
+        r = rng.random()
+        if to_call > 0 and r < 0.15:
+            return "fold", 0
+        if r > 0.9:
+            return "raise", to_call + max(turn["mr"], 1)
+        return ("check", 0) if to_call == 0 else ("call", to_call)
+
+    return policy
+
+
+class ClientState:
+    """
+    서버 메시지를 로컬 상태에 반영한다. 전송과 무관하므로 헤드리스 클라이언트와 Qt 클라이언트
+    (ui.net_client) 가 같이 쓴다.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.seat = None
+        self.table_id = None
+        self.state = {}
+        self.seq = 0
+        self.winner = None
+        self.showdowns = 0
+        self.errors = []
+        # 마지막 turn / sd 메시지 (응답하거나 화면에 반영할 때 쓴다)
+        self.turn = None
+        self.showdown = None
+
+    def join_message(self) -> dict:
+        return {"t": "join", "name": self.name}
+
+    def handle(self, msg) -> str:
+        # 메시지 하나를 반영하고 종류("d", "turn", ...)를 돌려준다
+        kind = msg["t"]
+        if kind == "d":
+            if msg["q"] != self.seq + 1:
+                raise RuntimeError(f"delta out of order: {msg['q']} after {self.seq}")
+            self.seq = msg["q"]
+            apply_delta(self.state, msg["d"])
+        elif kind == "turn":
+            self.turn = msg
+        elif kind == "welcome":
+            self.seat = msg["seat"]
+            self.table_id = msg["table"]
+        elif kind == "sd":
+            self.showdowns += 1
+            self.showdown = msg
+        elif kind == "end":
+            self.winner = msg["winner"]
+        elif kind == "error":
+            self.errors.append(msg["msg"])
+        return kind
+
+
+class HeadlessClient(ClientState):
+    def __init__(self, name, host="127.0.0.1", port=8765, policy=None, verbose=False):
+        super().__init__(name)
+        self.host = host
+        self.port = port
+        self.policy = policy or random_policy()
+        self.verbose = verbose
+
+        self.decisions = 0
+        self.received_messages = 0
+        self.received_bytes = 0
+        # turn 수신 -> 다음 상태 델타 수신까지 걸린 시간 (서버 왕복 포함)
+        self.turn_latencies = []
+
+    async def run(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(encode(self.join_message()))
+        await writer.drain()
+        turn_at = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.received_messages += 1
+                self.received_bytes += len(line)
+                msg = decode(line)
+                kind = self.handle(msg)
+
+                if kind == "d":
+                    if turn_at is not None:
+                        self.turn_latencies.append(time.perf_counter() - turn_at)
+                        turn_at = None
+                elif kind == "turn":
+                    action, amount = self.policy(self.state, msg)
+                    writer.write(encode({"t": "act", "a": action, "n": int(amount)}))
+                    await writer.drain()
+                    self.decisions += 1
+                    turn_at = time.perf_counter()
+                elif kind == "sd":
+                    if self.verbose:
+                        print(f"[{self.seat}] showdown #{msg['h']}: {msg['hands']} -> {msg['win']}")
+                elif kind == "end":
+                    break
+        finally:
+            writer.close()
+        return self
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless Hold'em table client")
+    ap.add_argument("--name", default="player")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    args = ap.parse_args(argv)
+
+    client = asyncio.run(HeadlessClient(args.name, args.host, args.port, verbose=True).run())
+    print(f"winner: {client.winner}  decisions: {client.decisions}  errors: {len(client.errors)}")
+
+
+if __name__ == "__main__":
+    main()
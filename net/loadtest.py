@@ -0,0 +1,86 @@
+"""
+테이블 서버 부하 테스트
+
+서버를 같은 이벤트 루프에 띄우고 (또는 --port 로 이미 떠 있는 서버에 붙어서)
+헤드리스 클라이언트 수백 개가 동시에 접속해 몇 핸드씩 플레이한다.
+
+    python -m net.loadtest --clients 500 --remote-seats 2 --hands 10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from net.client import HeadlessClient, random_policy
+from net.server import TableServer
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run_load(clients=200, remote_seats=2, ai=("normal",), hands=10, host="127.0.0.1", port=None,
+                   seed=0, connect_batch=100):
+    server = None
+    if port is None:
+        server = await TableServer(host, 0, remote_seats, ai, hands=hands, max_tables=clients, seed=seed).start()
+        port = server.port
+
+    rng = random.Random(seed)
+    t0 = time.perf_counter()
+    tasks = []
+    for i in range(clients):
+        client = HeadlessClient(f"c{i}", host, port, policy=random_policy(random.Random(rng.random())))
+        tasks.append(asyncio.ensure_future(client.run()))
+        if (i + 1) % connect_batch == 0:
+            # 접속 폭주로 listen backlog 가 넘치지 않게 조금씩 양보
+            await asyncio.sleep(0)
+    done = await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - t0
+
+    if server is not None:
+        await server.close()
+
+    latencies = [x for c in done for x in c.turn_latencies]
+    return {
+        "clients": len(done),
+        "tables": len({c.table_id for c in done}),
+        "finished": sum(1 for c in done if c.winner is not None),
+        "decisions": sum(c.decisions for c in done),
+        "showdowns": sum(c.showdowns for c in done),
+        "errors": sum(len(c.errors) for c in done),
+        "messages": sum(c.received_messages for c in done),
+        "bytes": sum(c.received_bytes for c in done),
+        "seconds": elapsed,
+        "latency_p50_ms": _percentile(latencies, 0.50) * 1000,
+        "latency_p99_ms": _percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Drive many headless clients against a local table server")
+    ap.add_argument("--clients", type=int, default=200)
+    ap.add_argument("--remote-seats", type=int, default=2, help="client seats per table")
+    ap.add_argument("--ai", default="normal", help="server-side AI seats per table")
+    ap.add_argument("--hands", type=int, default=10, help="hands per table")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=None, help="connect to a running server instead of starting one")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    ai = [s.strip() for s in args.ai.split(",") if s.strip()]
+    r = asyncio.run(run_load(args.clients, args.remote_seats, ai, args.hands, args.host, args.port, args.seed))
+    print(f"clients: {r['clients']}  tables: {r['tables']}  finished: {r['finished']}  errors: {r['errors']}")
+    print(f"decisions: {r['decisions']}  showdowns: {r['showdowns']}  time: {r['seconds']:.2f}s  "
+          f"decisions/sec: {r['decisions'] / r['seconds']:,.0f}")
+    print(f"messages: {r['messages']}  bytes: {r['bytes']:,}  bytes/msg: {r['bytes'] / max(1, r['messages']):.0f}")
+    print(f"turn round trip p50: {r['latency_p50_ms']:.2f} ms  p99: {r['latency_p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
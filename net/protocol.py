@@ -0,0 +1,99 @@
+"""
+테이블 서버 메시지 프로토콜
+
+한 줄에 JSON 객체 하나 (newline-delimited JSON, 공백 없는 구분자). 모든 메시지는 "t" 필드로 종류를 구분한다.
+
+클라이언트 -> 서버
+    {"t":"join","name":"alice"}
+    {"t":"act","a":"call","n":0}           a: fold | check | call | raise, n: 이번 액션에 넣을 칩
+
+서버 -> 클라이언트
+    {"t":"welcome","table":3,"seat":"alice"}
+    {"t":"d","q":12,"d":{...}}             상태 델타 (q: 순번). apply_delta 로 마지막 상태에 적용
+    {"t":"turn","tc":20,"mr":20,"pot":60}  내 차례 (to call / min raise / pot)
+    {"t":"sd","h":4,"cards":{...},"hands":{...},"win":[...]}   쇼다운 결과
+    {"t":"end","winner":"AI1"}
+    {"t":"error","msg":"..."}
+
+상태 스냅샷 키: h(핸드 번호) s(상태) bd(보드) pot act(행동할 좌석) me(내 홀카드)
+p(좌석 이름 -> c 칩, b 이번 라운드 베팅, f 폴드, a 올인, o 탈락)
+"""
+from __future__ import annotations
+
+import json
+
+ACTIONS = ("fold", "check", "call", "raise")
+
+_MISSING = object()
+
+
+def encode(msg: dict) -> bytes:
+    return json.dumps(msg, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    msg = json.loads(line)
+    if not isinstance(msg, dict) or "t" not in msg:
+        raise ValueError("message must be an object with a 't' field")
+    return msg
+
+
+def diff(old: dict, new: dict) -> dict:
+    # new 와 old 의 차이. 중첩 dict 는 재귀, 사라진 키는 "-" 목록
+    d = {}
+    for k, v in new.items():
+        ov = old.get(k, _MISSING)
+        if isinstance(v, dict) and isinstance(ov, dict):
+            sub = diff(ov, v)
+            if sub:
+                d[k] = sub
+        elif ov != v:
+            d[k] = v
+    removed = [k for k in old if k not in new]
+    if removed:
+        d["-"] = removed
+    return d
+
+
+def apply_delta(state: dict, delta: dict) -> dict:
+    for k, v in delta.items():
+        if k == "-":
+            for r in v:
+                state.pop(r, None)
+        elif isinstance(v, dict) and isinstance(state.get(k), dict):
+            apply_delta(state[k], v)
+        else:
+            state[k] = json.loads(json.dumps(v)) if isinstance(v, (dict, list)) else v
+    return state
+
+
+def table_snapshot(game, viewer=None) -> dict:
+    """
+    viewer 의 시점에서 본 공개 상태 (다른 좌석 홀카드는 포함하지 않음)
+    """
+    players = {}
+    for p in game.players:
+        players[p.name] = {
+            "c": p.chips,
+            "b": p.current_bet,
+            "f": int(p.folded),
+            "a": int(p.all_in),
+            "o": int(p.busted),
+        }
+
+    to_act = None
+    betting = getattr(game, "betting", None)
+    if betting is not None and game.state.name.startswith("BETTING"):
+        to_act = game.players[betting.turn_index].name
+
+    snap = {
+        "h": game.hands_played,
+        "s": game.state.name,
+        "bd": [repr(c) for c in game.community_cards],
+        "pot": game.pot.total,
+        "act": to_act,
+        "p": players,
+    }
+    if viewer is not None:
+        snap["me"] = [repr(c) for c in viewer.hole_cards]
+    return snap
@@ -0,0 +1,310 @@
+"""
+로컬 테이블 서버
+
+asyncio TCP 위에서 net.protocol 메시지로 HoldemGame 을 노출한다.
+접속한 클라이언트는 join 으로 빈 원격 좌석에 앉고, 원격 좌석이 다 차면 서버 쪽 AI와 함께 테이블이 시작된다.
+상태는 좌석마다 마지막으로 보낸 스냅샷과의 델타만 보낸다.
+
+    python -m net.server --port 8765 --remote-seats 1 --ai hard,normal
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import re
+
+from core.async_table import AsyncTable, QueueActionSource, TableRunner
+from core.game import HoldemGame
+from core.hand_evaluator import hand_name
+from core.human_action import HumanAction
+from net.protocol import ACTIONS, decode, diff, encode, table_snapshot
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9_]{1,16}$")
+
+
+class RemoteSource(QueueActionSource):
+    """
+    원격 좌석의 행동 공급원. 차례가 오면 turn 메시지를 보내고 act 를 기다린다.
+    연결이 끊겼거나 action_timeout 안에 응답이 없으면 체크/폴드로 처리한다.
+    """
+    def __init__(self, conn, action_timeout=30.0):
+        super().__init__()
+        self.conn = conn
+        self.action_timeout = action_timeout
+        self.awaiting = False
+        # 응답을 기다리는 차례의 TableView (연결이 끊기면 이 기준으로 체크/폴드)
+        self._view = None
+
+    async def get_action(self, player, view):
+        if self.conn.closed:
+            return self._default(view)
+        self._view = view
+        self.awaiting = True
+        try:
+            self.conn.send({"t": "turn", "tc": view.to_call, "mr": view.min_raise, "pot": view.pot})
+            await self.conn.drain()
+            return await asyncio.wait_for(self._queue.get(), self.action_timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            return self._default(view)
+        finally:
+            self.awaiting = False
+            self._view = None
+
+    def disconnect(self):
+        # 기다리는 중이면 바로 풀어 준다 (공짜로 체크할 수 있으면 체크)
+        if self.awaiting:
+            self.submit(*self._default(self._view))
+
+    @staticmethod
+    def _default(view):
+        return ("check", 0) if view.to_call == 0 else ("fold", 0)
+
+
+class ClientConn:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.name = None
+        self.table = None
+        self.player = None
+        self.source = None
+        # 마지막으로 보낸 스냅샷 (델타 기준)
+        self.state = {}
+        self.seq = 0
+        self.closed = False
+        self.sent_messages = 0
+        self.sent_bytes = 0
+
+    def send(self, msg):
+        if self.closed:
+            return
+        data = encode(msg)
+        self.sent_messages += 1
+        self.sent_bytes += len(data)
+        self.writer.write(data)
+
+    async def drain(self):
+        if not self.closed:
+            await self.writer.drain()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.writer.close()
+
+
+class ServerTable:
+    """
+    원격 좌석 remote_seats 개 + 서버 AI 좌석 (ai 난이도 목록)
+    """
+    def __init__(self, table_id, remote_seats, ai, start_chips, bb, seed=None):
+        self.table_id = table_id
+        self.remote_seats = remote_seats
+        self.clients: list[ClientConn] = []
+        self.game = HoldemGame(HumanAction(), verbose=False, rng=random.Random(seed))
+        self.game.configure(ai_count=remote_seats + len(ai), difficulty=["normal"] * remote_seats + list(ai),
+                            start_chips=start_chips, bb=bb, human=False)
+        self._default_names = [p.name for p in self.game.players]
+        self.table = None
+        self._last_hand = -1
+
+    @property
+    def full(self):
+        return len(self.clients) >= self.remote_seats
+
+    def seat(self, conn: ClientConn):
+        player = self.game.players[len(self.clients)]
+        taken = {p.name for p in self.game.players}
+        name = conn.name if conn.name not in taken else f"{conn.name}_{len(self.clients)}"
+        player.name = name
+        conn.name = name
+        conn.table = self
+        conn.player = player
+        conn.source = RemoteSource(conn)
+        self.clients.append(conn)
+        return name
+
+    def start(self, runner: TableRunner, hands=None, pacing=False):
+        sources = {c.name: c.source for c in self.clients}
+        self.game.set_pacing(pacing)
+        self.table = AsyncTable(self.table_id, self.game, sources, pacing=pacing, on_update=self.broadcast)
+        task = runner.add_table(self.table, hands=hands)
+        task.add_done_callback(lambda _t: self.finish())
+        return task
+
+    def broadcast(self, _table=None):
+        g = self.game
+        for conn in self.clients:
+            if conn.closed:
+                continue
+            snap = table_snapshot(g, conn.player)
+            d = diff(conn.state, snap)
+            if d:
+                conn.seq += 1
+                conn.send({"t": "d", "q": conn.seq, "d": d})
+                conn.state = snap
+
+        if g.hand_over and g.showdown_scores and g.hands_played != self._last_hand:
+            self._last_hand = g.hands_played
+            msg = {
+                "t": "sd",
+                "h": g.hands_played,
+                "cards": {p.name: [repr(c) for c in p.hole_cards] for p in g.showdown_scores},
+                "hands": {p.name: hand_name(s) for p, s in g.showdown_scores.items()},
+                "win": [p.name for p in g.showdown_winners],
+            }
+            for conn in self.clients:
+                conn.send(msg)
+
+    def finish(self):
+        winner = self.game.winner
+        if winner is None and self.game.players:
+            winner = max(self.game.players, key=lambda p: p.chips).name
+        for conn in self.clients:
+            conn.send({"t": "end", "winner": winner})
+            conn.close()
+
+
+class TableServer:
+    def __init__(self, host="127.0.0.1", port=8765, remote_seats=1, ai=("hard", "normal"),
+                 start_chips=500, bb=20, hands=None, max_tables=1000, max_active=64, pacing=False, seed=None):
+        if not 2 <= remote_seats + len(ai) <= 5:
+            raise ValueError("a table needs 2-5 seats")
+        self.host = host
+        self.port = port
+        self.remote_seats = remote_seats
+        self.ai = list(ai)
+        self.start_chips = start_chips
+        self.bb = bb
+        self.hands = hands
+        self.pacing = pacing
+        self.seed = seed
+        self.runner = TableRunner(max_tables=max_tables, max_active=max_active)
+        self.connections = set()
+        self._open = None
+        self._next_id = 0
+        self._server = None
+        self.total_messages = 0
+        self.total_bytes = 0
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # port=0 이면 OS가 고른 포트
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for conn in list(self.connections):
+            conn.close()
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def _join(self, conn, name):
+        if conn.table is not None:
+            raise ValueError("already seated")
+        if not isinstance(name, str) or not _NAME_RE.match(name):
+            raise ValueError("name must be 1-16 letters, digits or _")
+        if self._open is None:
+            seed = None if self.seed is None else self.seed * 1000003 + self._next_id
+            self._open = ServerTable(self._next_id, self.remote_seats, self.ai, self.start_chips, self.bb, seed)
+            self._next_id += 1
+
+        table = self._open
+        conn.name = name
+        seat = table.seat(conn)
+        conn.send({"t": "welcome", "table": table.table_id, "seat": seat})
+        if table.full:
+            self._open = None
+            table.start(self.runner, hands=self.hands, pacing=self.pacing)
+
+    def _act(self, conn, msg):
+        source = conn.source
+        if source is None:
+            raise ValueError("join a table first")
+        if not source.awaiting:
+            raise ValueError("not your turn")
+        action = msg.get("a")
+        if action not in ACTIONS:
+            raise ValueError(f"unknown action: {action!r}")
+        amount = msg.get("n", 0)
+        if not isinstance(amount, int) or amount < 0:
+            raise ValueError("amount must be a non-negative integer")
+        source.submit(action, amount)
+
+    async def _handle(self, reader, writer):
+        conn = ClientConn(reader, writer)
+        self.connections.add(conn)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = decode(line)
+                    kind = msg["t"]
+                    if kind == "join":
+                        self._join(conn, msg.get("name"))
+                    elif kind == "act":
+                        self._act(conn, msg)
+                    else:
+                        raise ValueError(f"unknown message type: {kind!r}")
+                except ValueError as e:
+                    conn.send({"t": "error", "msg": str(e)})
+                await conn.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.discard(conn)
+            self.total_messages += conn.sent_messages
+            self.total_bytes += conn.sent_bytes
+            if conn.source is not None:
+                conn.source.disconnect()
+            if conn.table is not None and conn.table is self._open:
+                # 시작 전 테이블에서 나가면 좌석을 비운다
+                self._leave_open_table(conn)
+            conn.close()
+
+    def _leave_open_table(self, conn):
+        table = self._open
+        table.clients.remove(conn)
+        # 남은 클라이언트를 앞 좌석부터 다시 앉힌다
+        clients, table.clients = table.clients, []
+        for p, name in zip(table.game.players, table._default_names):
+            p.name = name
+        for c in clients:
+            table.seat(c)
+        if not table.clients:
+            self._open = None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Serve Hold'em tables over TCP (newline-delimited JSON)")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--remote-seats", type=int, default=1, help="client seats per table")
+    ap.add_argument("--ai", default="hard,normal", help="server-side AI seats per table")
+    ap.add_argument("--chips", type=int, default=500)
+    ap.add_argument("--bb", type=int, default=20)
+    ap.add_argument("--hands", type=int, default=None, help="hands per table (default: until one player is left)")
+    ap.add_argument("--pacing", action="store_true", help="apply the GUI deal/action delays")
+    args = ap.parse_args(argv)
+
+    ai = [s.strip() for s in args.ai.split(",") if s.strip()]
+    server = TableServer(args.host, args.port, args.remote_seats, ai, args.chips, args.bb,
+                         hands=args.hands, pacing=args.pacing)
+    print(f"listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
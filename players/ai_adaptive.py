@@ -0,0 +1,156 @@
+import random
+from collections import OrderedDict
+
+from core.hand_evaluator import evaluate_7cards, hand_category
+from core.preflop import preflop_equity
+
+# 플랍 이후 족보별 대략적인 강도 (1: 하이카드 ~ 9: 스트레이트 플러시)
+_MADE_STRENGTH = {1: 0.25, 2: 0.50, 3: 0.72, 4: 0.80, 5: 0.86, 6: 0.90, 7: 0.95, 8: 0.99, 9: 1.0}
+
+
+class OpponentModel:
+    """
+    상대 한 명의 빈도 모델: 레이즈에 폴드하는 비율, 공격성(레이즈 / (레이즈 + 콜)).
+    처음에는 평균적인 값(prior)에서 시작해 관측할 때마다 지수 이동 평균으로 갱신한다 (O(1), 고정 크기).
+    """
+    __slots__ = ("fold_to_raise", "aggression", "raise_seen", "actions_seen")
+
+    PRIOR_FOLD = 0.45
+    PRIOR_AGGRESSION = 0.30
+
+    def __init__(self):
+        self.fold_to_raise = self.PRIOR_FOLD
+        self.aggression = self.PRIOR_AGGRESSION
+        self.raise_seen = 0
+        self.actions_seen = 0
+
+    @staticmethod
+    def _step(value, x, n, min_rate):
+        # 초반에는 표본 평균처럼, 이후에는 최근 행동을 더 반영하는 EMA
+        rate = max(1.0 / (n + 2), min_rate)
+        return value + rate * (x - value)
+
+    def observe_raise(self, folded: bool, min_rate: float):
+        self.raise_seen += 1
+        self.fold_to_raise = self._step(self.fold_to_raise, 1.0 if folded else 0.0, self.raise_seen, min_rate)
+
+    def observe_action(self, aggressive: bool, min_rate: float):
+        self.actions_seen += 1
+        self.aggression = self._step(self.aggression, 1.0 if aggressive else 0.0, self.actions_seen, min_rate)
+
+    def __repr__(self):
+        return (f"OpponentModel(fold_to_raise={self.fold_to_raise:.2f}, aggression={self.aggression:.2f}, "
+                f"n={self.raise_seen}/{self.actions_seen})")
+
+
+class AdaptiveAI:
+    """
+    상대별 빈도 모델로 레이즈/콜 기준을 조정한다.
+    엔진이 테이블의 모든 액션을 observe() 로 알려 준다.
+    - 잘 접는 상대에게는 블러프를 늘리고 밸류 레이즈 기준을 올린다.
+    - 잘 안 접는 상대에게는 블러프를 줄이고 더 얇게 밸류 레이즈한다.
+    - 공격적인 상대의 베팅에는 더 넓게 콜한다.
+    모델은 최근에 본 max_opponents 명까지만 유지한다.
+    """
+    RAISE_STRENGTH = 0.72
+    CALL_MARGIN = 0.05
+
+    def __init__(self, rng=None, max_opponents: int = 64, min_rate: float = 0.02):
+        # rng: random.Random 인스턴스 (없으면 전역 random 모듈)
+        self.rng = rng or random
+        self.max_opponents = max_opponents
+        # 관측이 쌓인 뒤 EMA 갱신 비율 (작을수록 오래된 행동까지 반영)
+        self.min_rate = min_rate
+        self.name = None
+        self.models: OrderedDict[str, OpponentModel] = OrderedDict()
+
+    def model(self, name) -> OpponentModel:
+        m = self.models.get(name)
+        if m is None:
+            m = self.models[name] = OpponentModel()
+            if len(self.models) > self.max_opponents:
+                self.models.popitem(last=False)
+        else:
+            self.models.move_to_end(name)
+        return m
+
+    def observe(self, name, action, put, bet_before, preflop, big_blind):
+        if name == self.name:
+            return
+        m = self.model(name)
+        if bet_before > (big_blind if preflop else 0):
+            m.observe_raise(action == "fold", self.min_rate)
+        if action in ("call", "raise"):
+            m.observe_action(action == "raise", self.min_rate)
+
+    def _strength(self, player, view):
+        if view is None or not view.board:
+            opponents = max(1, len(view.live)) if view is not None else 1
+            return preflop_equity(player.hole_cards, opponents=opponents)
+
+        score = evaluate_7cards(list(player.hole_cards) + list(view.board))
+        cat = hand_category(score)
+        strength = _MADE_STRENGTH.get(cat, 0.25)
+        if cat == 2:
+            # 원페어: 탑 페어 이상이면 강하게, 보드에만 있는 페어면 하이카드 취급
+            # 정수 점수(table 엔진)와 튜플 점수(combo 엔진) 모두 첫 랭크가 페어 랭크
+            pair = (score >> 16) & 0xF if isinstance(score, int) else score[1]
+            board_ranks = [c.rank for c in view.board]
+            if pair not in (c.rank for c in player.hole_cards):
+                strength = _MADE_STRENGTH[1]
+            elif pair >= max(board_ranks):
+                strength = 0.62
+            elif pair < min(board_ranks):
+                strength = 0.42
+        return strength
+
+    def _reads(self, view):
+        # (살아 있는 상대의 평균 폴드 비율, 마지막 레이저의 공격성)
+        if view is None or not view.live:
+            return OpponentModel.PRIOR_FOLD, OpponentModel.PRIOR_AGGRESSION
+        fold = sum(self.model(n).fold_to_raise for n in view.live) / len(view.live)
+        aggression = OpponentModel.PRIOR_AGGRESSION
+        if view.aggressor is not None:
+            aggression = self.model(view.aggressor).aggression
+        return fold, aggression
+
+    def decide(self, player, to_call, big_blind, view=None):
+        self.name = player.name
+        if len(player.hole_cards) < 2:
+            return ("check", 0) if to_call == 0 else ("call", to_call)
+
+        strength = self._strength(player, view)
+        fold, aggression = self._reads(view)
+        if view is not None:
+            pot = view.pot
+            min_raise = max(big_blind, view.min_raise)
+            pot_odds = view.pot_odds()
+        else:
+            pot = to_call + big_blind
+            min_raise = big_blind
+            pot_odds = to_call / (pot + to_call) if to_call > 0 else 0.0
+
+        # 잘 접는 상대일수록 밸류 기준을 올리고 블러프를 늘린다
+        raise_at = self.RAISE_STRENGTH + 0.16 * (fold - 0.5)
+        bluff_rate = max(0.0, fold - 0.45) * 0.8
+        # 공격적인 레이저 상대로는 콜 기준을 낮춘다
+        margin = self.CALL_MARGIN - 0.15 * (aggression - OpponentModel.PRIOR_AGGRESSION)
+
+        if to_call == 0:
+            if strength >= raise_at or self.rng.random() < bluff_rate:
+                return ("raise", self._size(pot * 0.6, big_blind, player))
+            return ("check", 0)
+
+        if strength >= raise_at + 0.1:
+            raise_by = max(min_raise, int(pot * 0.6))
+            return ("raise", min(player.chips, to_call + raise_by))
+        if strength >= pot_odds + margin:
+            return ("call", to_call)
+        if to_call <= big_blind and self.rng.random() < bluff_rate * 0.5:
+            # 작은 베팅에 가끔 리레이즈 블러프
+            return ("raise", min(player.chips, to_call + min_raise))
+        return ("fold", 0)
+
+    @staticmethod
+    def _size(amount, big_blind, player):
+        return max(big_blind, min(player.chips, int(amount)))
@@ -1,7 +1,11 @@
 import random
 
 class EasyAI:
-    def decide(self, player, to_call, big_blind):
+    def __init__(self, rng=None):
+        # rng: random.Random 인스턴스 (없으면 전역 random 모듈)
+        self.rng = rng or random
+
+    def decide(self, player, to_call, big_blind, view=None):
                                  
         ranks = [card.rank for card in player.hole_cards]
 
@@ -0,0 +1,122 @@
+import random
+import time
+
+from core.canonical import LRUCache, canonical_hand
+from core.equity import exact_equity, monte_carlo_equity
+from core.preflop import load_table, preflop_equity
+from core.vector_eval import warm_up
+
+
+class ExpertAI:
+    """
+    공개 테이블 정보(TableView)를 받아 에퀴티와 팟 오즈로 결정한다.
+    결정 한 번이 time_budget 초를 넘지 않도록 몬테카를로 샘플링을 시간으로 자른다.
+    """
+    # 공정 지분(1 / 인원 수) 대비 에퀴티 배율 기준
+    RAISE_RATIO = 1.7
+    BET_RATIO = 1.5
+    PROBE_RATIO = 1.2
+    BLUFF_RATE = 0.08
+    # 팟 오즈보다 이만큼 높아야 콜
+    CALL_MARGIN = 0.03
+    # 샘플링 마감 후 결정까지 남겨 두는 여유 (초)
+    SAFETY_MARGIN = 0.003
+    # 같은 (정규화) 상황의 몬테카를로 샘플이 이만큼 쌓이면 더 뽑지 않고 캐시 값을 쓴다.
+    # 샘플 풀은 AI 인스턴스마다 따로라서 다른 테이블/시드의 핸드에 영향을 받지 않는다.
+    # 캐시 적중 시에는 rng 를 쓰지 않으므로 이후 난수 흐름이 캐시 없는 실행과 달라진다
+    # (같은 시드끼리는 같다). cache_size=0 이면 끈다.
+    CACHE_SAMPLES = 2000
+
+    def __init__(self, rng=None, time_budget=0.02, cache_size: int = 20_000):
+        # rng: random.Random 인스턴스 (없으면 전역 random 모듈)
+        self.rng = rng or random
+        self.time_budget = time_budget
+        self.cache = LRUCache(cache_size) if cache_size > 0 else None
+        self.last_equity = None
+        self.last_decision_ms = 0.0
+        self.max_decision_ms = 0.0
+
+        # 테이블 생성/로드 비용을 첫 결정이 아니라 생성 시점에 치른다
+        warm_up()
+        load_table()
+
+    def estimate_equity(self, hole_cards, view, deadline):
+        opponents = max(1, view.opponents)
+        if not view.board:
+            return preflop_equity(hole_cards, opponents=opponents)
+        if opponents == 1 and len(view.board) >= 4:
+            # 턴/리버 헤즈업은 전수 계산이 몇 ms 안에 끝난다
+            return exact_equity(hole_cards, view.board).equity
+
+        # 무늬만 다른 같은 상황의 샘플을 모아 두고 충분하면 계산 없이 돌려준다
+        key = entry = None
+        if self.cache is not None:
+            key = (canonical_hand(hole_cards, view.board), opponents)
+            entry = self.cache.get(key)
+            if entry is not None and entry[1] >= self.CACHE_SAMPLES:
+                return entry[0] / entry[1]
+        result = monte_carlo_equity(
+            hole_cards, view.board,
+            opponents=min(opponents, 9),
+            target_width=0.04,
+            min_samples=100,
+            time_budget=max(0.0, deadline - time.perf_counter() - self.SAFETY_MARGIN),
+            rng=self.rng,
+            batch=50,
+        )
+        if key is None:
+            return result.equity
+        share, n = result.equity * result.samples, result.samples
+        if entry is not None:
+            share += entry[0]
+            n += entry[1]
+        self.cache.put(key, (share, n))
+        return share / n
+
+    def decide(self, player, to_call, big_blind, view=None):
+        if len(player.hole_cards) < 2:
+            return ("check", 0) if to_call == 0 else ("call", to_call)
+
+        t0 = time.perf_counter()
+        try:
+            return self._decide(player, to_call, big_blind, view, t0 + self.time_budget)
+        finally:
+            self.last_decision_ms = (time.perf_counter() - t0) * 1000
+            self.max_decision_ms = max(self.max_decision_ms, self.last_decision_ms)
+
+    def _decide(self, player, to_call, big_blind, view, deadline):
+        if view is None:
+            # 테이블 정보가 없으면 헤즈업 프리플랍 기준으로만 판단
+            equity = preflop_equity(player.hole_cards, opponents=1)
+            opponents, pot, min_raise, pot_odds = 1, to_call + big_blind, big_blind, 0.0
+            if to_call > 0:
+                pot_odds = to_call / (pot + to_call)
+        else:
+            equity = self.estimate_equity(player.hole_cards, view, deadline)
+            opponents = max(1, view.opponents)
+            pot = view.pot
+            min_raise = max(big_blind, view.min_raise)
+            pot_odds = view.pot_odds()
+
+        self.last_equity = equity
+        ratio = equity * (opponents + 1)
+
+        if to_call == 0:
+            if ratio >= self.BET_RATIO:
+                return ("raise", self._size(pot * 0.66, big_blind, player))
+            if ratio >= self.PROBE_RATIO and self.rng.random() < 0.5:
+                return ("raise", self._size(pot * 0.5, big_blind, player))
+            if self.rng.random() < self.BLUFF_RATE:
+                return ("raise", self._size(pot * 0.5, big_blind, player))
+            return ("check", 0)
+
+        if ratio >= self.RAISE_RATIO:
+            raise_by = max(min_raise, int(pot * 0.75))
+            return ("raise", min(player.chips, to_call + raise_by))
+        if equity >= pot_odds + self.CALL_MARGIN:
+            return ("call", to_call)
+        return ("fold", 0)
+
+    @staticmethod
+    def _size(amount, big_blind, player):
+        return max(big_blind, min(player.chips, int(amount)))
@@ -1,55 +1,44 @@
                     
 import random
 
+from core.preflop import preflop_equity
+
+
 class HardAI:
-    def decide(self, player, to_call, big_blind):
+    # 헤즈업 프리플랍 올인 에퀴티 기준: JJ+ / 상위 약 10%
+    STRONG_EQUITY = 0.77
+    MEDIUM_EQUITY = 0.62
+
+    def __init__(self, rng=None):
+        # rng: random.Random 인스턴스 (없으면 전역 random 모듈)
+        self.rng = rng or random
+
+    def decide(self, player, to_call, big_blind, view=None):
                               
         if len(player.hole_cards) < 2:
             return ("check", 0) if to_call == 0 else ("call", to_call)
 
-        c1, c2 = player.hole_cards
-        r1, r2 = c1.rank, c2.rank
-        s1, s2 = c1.suit, c2.suit
-
-        high = max(r1, r2)
-        low = min(r1, r2)
-        pair = (r1 == r2)
-        suited = (s1 == s2)
-        connector = (abs(r1 - r2) == 1)
-
-        # 간단한 프리플랍 강도 점수
-        strength = 0
-        if pair:
-            strength += 4
-            if high >= 11:
-                strength += 2           
-        if high >= 13:       
-            strength += 2
-        if high >= 11 and low >= 10:            
-            strength += 1
-        if suited:
-            strength += 1
-        if connector:
-            strength += 1
+        # 프리플랍 에퀴티 테이블 조회 (첫 호출 시 로드)
+        equity = preflop_equity(player.hole_cards, opponents=1)
 
         # 블러핑 레이즈 확률
-        if to_call == 0 and random.random() < 0.15:
+        if to_call == 0 and self.rng.random() < 0.15:
             return ("raise", big_blind * 2)
 
         # 과한 콜 금액은 방어적으로 폴드
-        if to_call > big_blind * 4 and strength < 4:
+        if to_call > big_blind * 4 and equity < self.MEDIUM_EQUITY:
             return ("fold", 0)
 
         # 강한 핸드: 공격적으로 레이즈
-        if strength >= 6:
+        if equity >= self.STRONG_EQUITY:
             if to_call == 0:
                 return ("raise", big_blind * 3)
             return ("raise", to_call + big_blind * 2)          
 
                           
-        if strength >= 4:
+        if equity >= self.MEDIUM_EQUITY:
             if to_call == 0:
-                return ("raise", big_blind * 2) if random.random() < 0.35 else ("check", 0)
+                return ("raise", big_blind * 2) if self.rng.random() < 0.35 else ("check", 0)
             return ("call", to_call)
 
                
@@ -1,26 +1,31 @@
                       
 import random
 
+from core.preflop import preflop_equity
+
+
 class NormalAI:
-    def decide(self, player, to_call, big_blind):
+    # 헤즈업 프리플랍 올인 에퀴티 기준: 상위 약 15% / 상위 약 55%
+    STRONG_EQUITY = 0.60
+    PLAYABLE_EQUITY = 0.50
+
+    def __init__(self, rng=None):
+        # rng: random.Random 인스턴스 (없으면 전역 random 모듈)
+        self.rng = rng or random
+
+    def decide(self, player, to_call, big_blind, view=None):
         if len(player.hole_cards) < 2:
             return ("check", 0) if to_call == 0 else ("call", to_call)
 
-        r1 = player.hole_cards[0].rank
-        r2 = player.hole_cards[1].rank
-        high, low = max(r1, r2), min(r1, r2)
-
-        pair = (r1 == r2)
+        equity = preflop_equity(player.hole_cards, opponents=1)
         strength = 0
-        if pair:
-            strength = 3
-        elif high >= 13 and low >= 10:
+        if equity >= self.STRONG_EQUITY:
             strength = 2
-        elif high >= 11:
+        elif equity >= self.PLAYABLE_EQUITY:
             strength = 1
 
         # 가끔 블러핑 레이즈
-        if to_call == 0 and random.random() < 0.10:
+        if to_call == 0 and self.rng.random() < 0.10:
             return ("raise", big_blind * 2)
 
         if strength >= 2:
@@ -1,3 +1,6 @@
+from core.card import cards_to_mask
+
+
 class Player:
     __hash__ = object.__hash__
 
@@ -11,6 +14,11 @@ class Player:
         self.current_bet = 0
         self.busted = False
 
+    @property
+    def hole_mask(self):
+        # 홀카드 64비트 마스크
+        return cards_to_mask(self.hole_cards)
+
     def reset_for_new_hand(self):
         if self.busted:
             self.hole_cards.clear()
@@ -131,7 +131,7 @@ class HomeScreen(QWidget):
 
                        
         self.diff_combo = QComboBox()
-        self.diff_combo.addItems(["Easy", "Normal", "Hard"])
+        self.diff_combo.addItems(["Easy", "Normal", "Hard", "Expert", "Adaptive"])
         self.diff_combo.setCurrentText("Hard")
         self.diff_combo.setFixedWidth(240)
         add_row("Difficulty", self.diff_combo)
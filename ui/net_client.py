@@ -0,0 +1,170 @@
+"""
+테이블 서버에 접속하는 Qt 클라이언트
+
+net.client.ClientState 로 서버 메시지를 반영하고, 상태를 PokerWindow 에 그린다.
+내 좌석은 항상 화면의 0번 자리에 오도록 좌석 순서를 돌린다.
+버튼 입력(HumanAction)은 내 차례일 때만 act 메시지로 보낸다.
+
+    python -m net.server --port 8765 --remote-seats 1 --ai hard,normal
+    python -m ui.net_client --name alice --port 8765
+"""
+import argparse
+import sys
+
+from PySide6.QtNetwork import QAbstractSocket, QTcpSocket
+from PySide6.QtWidgets import QApplication
+
+from core.card import Card
+from core.human_action import HumanAction
+from net.client import ClientState
+from net.protocol import decode, encode
+from players.player import Player
+from ui.poker_window import PokerWindow
+
+
+class QtTableClient:
+    def __init__(self, name, host="127.0.0.1", port=8765, window=None):
+        self.client = ClientState(name)
+        self.host = host
+        self.port = port
+        self.human_action = HumanAction()
+        self.window = window or PokerWindow(self.human_action, go_home_callback=self.close)
+        self.human_action.subscribe(self._on_human_action)
+
+        self.socket = QTcpSocket()
+        self.socket.connected.connect(self._on_connected)
+        self.socket.readyRead.connect(self._on_ready_read)
+        self.socket.disconnected.connect(self._on_disconnected)
+        self.socket.errorOccurred.connect(self._on_error)
+
+        self._hand = None
+        self._showdown_cards = {}
+
+    def start(self):
+        self.window.set_actions_enabled(False)
+        self.window.set_status_text(f"Connecting to {self.host}:{self.port}…")
+        self.socket.connectToHost(self.host, self.port)
+
+    def close(self):
+        self.socket.disconnectFromHost()
+        QApplication.quit()
+
+    def _send(self, msg):
+        self.socket.write(encode(msg))
+
+    def _on_connected(self):
+        self._send(self.client.join_message())
+        self.window.set_status_text("Waiting for players…")
+
+    def _on_ready_read(self):
+        while self.socket.canReadLine():
+            line = bytes(self.socket.readLine().data())
+            kind = self.client.handle(decode(line))
+            if kind == "d":
+                self._render()
+            elif kind == "turn":
+                self._on_turn(self.client.turn)
+            elif kind == "sd":
+                self._on_showdown(self.client.showdown)
+            elif kind == "end":
+                self.window.show_game_over(self.client.winner)
+            elif kind == "error":
+                self.window.set_status_text(f"Server: {self.client.errors[-1]}")
+
+    def _on_disconnected(self):
+        self.window.set_actions_enabled(False)
+        if self.client.winner is None:
+            self.window.set_status_text("Disconnected")
+
+    def _on_error(self, error):
+        if error != QAbstractSocket.SocketError.RemoteHostClosedError:
+            self.window.set_status_text(f"Connection error: {self.socket.errorString()}")
+
+    def _players(self):
+        # 서버 상태 -> 화면용 Player 목록 (내 좌석이 0번)
+        state = self.client.state
+        seats = state.get("p", {})
+        names = list(seats)
+        if self.client.seat in names:
+            k = names.index(self.client.seat)
+            names = names[k:] + names[:k]
+        players = []
+        for name in names:
+            s = seats[name]
+            p = Player(name, chips=s["c"])
+            p.current_bet = s["b"]
+            p.folded = bool(s["f"] or s["o"])
+            p.all_in = bool(s["a"])
+            p.busted = bool(s["o"])
+            cards = state.get("me", []) if name == self.client.seat else self._showdown_cards.get(name, [])
+            p.hole_cards = [Card.parse(c) for c in cards]
+            players.append(p)
+        return players
+
+    def _render(self):
+        state = self.client.state
+        screen = self.window
+        if state.get("h") != self._hand:
+            # 새 핸드: 지난 쇼다운 카드와 좌석 액션 표시를 지운다
+            self._hand = state.get("h")
+            self._showdown_cards = {}
+            screen.seat_actions.clear()
+
+        players = self._players()
+        screen.update_cards(players, [Card.parse(c) for c in state.get("bd", [])],
+                            reveal_ai=bool(self._showdown_cards))
+        if state.get("act"):
+            screen.highlight_current_seat(state["act"])
+        me = players[0] if players else None
+        to_call = max((p.current_bet for p in players), default=0) - (me.current_bet if me else 0)
+        screen.update_bets(to_call=max(0, to_call), pot=state.get("pot", 0))
+        if self.client.turn is None:
+            screen.set_status_text(state.get("s", "").replace("_", " ").title())
+
+    def _on_turn(self, turn):
+        screen = self.window
+        screen.update_bets(to_call=turn["tc"], pot=turn["pot"])
+        # 레이즈 금액은 이번 액션에 넣을 칩 (콜 금액 + 최소 레이즈 이상)
+        chips = screen.get_player_chips()
+        low = min(chips, turn["tc"] + max(turn["mr"], 1))
+        screen.raise_spin.setMinimum(low)
+        screen.raise_spin.setMaximum(max(low, chips))
+        screen.set_actions_enabled(True)
+        screen.set_status_text("Your turn")
+
+    def _on_human_action(self):
+        turn = self.client.turn
+        if turn is None or not self.human_action.ready():
+            self.human_action.reset()
+            return
+        action, amount = self.human_action.consume()
+        if action == "call" and turn["tc"] == 0:
+            action = "check"
+        self._send({"t": "act", "a": action, "n": int(amount or 0)})
+        self.client.turn = None
+        self.window.set_actions_enabled(False)
+
+    def _on_showdown(self, sd):
+        self._showdown_cards = sd["cards"]
+        self._render()
+        text = ", ".join(f"{name}: {hand}" for name, hand in sd["hands"].items())
+        self.window.set_status_text(f"{' & '.join(sd['win'])} wins — {text}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Play at a table server in the table window")
+    ap.add_argument("--name", default="player")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    args = ap.parse_args(argv)
+
+    app = QApplication(sys.argv[:1])
+    client = QtTableClient(args.name, args.host, args.port)
+    client.window.setWindowTitle(f"Hold'em — {args.name}")
+    client.window.show()
+    client.start()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
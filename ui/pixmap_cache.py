@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap
+
+
+class PixmapCache:
+    """
+    (파일명, 너비, 높이) -> 스케일된 QPixmap LRU 캐시.
+    원본 이미지도 (파일명, 0, 0) 키로 같은 캐시에 들어가며, 없는 파일은 null pixmap 으로 기억해
+    매번 디스크를 다시 찾지 않는다.
+    """
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = int(max_entries)
+        self._items: OrderedDict[tuple[str, int, int], QPixmap] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        pix = self._items.get(key)
+        if pix is not None:
+            self._items.move_to_end(key)
+        return pix
+
+    def _store(self, key, pix: QPixmap):
+        self._items[key] = pix
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+    def source(self, filename: str) -> QPixmap:
+        key = (filename, 0, 0)
+        pix = self._lookup(key)
+        if pix is None:
+            pix = QPixmap(filename)
+            self._store(key, pix)
+        return pix
+
+    def get(self, filename: str, w: int, h: int) -> QPixmap:
+        # 스케일된 pixmap (파일이 없으면 null)
+        key = (filename, int(w), int(h))
+        pix = self._lookup(key)
+        if pix is not None:
+            self.hits += 1
+            return pix
+
+        self.misses += 1
+        src = self.source(filename)
+        pix = src if src.isNull() else src.scaled(int(w), int(h), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._store(key, pix)
+        return pix
+
+    def invalidate(self, w: int | None = None, h: int | None = None):
+        # 크기를 주면 그 크기로 스케일된 항목만, 아니면 전부 비운다
+        if w is None and h is None:
+            self._items.clear()
+            return
+        for key in [k for k in self._items if k[1] == w and k[2] == h]:
+            del self._items[key]
+
+    def __len__(self):
+        return len(self._items)
+
+
+# 프로세스 전역 캐시
+PIXMAPS = PixmapCache()
@@ -10,16 +10,19 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPixmap, QKeySequence, QColor, QShortcut
 from PySide6.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QDateTime, QRect, QSize
 
+from core.card import Card
 from ui.fx import GlowFilter
+from ui.pixmap_cache import PIXMAPS
 
 BASE_CARD_W = 82
 BASE_CARD_H = 118
 
 
 def card_to_filename(card) -> str:
-    rank_map = {11: "J", 12: "Q", 13: "K", 14: "A"}
-    rank = rank_map.get(card.rank, str(card.rank))
-    return f"{rank}{card.suit}.png"
+    # Card 또는 카드 id(0~51)
+    if isinstance(card, int):
+        card = Card.from_id(card)
+    return f"{card!r}.png"
 
 
 class SeatWidget(QWidget):
@@ -196,6 +199,9 @@ class SeatWidget(QWidget):
         self._op2.setOpacity(0.28 if dim else 1.0)
 
     def set_card_size(self, w: int, h: int):
+        if (w, h) != (self.card_w, self.card_h):
+            # 이전 크기로 스케일된 카드는 더 이상 쓰지 않는다
+            PIXMAPS.invalidate(self.card_w, self.card_h)
         self.card_w, self.card_h = w, h
         self.card1.setFixedSize(w, h)
         self.card2.setFixedSize(w, h)
@@ -203,7 +209,7 @@ class SeatWidget(QWidget):
     def set_avatar_by_name(self, name: str):
         key = name.lower()
         fname = "assets/avatars/human.png" if key == "human" else f"assets/avatars/{key}.png"
-        pix = QPixmap(fname)
+        pix = PIXMAPS.get(fname, 50, 50)
         if pix.isNull():
             self.avatar.setStyleSheet("""
                 QLabel {
@@ -219,13 +225,21 @@ class SeatWidget(QWidget):
             return
         self.avatar.setStyleSheet("background: transparent; border: none;")
         self.avatar.setText("")
-        self.avatar.setPixmap(pix.scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.avatar.setPixmap(pix)
 
     def set_info(self, name: str, chips: int, action_text: str = "—", folded: bool = False):
+        self.set_name(name)
+        self.set_chips(chips)
+        self.set_fold_state(action_text, folded)
+
+    def set_name(self, name: str):
         self.name_label.setText(name)
-        self.chips_label.setText(f"Chips: {chips}")
         self.set_avatar_by_name(name)
 
+    def set_chips(self, chips: int):
+        self.chips_label.setText(f"Chips: {chips}")
+
+    def set_fold_state(self, action_text: str, folded: bool):
         self.folded = bool(folded)
         if self.folded:
             self.action_label.setText("FOLD")
@@ -237,10 +251,17 @@ class SeatWidget(QWidget):
 
         self._apply_style()
 
+    def set_stats(self, text: str):
+        # HUD 통계는 좌석 툴팁으로 표시 (바뀔 때만 갱신)
+        if self.toolTip() != text:
+            self.setToolTip(text)
+
     def set_action_text(self, text: str):
         self.action_label.setText("FOLD" if self.folded else (text or "—"))
 
     def set_highlight(self, on: bool):
+        if self._highlighted == bool(on):
+            return
         self._highlighted = bool(on)
         self._apply_style()
 
@@ -324,14 +345,15 @@ class SeatWidget(QWidget):
             self._set_pix(self.card2, filename_b, back=False)
 
     def _set_pix(self, lbl: QLabel, filename: str | None, back: bool):
-        pix = QPixmap("assets/cards/BACK.png") if back else QPixmap(f"assets/cards/{filename}") if filename else QPixmap()
+        w, h = self.card_w, self.card_h
+        pix = PIXMAPS.get("assets/cards/BACK.png", w, h) if back else PIXMAPS.get(f"assets/cards/{filename}", w, h) if filename else QPixmap()
         if pix.isNull():
-            pix = QPixmap("assets/cards/BACK.png")
+            pix = PIXMAPS.get("assets/cards/BACK.png", w, h)
         if pix.isNull():
             lbl.setPixmap(QPixmap())
             lbl.setText("")
             return
-        lbl.setPixmap(pix.scaled(self.card_w, self.card_h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        lbl.setPixmap(pix)
 
 
 class PokerWindow(QWidget):
@@ -352,6 +374,15 @@ class PokerWindow(QWidget):
         self.name_to_seat_index: dict[str, int] = {}
         self.seat_actions: dict[str, str] = {}
 
+        # 마지막으로 그린 상태 (좌석 인덱스 -> 필드별 값, 보드 파일명 튜플)
+        self._seat_snapshots: dict[int, dict] = {}
+        self._board_snapshot: tuple[str, ...] = ()
+        # update_cards 한 번(프레임)에서 실제로 반영/생략한 위젯 갱신 수
+        self.frame_applied = 0
+        self.frame_skipped = 0
+        self.total_applied = 0
+        self.total_skipped = 0
+
         self._current_player_name = None
         self._glow = GlowFilter(color=QColor(90, 140, 255, 190), radius=18)
 
@@ -521,6 +552,8 @@ class PokerWindow(QWidget):
             s.setParent(None)
             s.deleteLater()
         self.seats.clear()
+        self._seat_snapshots.clear()
+        self._board_snapshot = ()
 
         for i in range(self.num_players):
             seat = SeatWidget(self.table_surface)
@@ -649,6 +682,8 @@ class PokerWindow(QWidget):
         for lbl in self.community_labels:
             lbl.setVisible(False)
 
+        self._seat_snapshots.clear()
+        self._board_snapshot = ()
         for i, seat in enumerate(self.seats):
             name = "Human" if i == 0 else f"AI{i}"
             seat.set_info(name, 1000, "—", folded=False)
@@ -678,39 +713,81 @@ class PokerWindow(QWidget):
             self.configure_table(len(players))
 
         self.name_to_seat_index = {p.name: i for i, p in enumerate(players)}
+        self.frame_applied = 0
+        self.frame_skipped = 0
 
         for i, p in enumerate(players):
-            seat = self.seats[i]
-            default_action = "ALL-IN" if getattr(p, "all_in", False) else "—"
-            action_text = self.seat_actions.get(p.name, default_action)
+            self._render_seat(i, p, reveal_ai)
 
-            seat.set_info(
-                name=p.name,
-                chips=p.chips,
-                action_text=action_text,
-                folded=getattr(p, "folded", False)
-            )
+        # 보드: 바뀐 카드만 다시 그림
+        faces = tuple(card_to_filename(c) for c in community_cards[:5])
+        for i, face in enumerate(faces):
+            if i < len(self._board_snapshot) and self._board_snapshot[i] == face:
+                self.frame_skipped += 1
+            else:
+                self._set_face(self.community_labels[i], face)
+                self.frame_applied += 1
+        if len(faces) != self.community_visible_count or len(faces) != len(self._board_snapshot):
+            self.community_visible_count = len(faces)
+            self._layout_community_slots(self.community_visible_count)
+        self._board_snapshot = faces
+
+        if self._current_player_name:
+            self.highlight_current_seat(self._current_player_name)
+
+        self.total_applied += self.frame_applied
+        self.total_skipped += self.frame_skipped
 
-            if getattr(p, "folded", False):
-                continue
+    def _render_seat(self, i: int, p, reveal_ai: bool):
+        seat = self.seats[i]
+        folded = bool(getattr(p, "folded", False))
+        default_action = "ALL-IN" if getattr(p, "all_in", False) else "—"
+        action_text = self.seat_actions.get(p.name, default_action)
 
+        if folded:
+            cards = None
+        else:
             a = b = None
             if len(getattr(p, "hole_cards", [])) >= 2:
                 a = card_to_filename(p.hole_cards[0])
                 b = card_to_filename(p.hole_cards[1])
+            back = i != 0 and not bool(reveal_ai)
+            cards = (None, None, True) if back else (a, b, False)
 
-            if i == 0:
-                seat.set_cards(a, b, back=False)
-            else:
-                seat.set_cards(a, b, back=not bool(reveal_ai))
+        new = {"name": p.name, "chips": p.chips, "state": (action_text, folded), "cards": cards}
+        old = self._seat_snapshots.get(i, {})
 
-        self.community_visible_count = min(5, len(community_cards))
-        for i in range(self.community_visible_count):
-            self._set_face(self.community_labels[i], card_to_filename(community_cards[i]))
-        self._layout_community_slots(self.community_visible_count)
+        if old.get("name") != p.name:
+            seat.set_name(p.name)
+            self.frame_applied += 1
+        else:
+            self.frame_skipped += 1
 
-        if self._current_player_name:
-            self.highlight_current_seat(self._current_player_name)
+        if old.get("chips") != p.chips:
+            seat.set_chips(p.chips)
+            self.frame_applied += 1
+        else:
+            self.frame_skipped += 1
+
+        if old.get("state") != new["state"]:
+            # 폴드로 바뀌면 set_fold_state 가 카드 뒷면까지 처리한다
+            seat.set_fold_state(action_text, folded)
+            self.frame_applied += 1
+        else:
+            self.frame_skipped += 1
+
+        if cards is not None and ("cards" not in old or old["cards"] != cards):
+            seat.set_cards(*cards)
+            self.frame_applied += 1
+        else:
+            self.frame_skipped += 1
+
+        self._seat_snapshots[i] = new
+
+    def update_stats(self, stats, players):
+        # stats: core.stats.StatsTracker
+        for i, p in enumerate(players[:len(self.seats)]):
+            self.seats[i].set_stats(f"{p.name}\n{stats.get(p.name).hud_text()}")
 
     def append_action_log(self, text: str):
         self._apply_action_to_seat(text)
@@ -738,6 +815,9 @@ class PokerWindow(QWidget):
         self.seat_actions[name] = show
         seat = self.seats[idx]
         seat.set_action_text(show)
+        snap = self._seat_snapshots.get(idx)
+        if snap is not None:
+            snap["state"] = (show, snap["state"][1])
         seat.say(show)
 
     def get_player_chips(self) -> int:
@@ -760,14 +840,14 @@ class PokerWindow(QWidget):
             self.go_home_callback()
 
     def _set_face(self, lbl: QLabel, filename: str):
-        pix = QPixmap(f"assets/cards/{filename}")
+        pix = PIXMAPS.get(f"assets/cards/{filename}", self.card_w, self.card_h)
         if pix.isNull():
-            pix = QPixmap("assets/cards/BACK.png")
+            pix = PIXMAPS.get("assets/cards/BACK.png", self.card_w, self.card_h)
         if pix.isNull():
             lbl.setPixmap(QPixmap())
             lbl.setText("")
             return
-        lbl.setPixmap(pix.scaled(self.card_w, self.card_h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        lbl.setPixmap(pix)
 
     def _animate_community_card(self, lbl: QLabel, final_rect: QRect):
         try:
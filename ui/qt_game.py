@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QTimer
+
+from core.game import HoldemGame
+from core.human_action import HumanAction
+from core.replay import ReplayMixin
+
+
+class QtHoldemGame(HoldemGame):
+    """
+    HoldemGame 엔진을 Qt 이벤트 루프에서 구동하는 얇은 드라이버.
+
+    폴링하지 않는다: step() 뒤에 엔진이 알려 주는 연출 지연만큼 single-shot 타이머를 걸고,
+    사람 차례에는 타이머 없이 쉬다가 HumanAction.set() 콜백으로 바로 다음 step()을 실행한다.
+    set_pacing(False) 로 지연을 모두 0으로 만들 수 있다.
+    """
+    def __init__(self, human_action, pacing: bool = True):
+        # 부모 __init__ 의 configure() 가 stop()을 부르므로 타이머를 먼저 만든다
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._tick)
+
+        self._hand_timer = QTimer()
+        self._hand_timer.setSingleShot(True)
+        self._hand_timer.timeout.connect(self._start_next_hand)
+
+        super().__init__(human_action)
+        self.set_pacing(pacing)
+        human_action.subscribe(self._on_human_action)
+
+    def stop(self):
+        super().stop()
+        self.timer.stop()
+        self._hand_timer.stop()
+
+    def start(self):
+        super().start()
+        self._hand_timer.stop()
+        self._schedule(0)
+
+    def _schedule(self, delay_ms: int):
+        self.timer.start(max(0, int(delay_ms)))
+
+    def _tick(self):
+        if not self.running:
+            return
+        self.step()
+        if not self.running or self.game_over or self._waiting_next_hand:
+            return
+        if self.waiting_on_human():
+            return
+        self._schedule(self.next_step_delay())
+
+    def _on_human_action(self):
+        if self.running and self.waiting_for_human and not self.timer.isActive():
+            self._schedule(0)
+
+    def _schedule_next_hand(self, delay_ms=3000):
+        self._waiting_next_hand = True
+        self.timer.stop()
+        self._hand_timer.start(int(delay_ms))
+
+    def _start_next_hand(self):
+        super()._start_next_hand()
+        if self.running:
+            self._schedule(0)
+
+
+class QtReplayGame(ReplayMixin, QtHoldemGame):
+    """
+    기록된 핸드를 PokerWindow 에서 재생한다. speed 는 연출 지연 배율 (2.0 = 두 배 빠르게).
+    """
+    def __init__(self, speed: float = 1.0):
+        super().__init__(HumanAction(), pacing=True)
+        self.setup_replay()
+        self.set_speed(speed)
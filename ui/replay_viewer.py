@@ -0,0 +1,50 @@
+"""
+핸드 히스토리 GUI 재생
+
+    python -m ui.replay_viewer hands.log --hand 1234 --count 20 --speed 2
+"""
+import argparse
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from core.replay import HandLog
+from ui.main_window import MainWindow
+from ui.qt_game import QtReplayGame
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Replay recorded hands in the table window")
+    ap.add_argument("log")
+    ap.add_argument("--hand", type=int, default=0, help="index of the first hand in the log")
+    ap.add_argument("--count", type=int, default=1)
+    ap.add_argument("--speed", type=float, default=1.0, help="pacing multiplier (0 = no delays)")
+    args = ap.parse_args(argv)
+
+    app = QApplication(sys.argv[:1])
+
+    log = HandLog(args.log)
+    first = log[args.hand]
+
+    game = QtReplayGame(speed=args.speed)
+    game.load(log.hands(args.hand, args.hand + args.count))
+
+    window = MainWindow(game, game.human_action)
+    game.gui = window
+
+    screen = window.poker_screen
+    screen.configure_table(len(first[0].names))
+    screen.reset_ui_for_new_game(game.players)
+    screen.set_actions_enabled(False)
+    window.stack.setCurrentWidget(screen)
+    window.show()
+
+    game.start()
+    code = app.exec()
+    game.stop()
+    log.close()
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())